@@ -129,4 +129,15 @@ async def analyze_emotion_bytes(
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"감정분석 중 오류 발생: {str(e)}"
-        ) 
\ No newline at end of file
+        )
+
+
+@router.get("/batcher/stats")
+async def batcher_stats():
+    """
+    감정분석 배처 통계
+    
+    Returns:
+        대기열 길이, 배치 크기 분포, 대기 시간 (ms)
+    """
+    return emotion_processor.batcher.get_stats()
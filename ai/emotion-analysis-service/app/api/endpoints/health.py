@@ -59,29 +59,28 @@ async def health_check() -> HealthCheckResponse:
 @router.get("/ready")
 async def readiness_check():
     """
-    서비스 준비 상태 확인 (모델 로딩 완료 여부)
+    서비스 준비 상태 확인 (모델 로딩과 워밍업을 마치기 전에는 바로 503)
+    
+    로딩과 워밍업은 시작 이벤트가 수행하며 프로브는 기다리지 않는다.
+    준비되지 않았는데 진행 중인 작업이 없으면 (시작 시 로딩 실패 등) 로딩과 워밍업을 백그라운드로 다시 시작한다.
     
     Returns:
         준비 상태 정보
     """
-    try:
-        # 모델이 로딩되어 있지 않으면 로딩 시도
-        if emotion_processor.model is None or emotion_processor.processor is None:
-            logger.info("헬스체크에서 모델 로딩 시작...")
-            await emotion_processor.load_model()
-        
-        return {
-            "status": "ready",
-            "message": "서비스가 준비되었습니다",
-            "model_loaded": True
-        }
-        
-    except Exception as e:
-        logger.error(f"준비 상태 확인 중 오류 발생: {str(e)}", exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail=f"서비스가 준비되지 않았습니다: {str(e)}"
-        )
+    if not emotion_processor.ready:
+        loaded = emotion_processor.model is not None and emotion_processor.processor is not None
+        if not emotion_processor.preparing:
+            logger.info("헬스체크에서 모델 로딩/워밍업 재시도 시작 (백그라운드)")
+            emotion_processor.prepare_in_background()
+        detail = "감정분석 모델을 워밍업하는 중입니다" if loaded else "감정분석 모델을 로딩하는 중입니다"
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=detail)
+    
+    return {
+        "status": "ready",
+        "message": "서비스가 준비되었습니다",
+        "model_loaded": True,
+        "warmup": emotion_processor.warmup_stats
+    }
 
 
 @router.get("/live")
@@ -12,10 +12,17 @@ class Settings(BaseSettings):
     # API 설정
     API_V1_STR: str = "/api/v1"
     PROJECT_NAME: str = "감정분석 서비스"
+    JSON_SERIALIZER: str = "orjson"  # 응답 JSON 직렬화 (orjson: 빠른 경로, 미설치 시 json / json: 표준 라이브러리)
     
     # 감정분석 모델 설정
     EMOTION_MODEL: str = "jungjongho/wav2vec2-xlsr-korean-speech-emotion-recognition2_data_rebalance"
     DEVICE: str = "cuda"  # 사용할 장치 ("cuda" 또는 "cpu")
+    INFERENCE_BACKEND: str = "torch"  # 추론 백엔드 (torch: fp32, torch_int8: CPU 동적 int8 양자화, synthetic: 모델 없이 합성 결과)
+    # synthetic 백엔드 지연 시간 분포: (기본 + 오디오 초당) ms에 로그정규(중앙값 1, sigma) 배수를 곱함
+    SYNTHETIC_LATENCY_MS: float = 10.0  # 요청(배치)당 기본 지연 시간 (ms)
+    SYNTHETIC_LATENCY_PER_AUDIO_SECOND_MS: float = 5.0  # 오디오 1초당 추가 지연 시간 (ms)
+    SYNTHETIC_LATENCY_SIGMA: float = 0.2  # 지연 시간 로그정규 분포 sigma (0이면 고정)
+    SYNTHETIC_SEED: int = 0  # 지연 시간/출력 난수 시드
     
     # 오디오 처리 설정
     SAMPLE_RATE: int = 16000  # 오디오 샘플링 레이트
@@ -33,9 +40,14 @@ class Settings(BaseSettings):
     }
     
     # 배치 처리 설정
-    BATCH_SIZE: int = 1  # 배치 크기
+    BATCH_SIZE: int = 8  # 동시 요청을 묶어 추론할 최대 배치 크기 (1이면 요청별 추론)
+    BATCH_MAX_WAIT_MS: int = 10  # 배치를 채우기 위해 기다리는 최대 시간 (ms)
     MAX_WORKERS: int = 2  # 병렬 작업자 수
     
+    # 시작 시 워밍업 (준비 상태 보고 전에 더미 오디오로 추론해 첫 요청의 메모리 할당/커널 선택 비용을 미리 치름)
+    WARMUP_ENABLED: bool = True
+    WARMUP_CLIP_SECONDS: List[float] = [1.0, 3.0, 10.0]  # 워밍업 오디오 길이 (초, 길이별 단독 추론 후 모두 묶어 배치 추론 한 번)
+    
     # 임시 파일 저장 경로
     TEMP_AUDIO_DIR: str = "/tmp/emotion_audio"
     
@@ -51,6 +63,9 @@ class Settings(BaseSettings):
     WEBSOCKET_BUFFER_SIZE: int = 1024 * 16  # 16KB 버퍼
     WEBSOCKET_TIMEOUT: int = 30  # 30초 타임아웃 (응답 시간 개선)
     
+    # 메트릭 라벨에 그대로 쓰는 언어 코드 (그 밖의 값과 SCENARIO_WEIGHTS에 없는 시나리오는 other로 묶음)
+    METRIC_LANGUAGES: List[str] = ["ko", "en", "ja", "zh"]
+    
     # 시나리오별 감정분석 가중치 (실제 모델 라벨에 맞춤)
     SCENARIO_WEIGHTS: Dict[str, Dict[str, float]] = {
         "dating": {
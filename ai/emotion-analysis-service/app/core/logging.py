@@ -1,13 +1,31 @@
+import atexit
 import logging
+import logging.handlers
+import queue
 import colorlog
 import os
 from datetime import datetime
 
 
+class LazyQueueHandler(logging.handlers.QueueHandler):
+    """
+    레코드를 그대로 큐에 넣는 QueueHandler
+
+    기본 QueueHandler.prepare는 호출 스레드에서 메시지를 포맷팅하므로,
+    같은 프로세스의 리스너만 사용하는 경우 포맷팅까지 리스너 스레드로 미룬다.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
 def setup_logger(name: str = "emotion_analysis_service", level: int = logging.INFO) -> logging.Logger:
     """
     컬러 로깅을 지원하는 로거 설정
     
+    로거에는 큐 핸들러만 붙이고, 실제 콘솔/파일 출력은 QueueListener 스레드에서 수행하여
+    이벤트 루프와 추론 스레드가 I/O로 막히지 않도록 한다.
+    
     Args:
         name: 로거 이름
         level: 로깅 레벨
@@ -39,7 +57,6 @@ def setup_logger(name: str = "emotion_analysis_service", level: int = logging.IN
     # 콘솔 핸들러 설정
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(color_formatter)
-    logger.addHandler(console_handler)
     
     # 파일 핸들러 설정 (logs 디렉토리)
     logs_dir = "logs"
@@ -56,7 +73,6 @@ def setup_logger(name: str = "emotion_analysis_service", level: int = logging.IN
         encoding='utf-8'
     )
     file_handler.setFormatter(file_formatter)
-    logger.addHandler(file_handler)
     
     # 에러 로그 파일 (ERROR 이상만)
     error_handler = logging.FileHandler(
@@ -65,7 +81,15 @@ def setup_logger(name: str = "emotion_analysis_service", level: int = logging.IN
     )
     error_handler.setLevel(logging.ERROR)
     error_handler.setFormatter(file_formatter)
-    logger.addHandler(error_handler)
+    
+    # 큐 핸들러 + 백그라운드 리스너 (종료 시 남은 로그 flush)
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(LazyQueueHandler(log_queue))
+    listener = logging.handlers.QueueListener(
+        log_queue, console_handler, file_handler, error_handler, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
     
     return logger
 
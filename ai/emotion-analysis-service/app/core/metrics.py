@@ -0,0 +1,95 @@
+from typing import Optional, Tuple
+
+from prometheus_client import CONTENT_TYPE_LATEST, Gauge, Histogram, generate_latest
+
+from app.core.config import settings
+
+# 모든 메트릭 공통 라벨 (값은 metric_labels로 정규화)
+LABELS = ("scenario", "language")
+OTHER_LABEL = "other"
+
+# 추론 지연 시간 (요청이 포함된 배치의 forward 시간, 초)
+INFERENCE_LATENCY = Histogram(
+    "emotion_inference_latency_seconds",
+    "감정분석 모델 추론 시간",
+    LABELS,
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+)
+
+# 배처 대기열 대기 시간 (초)
+QUEUE_WAIT = Histogram(
+    "emotion_queue_wait_seconds",
+    "배치 대기열 대기 시간",
+    LABELS,
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1)
+)
+
+# 요청별 처리한 오디오 길이 (초, 합계는 누적 처리 시간)
+AUDIO_SECONDS = Histogram(
+    "emotion_audio_processed_seconds",
+    "요청별 오디오 길이",
+    LABELS,
+    buckets=(0.5, 1, 2, 5, 10, 15, 30)
+)
+
+# 실시간 배율 (추론 시간 / 배치 오디오 길이)
+REAL_TIME_FACTOR = Histogram(
+    "emotion_real_time_factor",
+    "추론 시간 대비 오디오 길이 비율",
+    LABELS,
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1)
+)
+
+# 감정분석 요청 처리 시간 (전처리 + 대기 + 추론, 초)
+REQUEST_LATENCY = Histogram(
+    "emotion_request_latency_seconds",
+    "감정분석 요청 전체 처리 시간",
+    LABELS,
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+)
+
+# 처리 중인 감정분석 요청 수
+ACTIVE_REQUESTS = Gauge(
+    "emotion_active_requests",
+    "처리 중인 감정분석 요청 수",
+    LABELS
+)
+
+# 배처에 제출되어 결과를 기다리는 추론 수
+INFERENCE_IN_FLIGHT = Gauge(
+    "emotion_inference_in_flight",
+    "대기열 또는 모델에서 실행 중인 추론 요청 수",
+    LABELS
+)
+
+
+# 시작 시 워밍업 추론에 걸린 시간 (초)
+WARMUP_SECONDS = Gauge(
+    "emotion_warmup_seconds",
+    "시작 시 워밍업 추론에 걸린 시간"
+)
+
+# 프로세스 시작 후 첫 감정분석 추론 요청 처리 시간 (초, 배처 대기 포함, 워밍업 여부별)
+FIRST_REQUEST_LATENCY = Gauge(
+    "emotion_first_request_latency_seconds",
+    "프로세스 시작 후 첫 감정분석 추론 요청 처리 시간",
+    ("warmed_up",)
+)
+
+
+def metric_labels(scenario: str, language: Optional[str]) -> Tuple[str, str]:
+    """
+    메트릭 라벨 값 (시나리오, 언어)
+
+    라벨 값은 클라이언트 입력이므로 알려진 값만 그대로 쓰고 나머지는 other로 묶어
+    입력에 따라 시계열 수가 늘어나지 않게 한다.
+    """
+    return (
+        scenario if scenario in settings.SCENARIO_WEIGHTS else OTHER_LABEL,
+        language if language in settings.METRIC_LANGUAGES else OTHER_LABEL
+    )
+
+
+def render_metrics() -> bytes:
+    """Prometheus 텍스트 형식으로 현재 메트릭 출력"""
+    return generate_latest()
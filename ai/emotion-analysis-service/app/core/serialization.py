@@ -0,0 +1,49 @@
+import json
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+from app.core.config import settings
+from app.core.logging import logger
+
+try:
+    import orjson
+except ImportError:  # 미설치 시 표준 라이브러리 json으로 동작
+    orjson = None
+
+# orjson 옵션: numpy 배열/스칼라와 문자열이 아닌 딕셔너리 키 허용
+ORJSON_OPTIONS = (orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS) if orjson is not None else 0
+
+if settings.JSON_SERIALIZER == "orjson" and orjson is None:
+    logger.warning("orjson 미설치 - 표준 라이브러리 json으로 직렬화합니다")
+
+
+def use_orjson() -> bool:
+    """orjson 빠른 경로 사용 여부"""
+    return settings.JSON_SERIALIZER == "orjson" and orjson is not None
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """
+    JSON 직렬화 (UTF-8 bytes, 한글은 이스케이프하지 않음)
+
+    orjson은 bytes로 바로 직렬화하며, 표준 라이브러리와 달리 NaN/Infinity를 null로 출력한다.
+
+    Args:
+        obj: 직렬화할 객체
+
+    Returns:
+        JSON bytes
+    """
+    if use_orjson():
+        return orjson.dumps(obj, option=ORJSON_OPTIONS)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """REST 기본 응답 클래스 (orjson 사용 가능하면 orjson, 아니면 Starlette 기본 직렬화)"""
+
+    def render(self, content: Any) -> bytes:
+        if use_orjson():
+            return orjson.dumps(content, option=ORJSON_OPTIONS)
+        return super().render(content)
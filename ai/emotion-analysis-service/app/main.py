@@ -1,6 +1,6 @@
 import time
 import os
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
 import asyncio
@@ -8,6 +8,8 @@ import asyncio
 from app.api.api import api_router
 from app.core.config import settings
 from app.core.logging import logger
+from app.core.metrics import CONTENT_TYPE_LATEST, render_metrics
+from app.core.serialization import FastJSONResponse
 from app import __version__
 from app.services.emotion_service import emotion_processor
 
@@ -19,6 +21,7 @@ app = FastAPI(
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
     docs_url=f"{settings.API_V1_STR}/docs",
     redoc_url=f"{settings.API_V1_STR}/redoc",
+    default_response_class=FastJSONResponse,
 )
 
 # CORS 설정
@@ -55,11 +58,16 @@ async def startup_event():
     except Exception as e:
         logger.error(f"감정분석 모델 사전 로딩 실패: {str(e)}", exc_info=True)
         logger.warning("감정분석 모델 로딩 실패했지만 서버는 계속 실행됩니다. 첫 요청 시 다시 로드를 시도합니다.")
+    
+    # 더미 오디오로 모델 워밍업 (WARMUP_ENABLED, 끝나야 /health/ready가 준비 완료를 반환)
+    if emotion_processor.model is not None:
+        await emotion_processor.warmup()
 
 # 애플리케이션 종료 이벤트
 @app.on_event("shutdown")
 async def shutdown_event():
     logger.info("감정분석 서비스 종료")
+    await emotion_processor.shutdown()
 
 # 루트 엔드포인트
 @app.get("/")
@@ -70,6 +78,11 @@ def read_root():
         "model": settings.EMOTION_MODEL
     }
 
+# Prometheus 메트릭 엔드포인트
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    return Response(render_metrics(), media_type=CONTENT_TYPE_LATEST)
+
 
 if __name__ == "__main__":
     # 개발 서버 실행
@@ -0,0 +1,71 @@
+import io
+import os
+import subprocess
+from typing import BinaryIO, Union
+
+import librosa
+import numpy as np
+import soundfile as sf
+
+from app.core.config import settings
+from app.core.logging import logger
+
+# libsndfile로 직접 디코딩하는 형식 (나머지는 ffmpeg 파이프)
+SOUNDFILE_FORMATS = ("wav", "flac", "ogg")
+
+
+def decode_audio(source: Union[bytes, BinaryIO], filename: str, sample_rate: int = settings.SAMPLE_RATE) -> np.ndarray:
+    """
+    업로드된 오디오를 메모리에서 바로 디코딩 (임시 파일 없음)
+
+    WAV/FLAC/OGG는 libsndfile로 읽고 필요하면 librosa와 같은 방식(soxr)으로 리샘플링하며,
+    MP3 등 그 밖의 형식만 ffmpeg를 파이프(stdin/stdout)로 실행해 디코딩한다.
+    결과는 librosa.load(sr=SAMPLE_RATE, mono=True)와 같은 float32 모노 배열이다.
+
+    Args:
+        source: 오디오 바이트 또는 파일 객체 (UploadFile.file 등)
+        filename: 원본 파일명 (확장자로 형식 판단)
+        sample_rate: 목표 샘플링 레이트
+
+    Returns:
+        -1.0 ~ 1.0 범위의 float32 모노 오디오 배열
+    """
+    file_ext = os.path.splitext(filename or "")[1].lstrip(".").lower()
+    data = source if isinstance(source, bytes) else None
+
+    if file_ext in SOUNDFILE_FORMATS:
+        stream = io.BytesIO(data) if data is not None else source
+        try:
+            audio, source_rate = sf.read(stream, dtype="float32", always_2d=True)
+            audio = audio[:, 0] if audio.shape[1] == 1 else audio.mean(axis=1, dtype=np.float32)
+            if source_rate != sample_rate:
+                audio = librosa.resample(audio, orig_sr=source_rate, target_sr=sample_rate)
+            return np.ascontiguousarray(audio)
+        except (sf.LibsndfileError, RuntimeError) as e:
+            logger.warning(f"libsndfile 디코딩 실패 - ffmpeg로 재시도합니다: {filename} - {str(e)}")
+
+    if data is None:
+        source.seek(0)
+        data = source.read()
+    return _decode_with_ffmpeg(data, sample_rate)
+
+
+def _decode_with_ffmpeg(data: bytes, sample_rate: int) -> np.ndarray:
+    """ffmpeg 파이프로 16-bit PCM 모노 디코딩 및 리샘플링 (MP3 등)"""
+    cmd = [
+        "ffmpeg",
+        "-nostdin",
+        "-threads", "0",
+        "-i", "pipe:0",
+        "-f", "s16le",
+        "-ac", "1",
+        "-acodec", "pcm_s16le",
+        "-ar", str(sample_rate),
+        "pipe:1",
+    ]
+    try:
+        out = subprocess.run(cmd, input=data, capture_output=True, check=True).stdout
+    except subprocess.CalledProcessError as e:
+        raise RuntimeError(f"오디오 디코딩 실패: {e.stderr.decode(errors='ignore')}") from e
+
+    return np.frombuffer(out, np.int16).astype(np.float32) / 32768.0
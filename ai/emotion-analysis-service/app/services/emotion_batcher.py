@@ -0,0 +1,210 @@
+import asyncio
+import time
+from collections import Counter, deque
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+from app.core.config import settings
+from app.core.logging import logger
+
+
+@dataclass
+class EmotionBatchRequest:
+    """배치 대기열에 들어가는 감정분석 요청"""
+    speech: np.ndarray
+    future: asyncio.Future
+    enqueued_at: float = field(default_factory=time.perf_counter)
+    # 호출자가 넘긴 경우 queue_wait, inference 시간(초)을 기록
+    timings: Optional[Dict[str, float]] = None
+
+
+class EmotionBatcher:
+    """
+    감정분석 요청 마이크로 배처
+
+    동시에 들어온 요청의 오디오를 모아 최대 배치 크기(BATCH_SIZE)가 차거나
+    가장 오래된 요청의 대기 시간이 BATCH_MAX_WAIT_MS를 넘으면 한 번의 forward로 실행한다.
+    패딩된 배치는 attention mask와 함께 추론되며, 요청마다 자신의 확률 행을 돌려받는다.
+
+    배치는 전달받은 스레드 풀에서 실행되어 이벤트 루프를 막지 않으며,
+    동시에 실행되는 배치 수는 max_concurrent_batches를 넘지 않는다.
+    """
+
+    def __init__(
+        self,
+        predict_batch: Callable[[List[np.ndarray]], Any],
+        max_batch_size: int = settings.BATCH_SIZE,
+        max_wait_ms: int = settings.BATCH_MAX_WAIT_MS,
+        executor: Optional[Executor] = None,
+        max_concurrent_batches: int = settings.MAX_WORKERS,
+    ) -> None:
+        """
+        배처 초기화
+
+        Args:
+            predict_batch: 오디오 배열 목록을 받아 (배치, 감정 수) 확률 텐서를 반환하는 함수
+            max_batch_size: 최대 배치 크기
+            max_wait_ms: 배치를 채우기 위해 기다리는 최대 시간 (ms)
+            executor: 배치를 실행할 스레드 풀 (None이면 기본 executor)
+            max_concurrent_batches: 동시에 실행할 수 있는 배치 수
+        """
+        self.predict_batch = predict_batch
+        self.max_batch_size = max(max_batch_size, 1)
+        self.max_wait = max_wait_ms / 1000
+        self.executor = executor
+        self.max_concurrent_batches = max(max_concurrent_batches, 1)
+
+        self._pending: List[EmotionBatchRequest] = []
+        self._wakeup: Optional[asyncio.Event] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._dispatcher: Optional[asyncio.Task] = None
+
+        # 통계
+        self.batch_size_histogram: Counter = Counter()
+        self.wait_times = deque(maxlen=1000)  # 최근 요청 대기 시간 (초)
+        self.total_requests = 0
+        self.total_batches = 0
+
+    @property
+    def queue_depth(self) -> int:
+        """대기 중인 요청 수"""
+        return len(self._pending)
+
+    async def submit(self, speech: np.ndarray, timings: Optional[Dict[str, float]] = None) -> Any:
+        """
+        감정분석 요청 제출 후 결과 대기
+
+        Args:
+            speech: 전처리된 float32 오디오 배열 (16kHz, 모노)
+            timings: 대기/추론 시간을 기록할 딕셔너리 (queue_wait, inference, batch_audio_seconds)
+
+        Returns:
+            해당 요청의 확률 텐서 (1, 감정 수)
+        """
+        self._ensure_started()
+        request = EmotionBatchRequest(speech=speech, future=asyncio.get_running_loop().create_future(), timings=timings)
+        self.total_requests += 1
+        self._pending.append(request)
+        self._wakeup.set()
+        return await request.future
+
+    def _ensure_started(self) -> None:
+        if self._dispatcher is None or self._dispatcher.done():
+            self._wakeup = asyncio.Event()
+            self._slots = asyncio.Semaphore(self.max_concurrent_batches)
+            self._dispatcher = asyncio.create_task(self._dispatch_loop())
+            logger.info(
+                f"감정분석 배처 시작 - 최대 배치: {self.max_batch_size}, 최대 대기: {self.max_wait * 1000:.0f}ms, "
+                f"동시 배치: {self.max_concurrent_batches}"
+            )
+
+    async def shutdown(self) -> None:
+        """디스패처 종료 및 대기 중인 요청 취소"""
+        if self._dispatcher is not None:
+            self._dispatcher.cancel()
+            try:
+                await self._dispatcher
+            except asyncio.CancelledError:
+                pass
+            self._dispatcher = None
+        for request in self._pending:
+            if not request.future.done():
+                request.future.cancel()
+        self._pending.clear()
+
+    async def _dispatch_loop(self) -> None:
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            if not self._pending:
+                continue
+
+            # 실행 슬롯이 빌 때까지 기다리는 동안 도착한 요청은 다음 배치로 모인다
+            await self._slots.acquire()
+            try:
+                batch = await self._collect_batch()
+            except BaseException:
+                self._slots.release()
+                raise
+            if not batch:
+                self._slots.release()
+                continue
+
+            asyncio.create_task(self._run_batch(batch))
+            if self._pending:
+                self._wakeup.set()
+
+    async def _collect_batch(self) -> List[EmotionBatchRequest]:
+        """가장 오래된 요청부터 배치 크기 또는 대기 시간 한도까지 모음"""
+        while True:
+            # 연결이 끊겨 취소된 요청 제거
+            self._pending = [r for r in self._pending if not r.future.done()]
+            if not self._pending:
+                return []
+            remaining = self._pending[0].enqueued_at + self.max_wait - time.perf_counter()
+            if len(self._pending) >= self.max_batch_size or remaining <= 0:
+                break
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=remaining)
+                self._wakeup.clear()
+            except asyncio.TimeoutError:
+                pass
+
+        batch = self._pending[:self.max_batch_size]
+        del self._pending[:self.max_batch_size]
+        return batch
+
+    async def _run_batch(self, batch: List[EmotionBatchRequest]) -> None:
+        now = time.perf_counter()
+        for request in batch:
+            self.wait_times.append(now - request.enqueued_at)
+        self.batch_size_histogram[len(batch)] += 1
+        self.total_batches += 1
+
+        try:
+            loop = asyncio.get_running_loop()
+            probabilities = await loop.run_in_executor(self.executor, self.predict_batch, [r.speech for r in batch])
+            elapsed = time.perf_counter() - now
+            batch_audio_seconds = sum(len(r.speech) for r in batch) / settings.SAMPLE_RATE
+            for request in batch:
+                if request.timings is not None:
+                    request.timings.update(
+                        queue_wait=now - request.enqueued_at,
+                        inference=elapsed,
+                        batch_audio_seconds=batch_audio_seconds
+                    )
+            for i, request in enumerate(batch):
+                if not request.future.done():
+                    request.future.set_result(probabilities[i:i + 1])
+        except Exception as e:
+            logger.error(f"배치 감정분석 실패 (배치 크기: {len(batch)}): {str(e)}", exc_info=True)
+            for request in batch:
+                if not request.future.done():
+                    request.future.set_exception(e)
+        finally:
+            self._slots.release()
+            self._wakeup.set()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """대기열 길이, 배치 크기 분포, 대기 시간 통계"""
+        waits = sorted(self.wait_times)
+
+        def percentile(p: float) -> float:
+            return round(waits[min(int(len(waits) * p), len(waits) - 1)] * 1000, 2) if waits else 0
+
+        return {
+            "queue_depth": self.queue_depth,
+            "max_batch_size": self.max_batch_size,
+            "max_concurrent_batches": self.max_concurrent_batches,
+            "total_requests": self.total_requests,
+            "total_batches": self.total_batches,
+            "batch_size_histogram": dict(sorted(self.batch_size_histogram.items())),
+            "wait_ms": {
+                "p50": percentile(0.5),
+                "p95": percentile(0.95),
+                "max": round(waits[-1] * 1000, 2) if waits else 0,
+            },
+        }
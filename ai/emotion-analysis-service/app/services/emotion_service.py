@@ -1,9 +1,8 @@
-import os
 import time
-import tempfile
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Dict, Any, List, BinaryIO
 import torch
-import librosa
 import numpy as np
 from transformers import AutoProcessor, AutoModelForAudioClassification
 from fastapi import UploadFile
@@ -11,6 +10,21 @@ import random
 
 from app.core.config import settings
 from app.core.logging import logger
+from app.core.metrics import (
+    ACTIVE_REQUESTS,
+    AUDIO_SECONDS,
+    FIRST_REQUEST_LATENCY,
+    INFERENCE_IN_FLIGHT,
+    INFERENCE_LATENCY,
+    QUEUE_WAIT,
+    REAL_TIME_FACTOR,
+    REQUEST_LATENCY,
+    WARMUP_SECONDS,
+    metric_labels,
+)
+from app.services.emotion_batcher import EmotionBatcher
+from app.services.audio_decoder import decode_audio
+from app.services.synthetic_backend import load_synthetic
 from app.core.models import (
     EmotionAnalysisResponse, 
     EmotionPrediction, 
@@ -19,20 +33,64 @@ from app.core.models import (
 )
 
 
+# 지원하는 추론 백엔드
+# - torch: HF 모델 그대로 (fp32)
+# - torch_int8: Linear 레이어 동적 int8 양자화 (CPU 전용)
+# - synthetic: 모델 없이 설정된 지연 시간 분포로 합성 logits 반환 (성능 테스트용)
+INFERENCE_BACKENDS = ("torch", "torch_int8", "synthetic")
+
+# 모델 출력(한국어) 라벨 -> 영어 라벨 매핑 (실제 모델 출력에 맞춤)
+LABEL_MAPPING = {
+    "기쁨": "happy",
+    "당황": "confused",
+    "분노": "angry",
+    "불안": "fearful",
+    "슬픔": "sad",
+    "중립": "neutral"
+}
+
+
 class EmotionProcessor:
     """Wav2Vec2 모델을 사용한 감정분석 처리 클래스"""
     
-    def __init__(self) -> None:
-        """감정분석 프로세서 초기화"""
+    def __init__(self, backend: Optional[str] = None) -> None:
+        """
+        감정분석 프로세서 초기화
+        
+        Args:
+            backend: 추론 백엔드 (None이면 settings.INFERENCE_BACKEND)
+        """
+        self.backend = backend or settings.INFERENCE_BACKEND
+        if self.backend not in INFERENCE_BACKENDS:
+            raise ValueError(f"알 수 없는 추론 백엔드: {self.backend}. 지원되는 백엔드: {', '.join(INFERENCE_BACKENDS)}")
+        
         self.model = None
         self.processor = None
         self.device = settings.DEVICE if torch.cuda.is_available() else "cpu"
+        if self.backend == "torch_int8" and self.device != "cpu":
+            logger.warning("torch_int8 백엔드는 CPU에서만 동작합니다. CPU로 실행합니다.")
+            self.device = "cpu"
+        if self.backend == "synthetic":
+            self.device = "cpu"
         self.model_name = settings.EMOTION_MODEL
+        self._loading: Optional[asyncio.Future] = None
+        self._warming: Optional[asyncio.Future] = None
+        self._preparing: Optional[asyncio.Task] = None
+        self.warmed_up = False  # 워밍업을 마쳤는지 여부 (실패해도 시도했으면 True)
+        self.warmup_stats: Optional[Dict[str, Any]] = None
+        self.first_request_latency: Optional[float] = None
+        # 모델 로드, 오디오 디코딩, 추론은 이벤트 루프 밖의 전용 스레드 풀에서 실행
+        self.executor = ThreadPoolExecutor(
+            max_workers=settings.MAX_WORKERS,
+            thread_name_prefix="emotion-inference"
+        )
+        # 동시 요청을 패딩된 배치로 묶어 한 번에 추론
+        self.batcher = EmotionBatcher(self._predict_batch, executor=self.executor)
         
         # 재현성을 위한 seed 설정
         self._set_seeds()
         
-        logger.info(f"감정분석 프로세서 초기화 - 장치: {self.device}, 모델: {self.model_name}")
+        logger.info(f"감정분석 프로세서 초기화 - 장치: {self.device}, 모델: {self.model_name}, 백엔드: {self.backend}")
         
     def _set_seeds(self, seed: int = 42) -> None:
         """재현성을 위한 시드 설정"""
@@ -55,34 +113,20 @@ class EmotionProcessor:
             logger.info(f"감정분석 모델 로딩 시작: {self.model_name}")
             logger.info(f"디바이스: {self.device}")
             
-            # Processor 로드
-            self.processor = AutoProcessor.from_pretrained(
-                self.model_name,
-                cache_dir=".cache/transformers"
-            )
-            
-            # Model 로드
-            self.model = AutoModelForAudioClassification.from_pretrained(
-                self.model_name,
-                cache_dir=".cache/transformers"
-            )
-            
-            # GPU로 이동
-            self.model.to(self.device)
-            self.model.eval()
+            # 가중치 다운로드/로드는 수 초 이상 걸리므로 이벤트 루프 밖에서 수행
+            # 동시에 들어온 요청(시작 이벤트, /ready)은 진행 중인 로드 작업을 공유
+            if self._loading is None or self._loading.done():
+                loop = asyncio.get_running_loop()
+                self._loading = loop.run_in_executor(self.executor, self._load_pretrained)
+            processor, model = await asyncio.shield(self._loading)
+            self.processor = processor
+            self.model = model
             
             # 모델 라벨 매핑 디버그 출력
             logger.info(f"모델 라벨 매핑: {self.model.config.id2label}")
             
-            # 한국어-영어 라벨 매핑 생성 (실제 모델 출력에 맞춤)
-            self.label_mapping = {
-                "기쁨": "happy",
-                "당황": "confused",
-                "분노": "angry", 
-                "불안": "fearful",
-                "슬픔": "sad",
-                "중립": "neutral"
-            }
+            # 한국어-영어 라벨 매핑 생성
+            self.label_mapping = dict(LABEL_MAPPING)
             
             logger.info(f"한국어-영어 라벨 매핑: {self.label_mapping}")
             logger.info("감정분석 모델 로딩 완료")
@@ -91,22 +135,148 @@ class EmotionProcessor:
             logger.error(f"모델 로딩 중 오류 발생: {str(e)}", exc_info=True)
             raise RuntimeError(f"모델 로딩 실패: {str(e)}")
     
-    def _preprocess_audio(self, audio_file_path: str) -> np.ndarray:
+    def _load_pretrained(self) -> tuple:
+        """
+        Processor와 모델 로드 (작업 스레드에서 실행)
+        
+        Returns:
+            (processor, model)
+        """
+        if self.backend == "synthetic":
+            logger.info(
+                f"합성 추론 백엔드 사용 - 지연 시간: {settings.SYNTHETIC_LATENCY_MS}ms + "
+                f"{settings.SYNTHETIC_LATENCY_PER_AUDIO_SECOND_MS}ms/오디오 초 (sigma {settings.SYNTHETIC_LATENCY_SIGMA})"
+            )
+            return load_synthetic(dict(enumerate(LABEL_MAPPING)))
+        
+        # Processor 로드
+        processor = AutoProcessor.from_pretrained(
+            self.model_name,
+            cache_dir=".cache/transformers"
+        )
+        
+        # Model 로드
+        model = AutoModelForAudioClassification.from_pretrained(
+            self.model_name,
+            cache_dir=".cache/transformers"
+        )
+        
+        # GPU로 이동
+        model.to(self.device)
+        model.eval()
+        
+        if self.backend == "torch_int8":
+            # Linear 가중치를 int8로 양자화 (활성값은 실행 시 동적으로 양자화)
+            # wav2vec2 연산량 대부분이 Transformer의 Linear 레이어이므로 CPU 지연 시간과 메모리가 줄어든다
+            model = torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+            logger.info("Linear 레이어 동적 int8 양자화 적용 완료")
+        
+        return processor, model
+    
+    @property
+    def ready(self) -> bool:
+        """요청을 받을 준비가 되었는지 여부 (모델 로드 후 워밍업까지 마침)"""
+        loaded = self.model is not None and self.processor is not None
+        return loaded and (self.warmed_up or not settings.WARMUP_ENABLED)
+    
+    @property
+    def preparing(self) -> bool:
+        """모델 로딩 또는 워밍업이 진행 중인지 여부"""
+        return any(task is not None and not task.done() for task in (self._loading, self._warming, self._preparing))
+    
+    def prepare_in_background(self) -> None:
+        """
+        모델 로딩과 워밍업을 백그라운드로 시작 (진행 중인 작업이 있으면 무시)
+        
+        시작 시 로딩에 실패했거나 요청 경로에서 워밍업 없이 로드된 경우 준비 상태 확인이 호출한다.
+        """
+        if self.preparing:
+            return
+        self._preparing = asyncio.create_task(self._prepare())
+    
+    async def _prepare(self) -> None:
+        try:
+            await self.load_model()
+            await self.warmup()
+        except Exception as e:
+            logger.error(f"모델 준비 재시도 실패: {str(e)}", exc_info=True)
+    
+    async def warmup(self) -> None:
+        """
+        더미 오디오로 모델 워밍업 (WARMUP_CLIP_SECONDS 길이별 단독 추론 후 모두 묶어 패딩 배치로 한 번)
+        
+        첫 요청이 치르는 특징 추출기 첫 호출, 메모리 할당, 커널 선택 비용을 시작 시점으로 옮긴다.
+        동시에 들어온 호출(시작 이벤트, /ready)은 진행 중인 워밍업을 공유하며, 실패해도 서비스는 계속 실행한다.
+        """
+        if self.warmed_up or not settings.WARMUP_ENABLED:
+            return
+        await self.load_model()
+        
+        if self._warming is None or self._warming.done():
+            logger.info(f"감정분석 모델 워밍업 시작 - 오디오 길이: {settings.WARMUP_CLIP_SECONDS}초")
+            self._warming = asyncio.get_running_loop().run_in_executor(self.executor, self._run_warmup)
+        try:
+            self.warmup_stats = await asyncio.shield(self._warming)
+            WARMUP_SECONDS.set(self.warmup_stats["seconds"])
+        except Exception as e:
+            logger.warning(f"감정분석 모델 워밍업 실패 (서비스는 계속 실행): {str(e)}", exc_info=True)
+            self.warmup_stats = {"error": str(e), "seconds": None}
+        self.warmed_up = True
+    
+    def _run_warmup(self) -> Dict[str, Any]:
+        """
+        워밍업 추론 실행 (작업 스레드에서 실행, 메트릭은 기록하지 않음)
+        
+        Returns:
+            전체 시간과 추론별 시간
+        """
+        max_seconds = float(settings.MAX_AUDIO_LENGTH)
+        clips = []
+        for seconds in settings.WARMUP_CLIP_SECONDS:
+            samples = int(min(seconds, max_seconds) * settings.SAMPLE_RATE)
+            t = np.arange(samples) / settings.SAMPLE_RATE
+            # 음성 대역 배음이 0.5초 간격으로 켜지고 꺼지는 신호 + 약한 잡음 (전처리와 같이 최대 진폭 1로 정규화)
+            voiced = sum(np.sin(2 * np.pi * 180 * k * t) / k for k in range(1, 6)) * (np.sin(2 * np.pi * t) > 0)
+            clip = (voiced + 0.1 * np.random.default_rng(0).standard_normal(samples)).astype(np.float32)
+            clips.append(clip / np.max(np.abs(clip)))
+        
+        runs = [[clip] for clip in clips]
+        if settings.BATCH_SIZE > 1 and len(clips) > 1:
+            runs.append(clips[:settings.BATCH_SIZE])
+        
+        details = []
+        start_time = time.perf_counter()
+        for speeches in runs:
+            started = time.perf_counter()
+            self._predict_batch(speeches)
+            details.append({
+                "batch_size": len(speeches),
+                "audio_seconds": round(max(len(s) for s in speeches) / settings.SAMPLE_RATE, 2),
+                "seconds": round(time.perf_counter() - started, 3)
+            })
+        total = time.perf_counter() - start_time
+        logger.info(f"감정분석 모델 워밍업 완료 - {len(details)}회 추론, 소요 시간: {total:.2f}초")
+        return {"seconds": round(total, 3), "details": details}
+    
+    async def shutdown(self) -> None:
+        """배처 종료 및 전용 스레드 풀 정리"""
+        await self.batcher.shutdown()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+    
+    def _preprocess_audio(self, audio_file: BinaryIO, filename: str) -> np.ndarray:
         """
         오디오 파일 전처리
         
         Args:
-            audio_file_path: 오디오 파일 경로
+            audio_file: 업로드된 오디오 파일 객체
+            filename: 원본 파일명 (형식 판단용)
             
         Returns:
             전처리된 오디오 배열
         """
-        # 오디오 로드 (16kHz로 리샘플링, 모노)
-        speech, sampling_rate = librosa.load(
-            audio_file_path, 
-            sr=settings.SAMPLE_RATE, 
-            mono=True
-        )
+        # 오디오 로드 (메모리에서 디코딩, 16kHz로 리샘플링, 모노)
+        speech = decode_audio(audio_file, filename, settings.SAMPLE_RATE)
+        sampling_rate = settings.SAMPLE_RATE
         
         # 오디오 길이 제한
         max_samples = settings.MAX_AUDIO_LENGTH * settings.SAMPLE_RATE
@@ -118,10 +288,42 @@ class EmotionProcessor:
         if settings.AUDIO_NORMALIZE and np.max(np.abs(speech)) > 0:
             speech = speech / np.max(np.abs(speech))
         
-        logger.debug(f"오디오 전처리 완료 - 길이: {len(speech)/settings.SAMPLE_RATE:.2f}초, 샘플링 레이트: {sampling_rate}")
+        logger.debug("오디오 전처리 완료 - 길이: %.2f초, 샘플링 레이트: %s", len(speech) / settings.SAMPLE_RATE, sampling_rate)
         
         return speech
     
+    def _predict_batch(self, speeches: List[np.ndarray]) -> torch.Tensor:
+        """
+        여러 오디오를 패딩된 배치 하나로 추론
+        
+        attention mask로 패딩 구간을 제외하므로 각 행의 결과는 단독 추론과 같다.
+        
+        Args:
+            speeches: 전처리된 오디오 배열 목록
+            
+        Returns:
+            (배치, 감정 수) 확률 텐서
+        """
+        # 모델 입력 준비 (가장 긴 오디오 길이로 패딩)
+        inputs = self.processor(
+            speeches,
+            sampling_rate=settings.SAMPLE_RATE,
+            return_tensors="pt",
+            padding=True,
+            return_attention_mask=True
+        )
+        
+        # GPU로 입력 데이터 이동
+        inputs = {key: value.to(self.device) for key, value in inputs.items()}
+        
+        # 예측 수행
+        with torch.no_grad():
+            outputs = self.model(**inputs)
+            logits = outputs.logits
+        
+        # 확률 계산
+        return torch.nn.functional.softmax(logits, dim=-1).cpu()
+    
     def _apply_scenario_weights(
         self, 
         probabilities: torch.Tensor, 
@@ -151,12 +353,12 @@ class EmotionProcessor:
             
             if emotion_label_en in weights:
                 weighted_probs[0][i] *= weights[emotion_label_en]
-                logger.debug(f"가중치 적용: {emotion_label_kr} -> {emotion_label_en} (x{weights[emotion_label_en]})")
+                logger.debug("가중치 적용: %s -> %s (x%s)", emotion_label_kr, emotion_label_en, weights[emotion_label_en])
         
         # 재정규화
         weighted_probs = torch.nn.functional.softmax(weighted_probs, dim=-1)
         
-        logger.debug(f"시나리오별 가중치 적용 완료 - 시나리오: {scenario}")
+        logger.debug("시나리오별 가중치 적용 완료 - 시나리오: %s", scenario)
         
         return weighted_probs
     
@@ -218,6 +420,40 @@ class EmotionProcessor:
         
         return all_emotions, top_emotions, primary_emotion
     
+    async def _predict(self, speech: np.ndarray, request: EmotionAnalysisRequest) -> torch.Tensor:
+        """
+        배처에 추론 요청을 제출하고 대기/추론 메트릭 기록
+        
+        Args:
+            speech: 전처리된 float32 오디오 배열
+            request: 감정분석 요청 매개변수 (메트릭 라벨)
+            
+        Returns:
+            해당 요청의 확률 텐서 (1, 감정 수)
+        """
+        labels = metric_labels(request.scenario, request.language)
+        timings: Dict[str, float] = {}
+        in_flight = INFERENCE_IN_FLIGHT.labels(*labels)
+        in_flight.inc()
+        try:
+            probabilities = await self.batcher.submit(speech, timings=timings)
+        finally:
+            in_flight.dec()
+        
+        if self.first_request_latency is None:
+            # 프로세스 시작 후 첫 추론 요청 (워밍업 효과 확인용)
+            self.first_request_latency = timings["queue_wait"] + timings["inference"]
+            warmed_up = self.warmup_stats is not None and self.warmup_stats["seconds"] is not None
+            FIRST_REQUEST_LATENCY.labels(str(warmed_up).lower()).set(self.first_request_latency)
+            logger.info(f"첫 추론 요청 처리 시간: {self.first_request_latency:.3f}초 (워밍업 {'완료' if warmed_up else '없음'})")
+        
+        QUEUE_WAIT.labels(*labels).observe(timings["queue_wait"])
+        INFERENCE_LATENCY.labels(*labels).observe(timings["inference"])
+        AUDIO_SECONDS.labels(*labels).observe(len(speech) / settings.SAMPLE_RATE)
+        if timings["batch_audio_seconds"] > 0:
+            REAL_TIME_FACTOR.labels(*labels).observe(timings["inference"] / timings["batch_audio_seconds"])
+        return probabilities
+    
     async def process_audio(
         self, 
         audio_file: UploadFile,
@@ -239,34 +475,19 @@ class EmotionProcessor:
         if self.model is None or self.processor is None:
             await self.load_model()
         
-        # 임시 파일 저장
-        temp_file_path = await self._save_temp_file(audio_file)
-        
+        labels = metric_labels(request.scenario, request.language)
+        active = ACTIVE_REQUESTS.labels(*labels)
+        active.inc()
         try:
-            logger.info(f"감정분석 시작 - 파일: {audio_file.filename}, 시나리오: {request.scenario}")
+            logger.info("감정분석 시작 - 파일: %s, 시나리오: %s", audio_file.filename, request.scenario)
             
-            # 오디오 전처리
-            speech = self._preprocess_audio(temp_file_path)
+            # 오디오 전처리 (디코딩/리샘플링은 작업 스레드에서 실행)
+            loop = asyncio.get_running_loop()
+            speech = await loop.run_in_executor(self.executor, self._preprocess_audio, audio_file.file, audio_file.filename)
             audio_duration = len(speech) / settings.SAMPLE_RATE
             
-            # 모델 입력 준비
-            inputs = self.processor(
-                speech,
-                sampling_rate=settings.SAMPLE_RATE,
-                return_tensors="pt",
-                padding=True
-            )
-            
-            # GPU로 입력 데이터 이동
-            inputs = {key: value.to(self.device) for key, value in inputs.items()}
-            
-            # 예측 수행
-            with torch.no_grad():
-                outputs = self.model(**inputs)
-                logits = outputs.logits
-            
-            # 확률 계산
-            probabilities = torch.nn.functional.softmax(logits, dim=-1)
+            # 예측 수행 (동시 요청과 함께 배치 추론)
+            probabilities = await self._predict(speech, request)
             
             # 감정 예측 결과 생성
             all_emotions, top_emotions, primary_emotion = self._create_emotion_predictions(
@@ -277,8 +498,9 @@ class EmotionProcessor:
             )
             
             processing_time = time.time() - start_time
+            REQUEST_LATENCY.labels(*labels).observe(processing_time)
             
-            logger.info(f"감정분석 완료 - 주 감정: {primary_emotion.emotion_kr} ({primary_emotion.probability:.3f}), 처리시간: {processing_time:.2f}초")
+            logger.info("감정분석 완료 - 주 감정: %s (%.3f), 처리시간: %.2f초", primary_emotion.emotion_kr, primary_emotion.probability, processing_time)
             
             return EmotionAnalysisResponse(
                 primary_emotion=primary_emotion,
@@ -295,9 +517,7 @@ class EmotionProcessor:
             logger.error(f"감정분석 중 오류 발생: {str(e)}", exc_info=True)
             raise
         finally:
-            # 임시 파일 정리
-            if os.path.exists(temp_file_path):
-                os.unlink(temp_file_path)
+            active.dec()
     
     async def process_audio_bytes(
         self,
@@ -320,6 +540,9 @@ class EmotionProcessor:
         if self.model is None or self.processor is None:
             await self.load_model()
         
+        labels = metric_labels(request.scenario, request.language)
+        active = ACTIVE_REQUESTS.labels(*labels)
+        active.inc()
         try:
             # raw PCM 바이트 데이터를 numpy array로 변환
             # STT 서비스에서 16-bit PCM으로 변환해서 보냄
@@ -331,7 +554,7 @@ class EmotionProcessor:
             # 오디오 길이 계산
             audio_duration = len(speech) / settings.SAMPLE_RATE
             
-            logger.debug(f"PCM 데이터 변환 완료 - 길이: {audio_duration:.2f}초, 샘플 수: {len(speech)}")
+            logger.debug("PCM 데이터 변환 완료 - 길이: %.2f초, 샘플 수: %d", audio_duration, len(speech))
             
             # 오디오 길이 제한
             max_samples = settings.MAX_AUDIO_LENGTH * settings.SAMPLE_RATE
@@ -348,24 +571,8 @@ class EmotionProcessor:
             if len(speech) == 0:
                 raise ValueError("오디오 데이터가 비어있습니다")
             
-            # 모델 입력 준비
-            inputs = self.processor(
-                speech,
-                sampling_rate=settings.SAMPLE_RATE,
-                return_tensors="pt",
-                padding=True
-            )
-            
-            # GPU로 입력 데이터 이동
-            inputs = {key: value.to(self.device) for key, value in inputs.items()}
-            
-            # 예측 수행
-            with torch.no_grad():
-                outputs = self.model(**inputs)
-                logits = outputs.logits
-            
-            # 확률 계산
-            probabilities = torch.nn.functional.softmax(logits, dim=-1)
+            # 예측 수행 (동시 요청과 함께 배치 추론)
+            probabilities = await self._predict(speech, request)
             
             # 감정 예측 결과 생성
             all_emotions, top_emotions, primary_emotion = self._create_emotion_predictions(
@@ -376,8 +583,9 @@ class EmotionProcessor:
             )
             
             processing_time = time.time() - start_time
+            REQUEST_LATENCY.labels(*labels).observe(processing_time)
             
-            logger.debug(f"실시간 감정분석 완료 - 주 감정: {primary_emotion.emotion_kr} ({primary_emotion.probability:.3f})")
+            logger.debug("실시간 감정분석 완료 - 주 감정: %s (%.3f)", primary_emotion.emotion_kr, primary_emotion.probability)
             
             return EmotionAnalysisResponse(
                 primary_emotion=primary_emotion,
@@ -393,30 +601,8 @@ class EmotionProcessor:
         except Exception as e:
             logger.error(f"실시간 감정분석 중 오류 발생: {str(e)}", exc_info=True)
             raise
-    
-    async def _save_temp_file(self, file: UploadFile) -> str:
-        """
-        업로드된 파일을 임시 디렉토리에 저장
-        
-        Args:
-            file: 업로드된 파일 객체
-            
-        Returns:
-            저장된 파일의 경로
-        """
-        # 임시 파일 경로 생성
-        file_extension = os.path.splitext(file.filename or "audio.wav")[1]
-        temp_file_path = os.path.join(
-            settings.TEMP_AUDIO_DIR,
-            f"emotion_audio_{int(time.time() * 1000)}{file_extension}"
-        )
-        
-        # 파일 저장
-        with open(temp_file_path, "wb") as temp_file:
-            content = await file.read()
-            temp_file.write(content)
-        
-        return temp_file_path
+        finally:
+            active.dec()
 
 
 # 전역 감정분석 프로세서 인스턴스
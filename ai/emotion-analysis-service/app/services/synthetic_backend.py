@@ -0,0 +1,79 @@
+import threading
+import time
+from types import SimpleNamespace
+from typing import Dict, Optional
+
+import numpy as np
+import torch
+from transformers import Wav2Vec2FeatureExtractor
+
+from app.core.config import settings
+
+
+class SyntheticLatency:
+    """
+    합성 추론 지연 시간 분포
+
+    (기본 + 오디오 초당 지연) ms에 중앙값 1인 로그정규 배수를 곱한 시간만큼
+    작업 스레드를 재운다 (GIL을 놓으므로 실제 추론 스레드처럼 동작).
+    """
+
+    def __init__(
+        self,
+        base_ms: float = settings.SYNTHETIC_LATENCY_MS,
+        per_audio_second_ms: float = settings.SYNTHETIC_LATENCY_PER_AUDIO_SECOND_MS,
+        sigma: float = settings.SYNTHETIC_LATENCY_SIGMA,
+        seed: int = settings.SYNTHETIC_SEED,
+    ) -> None:
+        self.base_ms = base_ms
+        self.per_audio_second_ms = per_audio_second_ms
+        self.sigma = sigma
+        self._rng = np.random.default_rng(seed)
+        self._lock = threading.Lock()
+
+    def sample(self, audio_seconds: float) -> float:
+        """지연 시간 추출 (초)"""
+        with self._lock:
+            factor = self._rng.lognormal(0.0, self.sigma) if self.sigma > 0 else 1.0
+        return (self.base_ms + self.per_audio_second_ms * audio_seconds) * factor / 1000
+
+    def wait(self, audio_seconds: float) -> None:
+        time.sleep(self.sample(audio_seconds))
+
+
+class SyntheticAudioClassifier:
+    """
+    AutoModelForAudioClassification 대체 합성 백엔드
+
+    실제 가중치 없이 배치 전체 오디오 길이에 따른 지연 시간만큼 기다린 뒤 (배치, 감정 수) logits를 반환한다.
+    logits는 시드로 고정된 난수라 같은 순서의 요청에는 같은 결과가 나온다.
+    """
+
+    def __init__(self, id2label: Dict[int, str], latency: Optional[SyntheticLatency] = None) -> None:
+        self.config = SimpleNamespace(id2label=dict(id2label), num_labels=len(id2label))
+        self.latency = latency or SyntheticLatency()
+        self._generator = torch.Generator().manual_seed(settings.SYNTHETIC_SEED)
+        self._lock = threading.Lock()
+
+    def __call__(self, input_values: torch.Tensor, attention_mask: Optional[torch.Tensor] = None, **kwargs) -> SimpleNamespace:
+        samples = attention_mask.sum().item() if attention_mask is not None else input_values.numel()
+        self.latency.wait(samples / settings.SAMPLE_RATE)
+        with self._lock:
+            logits = torch.randn(input_values.shape[0], self.config.num_labels, generator=self._generator)
+        return SimpleNamespace(logits=logits)
+
+
+def load_synthetic(id2label: Dict[int, str]) -> tuple:
+    """
+    합성 백엔드용 (processor, model)
+
+    feature extractor는 실제와 같은 Wav2Vec2FeatureExtractor라 전처리/패딩 비용은 그대로 포함된다.
+    """
+    processor = Wav2Vec2FeatureExtractor(
+        feature_size=1,
+        sampling_rate=settings.SAMPLE_RATE,
+        padding_value=0.0,
+        do_normalize=True,
+        return_attention_mask=True
+    )
+    return processor, SyntheticAudioClassifier(id2label)
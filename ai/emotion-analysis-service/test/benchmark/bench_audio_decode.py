@@ -0,0 +1,85 @@
+"""
+업로드 오디오 디코딩 경로 비교 (짧은 클립)
+
+기존 경로: 업로드 내용을 임시 파일로 저장 -> librosa.load(sr=16000, mono=True) -> 삭제
+새 경로  : decode_audio로 메모리에서 디코딩 (WAV/FLAC/OGG는 libsndfile, MP3만 ffmpeg 파이프)
+
+실행:
+    cd ai/emotion-analysis-service
+    python test/benchmark/bench_audio_decode.py --repeat 50
+"""
+import argparse
+import io
+import os
+import shutil
+import subprocess
+import sys
+import time
+
+import librosa
+import numpy as np
+import soundfile as sf
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from app.core.config import settings  # noqa: E402
+from app.services.audio_decoder import decode_audio  # noqa: E402
+
+
+def load_audio_from_temp_file(data: bytes, file_ext: str) -> np.ndarray:
+    """기존 경로 재현 (_save_temp_file + librosa.load)"""
+    temp_file_path = os.path.join(settings.TEMP_AUDIO_DIR, f"emotion_audio_{int(time.time() * 1000)}.{file_ext}")
+    with open(temp_file_path, "wb") as temp_file:
+        temp_file.write(data)
+    try:
+        speech, _ = librosa.load(temp_file_path, sr=settings.SAMPLE_RATE, mono=True)
+        return speech
+    finally:
+        os.unlink(temp_file_path)
+
+
+def encode_clip(seconds: float, file_ext: str, sample_rate: int) -> bytes:
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    audio = 0.3 * np.sin(2 * np.pi * 220 * t) * (np.sin(2 * np.pi * 3 * t) > 0)
+    if file_ext == "mp3":
+        wav = io.BytesIO()
+        sf.write(wav, audio, sample_rate, format="WAV", subtype="PCM_16")
+        return subprocess.run(["ffmpeg", "-nostdin", "-i", "pipe:0", "-f", "mp3", "pipe:1"],
+                              input=wav.getvalue(), capture_output=True, check=True).stdout
+    buffer = io.BytesIO()
+    subtype = "VORBIS" if file_ext == "ogg" else "PCM_16"
+    sf.write(buffer, audio, sample_rate, format=file_ext.upper(), subtype=subtype)
+    return buffer.getvalue()
+
+
+def measure(fn, repeat: int) -> float:
+    fn()  # 워밍업
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="업로드 오디오 디코딩 경로 비교")
+    parser.add_argument("--seconds", type=float, nargs="+", default=[2.0, 3.0, 5.0], help="클립 길이 (초)")
+    parser.add_argument("--formats", nargs="+", default=["wav", "flac", "ogg", "mp3"])
+    parser.add_argument("--source-rate", type=int, default=settings.SAMPLE_RATE, help="클립 샘플링 레이트 (다르면 리샘플링 포함)")
+    parser.add_argument("--repeat", type=int, default=30)
+    args = parser.parse_args()
+
+    has_ffmpeg = shutil.which("ffmpeg") is not None
+    print(f"{'형식':>5} {'길이':>5} | {'임시파일+librosa(ms)':>20} | {'메모리 디코딩(ms)':>18} | 개선")
+    for file_ext in args.formats:
+        if file_ext == "mp3" and not has_ffmpeg:
+            print("ffmpeg가 없어 MP3는 측정하지 않습니다")
+            continue
+        for seconds in args.seconds:
+            data = encode_clip(seconds, file_ext, args.source_rate)
+            old_ms = measure(lambda: load_audio_from_temp_file(data, file_ext), args.repeat)
+            new_ms = measure(lambda: decode_audio(io.BytesIO(data), f"clip.{file_ext}"), args.repeat)
+            print(f"{file_ext:>5} {seconds:>4.1f}s | {old_ms:>20.2f} | {new_ms:>18.2f} | {old_ms / new_ms:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
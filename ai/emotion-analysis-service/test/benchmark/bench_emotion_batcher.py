@@ -0,0 +1,90 @@
+"""
+감정분석 마이크로 배처 부하 테스트
+
+동시 호출자 수(1, 8, 32)별로 요청별 추론(배치 크기 1)과 EmotionBatcher 배치 추론의
+처리량(requests/sec)과 p99 지연 시간을 CPU에서 비교한다.
+각 호출자는 process_audio_bytes를 연속으로 호출한다 (HTTP 오버헤드 제외).
+
+실행:
+    cd ai/emotion-analysis-service
+    python test/benchmark/bench_emotion_batcher.py --requests-per-caller 10
+    python test/benchmark/bench_emotion_batcher.py --concurrency 1 8 32 --seconds 5
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+os.environ.setdefault("DEVICE", "cpu")
+
+from app.core.config import settings  # noqa: E402
+from app.core.models import EmotionAnalysisRequest  # noqa: E402
+from app.services.emotion_batcher import EmotionBatcher  # noqa: E402
+from app.services.emotion_service import EmotionProcessor  # noqa: E402
+
+
+def make_clip(seconds: float, seed: int) -> bytes:
+    """합성 음성 유사 신호 (16kHz, 16-bit PCM)"""
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(seconds * settings.SAMPLE_RATE)) / settings.SAMPLE_RATE
+    signal = 0.2 * np.sin(2 * np.pi * (150 + 50 * seed % 7) * t) * (np.sin(2 * np.pi * 2 * t) > 0)
+    signal += 0.02 * rng.standard_normal(len(t))
+    return (signal * 32767).astype(np.int16).tobytes()
+
+
+async def run(processor: EmotionProcessor, clips, concurrency: int, requests_per_caller: int):
+    request = EmotionAnalysisRequest(scenario="presentation", top_k=6)
+    latencies = []
+
+    async def caller(index: int) -> None:
+        for i in range(requests_per_caller):
+            start = time.perf_counter()
+            await processor.process_audio_bytes(clips[(index + i) % len(clips)], request)
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(caller(i) for i in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    p99 = latencies[min(int(len(latencies) * 0.99), len(latencies) - 1)]
+    return len(latencies) / elapsed, p99 * 1000
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="감정분석 배처 부하 테스트")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32], help="동시 호출자 수")
+    parser.add_argument("--requests-per-caller", type=int, default=8, help="호출자당 요청 수")
+    parser.add_argument("--clip-seconds", type=float, nargs="+", default=[3.0, 5.0, 8.0], help="클립 길이 (초)")
+    parser.add_argument("--max-batch-size", type=int, default=max(settings.BATCH_SIZE, 2))
+    parser.add_argument("--max-wait-ms", type=int, default=settings.BATCH_MAX_WAIT_MS)
+    args = parser.parse_args()
+
+    processor = EmotionProcessor()
+    await processor.load_model()
+    clips = [make_clip(s, i) for i, s in enumerate(args.clip_seconds)]
+
+    # 워밍업
+    await processor.process_audio_bytes(clips[0], EmotionAnalysisRequest())
+
+    print(f"모델: {processor.model_name}, 장치: {processor.device}, 클립: {args.clip_seconds}초")
+    print(f"{'동시 호출':>8} | {'요청별 req/s':>12} {'p99(ms)':>9} | {'배치 req/s':>10} {'p99(ms)':>9} | 배치 크기 분포")
+    for concurrency in args.concurrency:
+        processor.batcher = EmotionBatcher(processor._predict_batch, max_batch_size=1, executor=processor.executor)
+        single_rps, single_p99 = await run(processor, clips, concurrency, args.requests_per_caller)
+        await processor.batcher.shutdown()
+
+        processor.batcher = EmotionBatcher(processor._predict_batch, args.max_batch_size, args.max_wait_ms, executor=processor.executor)
+        batched_rps, batched_p99 = await run(processor, clips, concurrency, args.requests_per_caller)
+        histogram = processor.batcher.get_stats()["batch_size_histogram"]
+        await processor.batcher.shutdown()
+
+        print(f"{concurrency:>8} | {single_rps:>12.2f} {single_p99:>9.1f} | {batched_rps:>10.2f} {batched_p99:>9.1f} | {histogram}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
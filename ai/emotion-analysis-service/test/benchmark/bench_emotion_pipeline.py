@@ -0,0 +1,210 @@
+"""
+감정분석 핫 패스 마이크로 벤치마크 (오프라인, 기준값 비교)
+
+EmotionProcessor의 단계별 CPU 시간을 클립 길이(1~30초)와 배치 크기별로 측정한다.
+- preprocess: _preprocess_audio (WAV 디코딩, 길이 제한, 정규화)
+- feature_extractor: 패딩/attention mask를 포함한 processor 호출
+- forward: 모델 forward (torch.no_grad)
+- scenario_weights: _apply_scenario_weights
+- predictions: _create_emotion_predictions (가중치 적용 포함)
+
+기본값은 무작위 초기화한 소형 wav2vec2 설정(XLSR과 같은 stable layer norm 구조)이라
+네트워크 없이 실행되며, --pretrained를 주면 settings.EMOTION_MODEL을 로드한다.
+결과는 JSON으로 저장하고, 기준 파일과 비교해 중앙값이 허용 범위를 넘으면 종료 코드 1을 반환한다.
+
+실행:
+    cd ai/emotion-analysis-service
+    python test/benchmark/bench_emotion_pipeline.py --save-baseline baseline.json
+    python test/benchmark/bench_emotion_pipeline.py --baseline baseline.json --tolerance 0.2
+"""
+import argparse
+import io
+import json
+import os
+import platform
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+import soundfile as sf
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+os.environ.setdefault("DEVICE", "cpu")
+
+import torch  # noqa: E402
+from transformers import Wav2Vec2Config, Wav2Vec2FeatureExtractor, Wav2Vec2ForSequenceClassification  # noqa: E402
+
+from app.core.config import settings  # noqa: E402
+from app.services.emotion_service import LABEL_MAPPING, EmotionProcessor  # noqa: E402
+
+
+def tiny_model() -> tuple:
+    """무작위 초기화한 소형 wav2vec2 분류 모델과 feature extractor (네트워크 불필요)"""
+    labels = list(LABEL_MAPPING)
+    config = Wav2Vec2Config(
+        hidden_size=64,
+        num_hidden_layers=2,
+        num_attention_heads=4,
+        intermediate_size=128,
+        conv_dim=(32,) * 7,
+        num_conv_pos_embeddings=16,
+        num_conv_pos_embedding_groups=4,
+        feat_extract_norm="layer",
+        do_stable_layer_norm=True,
+        num_labels=len(labels),
+        id2label=dict(enumerate(labels)),
+        label2id={label: i for i, label in enumerate(labels)},
+    )
+    torch.manual_seed(0)
+    model = Wav2Vec2ForSequenceClassification(config).eval()
+    feature_extractor = Wav2Vec2FeatureExtractor(
+        feature_size=1,
+        sampling_rate=settings.SAMPLE_RATE,
+        padding_value=0.0,
+        do_normalize=True,
+        return_attention_mask=True,
+    )
+    return feature_extractor, model
+
+
+def build_processor(pretrained: bool) -> EmotionProcessor:
+    processor = EmotionProcessor(backend="torch")
+    if pretrained:
+        processor.processor, processor.model = processor._load_pretrained()
+    else:
+        processor.processor, processor.model = tiny_model()
+    processor.label_mapping = dict(LABEL_MAPPING)
+    return processor
+
+
+def measure(fn: Callable[[], Any], repeat: int, warmup: int = 2) -> Dict[str, float]:
+    for _ in range(warmup):
+        fn()
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - start) * 1000)
+    times.sort()
+    return {
+        "median_ms": round(times[len(times) // 2], 4),
+        "p95_ms": round(times[min(int(len(times) * 0.95), len(times) - 1)], 4),
+    }
+
+
+def run_suite(processor: EmotionProcessor, clip_seconds: List[float], batch_sizes: List[int], repeat: int) -> Dict[str, Dict[str, float]]:
+    rng = np.random.default_rng(0)
+    results: Dict[str, Dict[str, float]] = {}
+
+    for seconds in clip_seconds:
+        speech = (0.1 * rng.standard_normal(int(seconds * settings.SAMPLE_RATE))).astype(np.float32)
+
+        wav = io.BytesIO()
+        sf.write(wav, speech, settings.SAMPLE_RATE, format="WAV", subtype="PCM_16")
+        wav_bytes = wav.getvalue()
+        results[f"preprocess/{seconds:g}s"] = measure(
+            lambda: processor._preprocess_audio(io.BytesIO(wav_bytes), "clip.wav"), repeat
+        )
+
+        for batch_size in batch_sizes:
+            # 배치 안의 길이가 다르도록 클립 끝을 조금씩 잘라 패딩 경로를 포함
+            speeches = [speech[:len(speech) - i * settings.SAMPLE_RATE // 10] for i in range(batch_size)]
+
+            def extract() -> Dict[str, torch.Tensor]:
+                return processor.processor(
+                    speeches,
+                    sampling_rate=settings.SAMPLE_RATE,
+                    return_tensors="pt",
+                    padding=True,
+                    return_attention_mask=True
+                )
+
+            inputs = {key: value.to(processor.device) for key, value in extract().items()}
+
+            def forward() -> torch.Tensor:
+                with torch.no_grad():
+                    return processor.model(**inputs).logits
+
+            results[f"feature_extractor/{seconds:g}s/b{batch_size}"] = measure(extract, repeat)
+            results[f"forward/{seconds:g}s/b{batch_size}"] = measure(forward, repeat)
+
+    probabilities = processor._predict_batch([(0.1 * rng.standard_normal(settings.SAMPLE_RATE)).astype(np.float32)])
+    for scenario in settings.SCENARIO_WEIGHTS:
+        results[f"scenario_weights/{scenario}"] = measure(
+            lambda: processor._apply_scenario_weights(probabilities, scenario), repeat * 10
+        )
+        results[f"predictions/{scenario}"] = measure(
+            lambda: processor._create_emotion_predictions(probabilities, True, scenario, settings.TOP_K_EMOTIONS), repeat * 10
+        )
+    return results
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """기준 대비 중앙값이 (1 + tolerance)배를 넘은 항목 목록"""
+    regressions = []
+    base_results = baseline.get("results", {})
+    print(f"\n{'항목':36s} {'기준(ms)':>10s} {'현재(ms)':>10s} {'변화':>8s}")
+    for name, current in results.items():
+        base = base_results.get(name)
+        if base is None:
+            print(f"{name:36s} {'-':>10s} {current['median_ms']:10.3f} {'new':>8s}")
+            continue
+        ratio = current["median_ms"] / base["median_ms"] if base["median_ms"] > 0 else 1.0
+        flag = " !" if ratio > 1 + tolerance else ""
+        print(f"{name:36s} {base['median_ms']:10.3f} {current['median_ms']:10.3f} {ratio - 1:+7.1%}{flag}")
+        if flag:
+            regressions.append(name)
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="감정분석 핫 패스 마이크로 벤치마크")
+    parser.add_argument("--clip-seconds", type=float, nargs="+", default=[1, 5, 10, 30])
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 4, 8])
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--threads", type=int, default=4, help="torch 스레드 수 (측정 간 고정)")
+    parser.add_argument("--pretrained", action="store_true", help="settings.EMOTION_MODEL 로드 (네트워크/캐시 필요)")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    parser.add_argument("--save-baseline", help="결과를 기준 파일로 저장")
+    parser.add_argument("--baseline", help="비교할 기준 파일")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="허용하는 중앙값 증가율")
+    args = parser.parse_args()
+
+    torch.set_num_threads(args.threads)
+    processor = build_processor(args.pretrained)
+    results = run_suite(processor, args.clip_seconds, args.batch_sizes, args.repeat)
+
+    report = {
+        "meta": {
+            "model": settings.EMOTION_MODEL if args.pretrained else "tiny-random-wav2vec2",
+            "torch": torch.__version__,
+            "threads": args.threads,
+            "machine": platform.machine(),
+            "python": platform.python_version(),
+        },
+        "results": results,
+    }
+    for name, value in results.items():
+        print(f"{name:36s} median {value['median_ms']:10.3f}ms  p95 {value['p95_ms']:10.3f}ms")
+
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, "w") as f:
+                json.dump(report, f, ensure_ascii=False, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if baseline.get("meta", {}).get("model") != report["meta"]["model"]:
+            print(f"경고: 기준 모델({baseline.get('meta', {}).get('model')})과 현재 모델이 다릅니다")
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(f"\n성능 회귀 {len(regressions)}건 (허용 +{args.tolerance:.0%}): {', '.join(regressions)}")
+            sys.exit(1)
+        print("\n성능 회귀 없음")
+
+
+if __name__ == "__main__":
+    main()
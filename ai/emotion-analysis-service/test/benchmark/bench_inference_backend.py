@@ -0,0 +1,103 @@
+"""
+추론 백엔드별 CPU 지연 시간 / 메모리 비교
+
+백엔드마다 별도 프로세스에서 모델을 로드하여 상주 메모리(RSS) 증가량, 가중치 크기,
+클립 길이별 단일 요청 지연 시간(p50, p95)을 측정한다.
+
+실행:
+    cd ai/emotion-analysis-service
+    python test/benchmark/bench_inference_backend.py --backends torch torch_int8 --threads 4
+"""
+import argparse
+import asyncio
+import io
+import json
+import os
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+os.environ.setdefault("DEVICE", "cpu")
+
+
+def rss_mb() -> float:
+    """현재 프로세스 상주 메모리 (MB, Linux)"""
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+
+def run_backend(backend: str, clip_seconds: list, repeat: int, threads: int) -> dict:
+    import torch
+
+    from app.core.config import settings
+    from app.services.emotion_service import EmotionProcessor
+
+    torch.set_num_threads(threads)
+    before = rss_mb()
+    processor = EmotionProcessor(backend=backend)
+    asyncio.run(processor.load_model())
+    after = rss_mb()
+
+    buffer = io.BytesIO()
+    torch.save(processor.model.state_dict(), buffer)
+
+    rng = np.random.default_rng(0)
+    latency = {}
+    for seconds in clip_seconds:
+        speech = (0.1 * rng.standard_normal(int(seconds * settings.SAMPLE_RATE))).astype(np.float32)
+        processor._predict_batch([speech])  # 워밍업
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            processor._predict_batch([speech])
+            times.append((time.perf_counter() - start) * 1000)
+        times.sort()
+        latency[str(seconds)] = {"p50": times[len(times) // 2], "p95": times[min(int(len(times) * 0.95), len(times) - 1)]}
+
+    return {
+        "backend": backend,
+        "rss_increase_mb": after - before,
+        "peak_rss_mb": rss_mb(),
+        "weights_mb": buffer.tell() / 1024 / 1024,
+        "latency_ms": latency,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="추론 백엔드 지연 시간 / 메모리 비교")
+    parser.add_argument("--backends", nargs="+", default=["torch", "torch_int8"])
+    parser.add_argument("--clip-seconds", type=float, nargs="+", default=[5.0, 15.0, 30.0])
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--threads", type=int, default=4, help="torch intra-op 스레드 수")
+    parser.add_argument("--worker", default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(run_backend(args.worker, args.clip_seconds, args.repeat, args.threads)))
+        return
+
+    results = []
+    for backend in args.backends:
+        cmd = [sys.executable, os.path.abspath(__file__), "--worker", backend,
+               "--repeat", str(args.repeat), "--threads", str(args.threads),
+               "--clip-seconds", *[str(s) for s in args.clip_seconds]]
+        out = subprocess.run(cmd, capture_output=True, text=True, check=True).stdout
+        results.append(json.loads(out.strip().splitlines()[-1]))
+
+    print(f"스레드: {args.threads}, 반복: {args.repeat}")
+    for result in results:
+        print(f"[{result['backend']}] 가중치 {result['weights_mb']:.1f}MB, "
+              f"RSS 증가 {result['rss_increase_mb']:.1f}MB, 최대 RSS {result['peak_rss_mb']:.1f}MB")
+        for seconds, stats in result["latency_ms"].items():
+            print(f"  {float(seconds):5.1f}초 클립: p50 {stats['p50']:8.1f}ms, p95 {stats['p95']:8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
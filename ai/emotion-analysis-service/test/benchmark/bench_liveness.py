@@ -0,0 +1,109 @@
+"""
+추론 포화 상태에서의 /health/live 응답성 테스트
+
+N개의 analyze_bytes 요청이 계속 실행되는 동안 /health/live 지연 시간을 측정하여
+유휴 상태와 비교한다. 추론이 이벤트 루프 밖(전용 스레드 풀)에서 실행되므로
+부하 중에도 liveness 지연 시간은 거의 변하지 않아야 한다.
+p99 증가폭이 --max-increase-ms를 넘으면 종료 코드 1로 끝난다.
+
+실행:
+    cd ai/emotion-analysis-service
+    python test/benchmark/bench_liveness.py --in-flight 8 --clip-seconds 30
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+import httpx
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+os.environ.setdefault("DEVICE", "cpu")
+
+from app.core.config import settings  # noqa: E402
+from app.main import app  # noqa: E402
+from app.services.emotion_service import emotion_processor  # noqa: E402
+
+LIVE_PATH = f"{settings.API_V1_STR}/health/live"
+ANALYZE_PATH = f"{settings.API_V1_STR}/emotion/analyze_bytes"
+
+
+async def probe_liveness(client: httpx.AsyncClient, probes: int, interval: float) -> list:
+    latencies = []
+    for _ in range(probes):
+        start = time.perf_counter()
+        response = await client.get(LIVE_PATH)
+        response.raise_for_status()
+        latencies.append((time.perf_counter() - start) * 1000)
+        await asyncio.sleep(interval)
+    return latencies
+
+
+def summarize(latencies: list) -> dict:
+    latencies = sorted(latencies)
+    return {
+        "p50": latencies[len(latencies) // 2],
+        "p99": latencies[min(int(len(latencies) * 0.99), len(latencies) - 1)],
+        "max": latencies[-1],
+    }
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description="추론 포화 상태 liveness 테스트")
+    parser.add_argument("--in-flight", type=int, default=8, help="동시에 실행할 감정분석 요청 수")
+    parser.add_argument("--clip-seconds", type=float, default=30.0, help="요청 오디오 길이 (초)")
+    parser.add_argument("--probes", type=int, default=100, help="liveness 측정 횟수")
+    parser.add_argument("--interval-ms", type=float, default=50.0, help="측정 간격 (ms)")
+    parser.add_argument("--max-increase-ms", type=float, default=50.0, help="허용하는 p99 증가폭 (ms)")
+    args = parser.parse_args()
+
+    await emotion_processor.load_model()
+
+    rng = np.random.default_rng(0)
+    samples = int(args.clip_seconds * settings.SAMPLE_RATE)
+    audio_bytes = (rng.standard_normal(samples) * 3000).astype(np.int16).tobytes()
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test", timeout=None) as client:
+        interval = args.interval_ms / 1000
+        idle = summarize(await probe_liveness(client, args.probes, interval))
+
+        stop = asyncio.Event()
+        completed = 0
+
+        async def saturate() -> None:
+            nonlocal completed
+            while not stop.is_set():
+                response = await client.post(
+                    ANALYZE_PATH,
+                    content=audio_bytes,
+                    headers={"Content-Type": "application/octet-stream"}
+                )
+                response.raise_for_status()
+                completed += 1
+
+        workers = [asyncio.create_task(saturate()) for _ in range(args.in_flight)]
+        await asyncio.sleep(0.5)  # 추론이 실제로 시작될 때까지 대기
+        loaded = summarize(await probe_liveness(client, args.probes, interval))
+        stop.set()
+        await asyncio.gather(*workers)
+
+    await emotion_processor.shutdown()
+
+    print(f"동시 요청: {args.in_flight}, 클립: {args.clip_seconds}초, 작업 스레드: {settings.MAX_WORKERS}, 완료된 추론: {completed}")
+    print(f"  유휴 liveness   : p50 {idle['p50']:7.2f}ms, p99 {idle['p99']:7.2f}ms, max {idle['max']:7.2f}ms")
+    print(f"  포화 liveness   : p50 {loaded['p50']:7.2f}ms, p99 {loaded['p99']:7.2f}ms, max {loaded['max']:7.2f}ms")
+
+    increase = loaded["p99"] - idle["p99"]
+    if increase > args.max_increase_ms:
+        print(f"실패: 포화 상태에서 liveness p99가 {increase:.2f}ms 증가했습니다 (허용: {args.max_increase_ms}ms)")
+        return 1
+    print("통과: 포화 상태에서도 liveness 지연 시간이 유지됩니다")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
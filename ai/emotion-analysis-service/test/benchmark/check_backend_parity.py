@@ -0,0 +1,81 @@
+"""
+추론 백엔드 정확도 비교 (fp32 기준)
+
+로컬 클립 디렉토리의 모든 오디오에 대해 기준 백엔드(torch, fp32)와 비교 백엔드의
+감정 확률을 비교한다. 주 감정 일치율이 --min-agreement보다 낮거나
+확률 최대 오차가 --max-prob-diff를 넘으면 종료 코드 1로 끝난다.
+
+실행:
+    cd ai/emotion-analysis-service
+    python test/benchmark/check_backend_parity.py --clips-dir ~/emotion_clips --backend torch_int8
+"""
+import argparse
+import asyncio
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+os.environ.setdefault("DEVICE", "cpu")
+
+from app.services.emotion_service import EmotionProcessor  # noqa: E402
+
+AUDIO_EXTENSIONS = (".wav", ".flac", ".ogg", ".mp3")
+
+
+def load_processor(backend: str) -> EmotionProcessor:
+    processor = EmotionProcessor(backend=backend)
+    asyncio.run(processor.load_model())
+    return processor
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="추론 백엔드 정확도 비교")
+    parser.add_argument("--clips-dir", required=True, help="비교에 사용할 오디오 클립 디렉토리")
+    parser.add_argument("--backend", default="torch_int8", help="비교할 백엔드")
+    parser.add_argument("--min-agreement", type=float, default=0.95, help="최소 주 감정 일치율")
+    parser.add_argument("--max-prob-diff", type=float, default=0.1, help="허용하는 확률 최대 오차")
+    args = parser.parse_args()
+
+    paths = sorted(
+        os.path.join(args.clips_dir, name)
+        for name in os.listdir(args.clips_dir)
+        if name.lower().endswith(AUDIO_EXTENSIONS)
+    )
+    if not paths:
+        print(f"클립이 없습니다: {args.clips_dir}")
+        return 1
+
+    reference = load_processor("torch")
+    candidate = load_processor(args.backend)
+    labels = reference.model.config.id2label
+
+    agreements = 0
+    max_diffs = []
+    print(f"{'클립':<40} {'fp32 주 감정':>12} {args.backend + ' 주 감정':>18} {'최대 오차':>10}")
+    for path in paths:
+        with open(path, "rb") as f:
+            speech = reference._preprocess_audio(f, path)
+        ref_probs = reference._predict_batch([speech])[0].numpy()
+        cand_probs = candidate._predict_batch([speech])[0].numpy()
+
+        ref_top, cand_top = int(np.argmax(ref_probs)), int(np.argmax(cand_probs))
+        agreements += ref_top == cand_top
+        max_diffs.append(float(np.abs(ref_probs - cand_probs).max()))
+        print(f"{os.path.basename(path)[:40]:<40} {labels[ref_top]:>12} {labels[cand_top]:>18} {max_diffs[-1]:>10.4f}")
+
+    agreement = agreements / len(paths)
+    worst = max(max_diffs)
+    print(f"클립 수: {len(paths)}, 주 감정 일치율: {agreement:.1%}, 확률 최대 오차: {worst:.4f}, 평균 최대 오차: {np.mean(max_diffs):.4f}")
+
+    if agreement < args.min_agreement or worst > args.max_prob_diff:
+        print(f"실패: 기준 (일치율 >= {args.min_agreement:.0%}, 최대 오차 <= {args.max_prob_diff})를 만족하지 않습니다")
+        return 1
+    print("통과")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,8 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException, status
 import torch
 from app.core.models import HealthResponse
 from app.core.logging import logger
+from app.services.stt_service import stt_processor
 import platform
 import sys
 import whisperx
@@ -78,4 +79,24 @@ async def health_check() -> HealthResponse:
         return HealthResponse(
             status="unhealthy",
             version="unknown"
-        ) 
\ No newline at end of file
+        )
+
+
+@router.get("/ready")
+async def readiness_check():
+    """
+    준비 상태 확인 (모델 로딩과 워밍업을 마치기 전에는 503)
+    
+    Returns:
+        준비 상태와 워밍업 결과
+    """
+    if not stt_processor.ready:
+        detail = "STT 모델을 로딩하는 중입니다" if stt_processor.model is None else "STT 모델을 워밍업하는 중입니다"
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=detail)
+    
+    return {
+        "status": "ready",
+        "message": "STT 서비스가 요청을 받을 준비가 되었습니다",
+        "backend": stt_processor.backend,
+        "warmup": stt_processor.warmup_stats
+    }
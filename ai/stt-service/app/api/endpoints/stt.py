@@ -4,7 +4,10 @@ from typing import Optional
 
 from app.core.models import STTRequest, STTResponse
 from app.services.stt_service import stt_processor
-from app.services.websocket_service import websocket_manager
+from app.services.websocket_service import websocket_manager, inference_scheduler
+from app.services.emotion_client import emotion_client
+from app.services.endpointer import endpoint_stats
+from app.services.silence_gate import silence_gate
 from app.core.logging import logger
 
 router = APIRouter()
@@ -67,7 +70,11 @@ async def transcribe_audio(
 async def websocket_endpoint(
     websocket: WebSocket,
     language: str = Query("ko", description="인식할 언어 코드 (예: ko, en)"),
-    scenario: str = Query("presentation", description="시나리오 타입 (dating, interview, presentation)")
+    scenario: str = Query("presentation", description="시나리오 타입 (dating, interview, presentation)"),
+    mode: str = Query("batch", pattern="^(batch|streaming)$", description="처리 모드 (batch: 발화 경계 또는 최대 15초 단위, streaming: 슬라이딩 윈도우 부분 결과)"),
+    timing: bool = Query(False, description="transcription 메시지에 단계별 처리 시간(timing) 포함 여부"),
+    encoding: str = Query("json", pattern="^(json|msgpack)$", description="결과 메시지 인코딩 (json: 텍스트 프레임, msgpack: 바이너리 프레임)"),
+    fields: Optional[str] = Query(None, description="결과 메시지에 포함할 그룹 (쉼표 구분: text, metrics, segments, words, emotion, timing / 생략 시 전체)")
 ):
     """
     실시간 음성 인식을 위한 WebSocket 엔드포인트
@@ -85,7 +92,84 @@ async def websocket_endpoint(
     서버 응답:
     - {"type": "connected", "message": "...", "connection_id": "..."}
     - {"type": "status", "message": "..."}
-    - {"type": "transcription", "text": "...", "is_final": bool, "segment_id": int}
+    - {"type": "transcription", "text": "...", "is_final": bool, "segment_id": int, "emotion_analysis": {...} | null, "emotion_pending": bool}
+    - {"type": "emotion_analysis", "segment_id": int, "emotion_analysis": {...} | null} (emotion_pending이었던 세그먼트의 후속 결과)
+    - transcription 메시지의 "cumulative_metrics"는 세션 시작(또는 reset)부터 누적한 말하기 속도 메트릭 (세션당 고정 메모리로 증분 갱신)
+    - timing=true로 연결하면 transcription 메시지에 "timing" 블록 포함: 단계별 소요 시간(stages_ms: buffering, queue_wait,
+      inference, metrics, emotion, emotion_wait, total), 버퍼 절단 기준 단계 시각(marks_ms), real_time_factor
+    - {"type": "partial_transcription", "partial_text": "...", "is_final": false, "segment_id": int} (streaming 모드)
+    - {"type": "overloaded", "reason": "...", "queue_depth": int, "dropped_audio_seconds": float, ...} (과부하로 윈도우가 실행 전에 거절된 경우)
+      reason: drop_oldest / drop_newest / queue_timeout (윈도우를 버림), coalesce (다음 윈도우와 합쳐 처리, 버린 오디오 없음),
+      buffer_overflow (수신 버퍼 용량 초과로 오래된 오디오를 버림)
+    - {"type": "silence", "duration": float, "rms_dbfs": float, "pause_metrics": {...}, "pause_pattern": "...", "cumulative_metrics": {...}}
+      (무음 윈도우: 추론과 감정분석 없이 pause 메트릭만 전송)
     - {"type": "error", "message": "..."}
+    
+    결과 메시지 형식:
+    - encoding=msgpack이면 모든 서버 메시지를 같은 구조의 MessagePack 바이너리 프레임으로 전송합니다.
+    - fields=text,emotion처럼 그룹을 지정하면 지정하지 않은 그룹의 키를 빼고 전송합니다
+      (type, segment_id, is_final 등 그룹에 속하지 않는 키는 항상 포함).
+    
+    batch 모드에서는 에너지 기반 발화 구간 검출로 발화가 끝난 무음 경계에서 윈도우를 자르고
+    (시나리오별 SCENARIO_VAD_PARAMS, 최대 15초), 발화 전 무음 구간은 추론 전에 버립니다.
+    
+    streaming 모드에서는 STREAMING_HOP_SECONDS마다 확정되지 않은 구간을 다시 인식하여
+    부분 결과를 보내고, 연속된 두 결과가 일치하는 앞부분을 최종 결과(is_final: true)로 확정합니다.
+    """
+    await websocket_manager.handle_connection(websocket, language, scenario, mode, timing, encoding, fields)
+
+@router.get("/scheduler/stats")
+async def scheduler_stats():
+    """
+    추론 스케줄러 상태 조회
+    
+    Returns:
+        대기열 길이, 배치 크기 분포, 요청 대기 시간 통계
+    """
+    return inference_scheduler.get_stats()
+
+
+@router.get("/emotion_client/stats")
+async def emotion_client_stats():
+    """
+    감정분석 서비스 호출 통계 조회
+    
+    Returns:
+        호출 수, 실패 수, 호출 지연 시간 통계
+    """
+    return emotion_client.get_stats()
+
+
+@router.get("/endpointer/stats")
+async def endpointer_stats():
+    """
+    발화 구간 검출 통계 조회
+    
+    Returns:
+        추론 전에 버린 무음 길이와 비율, 절단 이유별 윈도우 수, 윈도우 길이 통계
+    """
+    return endpoint_stats.get_stats()
+
+
+@router.get("/silence_gate/stats")
+async def silence_gate_stats():
+    """
+    무음 게이트 통계 조회
+    
+    Returns:
+        판정한 윈도우 수, 추론을 생략한 윈도우 수와 오디오 길이, 절약한 추정 추론 시간
+    """
+    return silence_gate.get_stats()
+
+
+@router.get("/workers/stats")
+async def worker_pool_stats():
+    """
+    추론 워커 프로세스 풀 상태 조회
+    
+    Returns:
+        워커별 프로세스 상태, 처리한 요청 수, 추론 시간 합계, 재시작 횟수, 오디오 슬랩 사용량 (워커를 사용하지 않으면 enabled: false)
     """
-    await websocket_manager.handle_connection(websocket, language, scenario) 
\ No newline at end of file
+    if stt_processor.worker_pool is None:
+        return {"enabled": False, "processes": 0}
+    return stt_processor.worker_pool.get_stats()
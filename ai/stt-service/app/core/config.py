@@ -12,6 +12,7 @@ class Settings(BaseSettings):
     # API 설정
     API_V1_STR: str = "/api/v1"
     PROJECT_NAME: str = "STT Service"
+    JSON_SERIALIZER: str = "orjson"  # 응답 JSON 직렬화 (orjson: 빠른 경로, 미설치 시 json / json: 표준 라이브러리)
     
     # 오디오 관련 상수
     SAMPLE_RATE: int = 16000  # 오디오 샘플링 레이트 (Hz)
@@ -23,6 +24,12 @@ class Settings(BaseSettings):
     DEVICE: str = "cuda"  # 사용할 장치 ("cuda" 또는 "cpu")
     COMPUTE_TYPE: str = "float16"  # 연산 정밀도 (float16, float32, int8)
     CPU_THREADS: int = 4  # CPU 스레드 수
+    INFERENCE_BACKEND: str = "faster_whisper"  # 추론 백엔드 (faster_whisper, synthetic: 모델 없이 합성 결과)
+    # synthetic 백엔드 지연 시간 분포: (기본 + 오디오 초당) ms에 로그정규(중앙값 1, sigma) 배수를 곱함
+    SYNTHETIC_LATENCY_MS: float = 50.0  # 요청(배치)당 기본 지연 시간 (ms)
+    SYNTHETIC_LATENCY_PER_AUDIO_SECOND_MS: float = 20.0  # 오디오 1초당 추가 지연 시간 (ms)
+    SYNTHETIC_LATENCY_SIGMA: float = 0.2  # 지연 시간 로그정규 분포 sigma (0이면 고정)
+    SYNTHETIC_SEED: int = 0  # 지연 시간/출력 난수 시드
     
     # Transcribe 매개변수 설정
     TRANSCRIBE_PARAMS: Dict[str, Any] = {
@@ -38,16 +45,79 @@ class Settings(BaseSettings):
         }
     }
     
+    # 스트리밍 모드 (슬라이딩 윈도우) 설정
+    STREAMING_HOP_SECONDS: float = 2.0  # 새 오디오가 이만큼 쌓일 때마다 윈도우 재추론
+    STREAMING_MAX_WINDOW_SECONDS: float = 10.0  # 확정 없이 이 길이를 넘으면 강제 확정
+    STREAMING_PROMPT_CHARS: int = 200  # 초기 프롬프트로 사용할 확정 텍스트 길이
+    
+    # batch 모드 발화 구간 검출 (에너지 기반 endpointing) 설정
+    # 발화 판정 기준은 시나리오별 SCENARIO_VAD_PARAMS (threshold, min_speech/min_silence_duration_ms)
+    ENDPOINTING_ENABLED: bool = True  # 꺼지면 DEFAULT_BUFFER_SIZE마다 고정 길이로 절단
+    ENDPOINT_FRAME_MS: int = 20  # 에너지 계산 프레임 길이 (ms)
+    ENDPOINT_SNR_RANGE_DB: float = 20.0  # 잡음 하한보다 이만큼 큰 프레임을 음성 점수 1로 봄 (threshold와 비교)
+    ENDPOINT_MIN_SPEECH_DBFS: float = -50.0  # 이보다 작은 프레임은 항상 무음으로 판정
+    ENDPOINT_PADDING_MS: int = 200  # 발화 앞뒤로 남기는 무음 길이 (ms)
+    ENDPOINT_MIN_WINDOW_SECONDS: float = 3.0  # 이보다 짧은 발화는 다음 발화와 합쳐서 추론
+    ENDPOINT_FLUSH_SILENCE_MS: int = 1500  # 발화 후 무음이 이만큼 이어지면 최소 길이와 관계없이 절단 (ms)
+    ENDPOINT_PAUSE_MS: int = 100  # 최대 길이 절단 시 단어 경계로 사용할 최소 쉼 길이 (ms)
+    
+    # 추론 전 무음 윈도우 게이트 (무음이면 추론/감정분석 대신 silence 메시지 전송)
+    SILENCE_GATE_ENABLED: bool = True
+    SILENCE_GATE_RMS_DBFS: float = -50.0  # 윈도우 전체 RMS가 이보다 작으면 무음
+    SILENCE_GATE_FRAME_DBFS: float = -40.0  # 이보다 큰 20ms 프레임을 활성 프레임으로 봄
+    # 활성 프레임 합계가 시나리오 min_speech_duration_ms보다 짧으면 무음
+    SILENCE_GATE_USE_VAD: bool = False  # 에너지 게이트를 통과한 윈도우를 Silero VAD로 한 번 더 확인
+    
     # 임시 파일 저장 경로
     TEMP_AUDIO_DIR: str = "/tmp/stt_audio"
     
     # 다른 서비스 연동을 위한 API 엔드포인트
-    EMOTION_ANALYSIS_API: Optional[str] = None
+    EMOTION_ANALYSIS_API: str = "http://localhost:8001"
     SPEAKER_DIARIZATION_API: Optional[str] = None
     
+    # 감정분석 서비스 HTTP 클라이언트 (연결 풀) 설정
+    EMOTION_CLIENT_MAX_CONNECTIONS: int = 100  # 최대 동시 연결 수
+    EMOTION_CLIENT_MAX_KEEPALIVE: int = 50  # 유지할 keep-alive 연결 수
+    EMOTION_CLIENT_KEEPALIVE_EXPIRY: float = 30.0  # 유휴 연결 유지 시간 (초)
+    EMOTION_CLIENT_TIMEOUT: float = 30.0  # 요청 타임아웃 (초)
+    EMOTION_CLIENT_CONNECT_TIMEOUT: float = 5.0  # 연결 타임아웃 (초)
+    EMOTION_CLIENT_HTTP2: bool = False  # HTTP/2 사용 여부 (h2 패키지 필요)
+    # 전사 결과 전송 전 감정분석 결과를 기다리는 최대 시간 (ms, 넘으면 후속 메시지로 전송)
+    EMOTION_MERGE_DEADLINE_MS: int = 200
+    
     # 시스템 리소스 제한
     MAX_WORKERS: int = 4  # 병렬 작업자 수
     MAX_AUDIO_BUFFER_MB: int = 15  # 최대 오디오 버퍼 크기(MB)
+    # 세션별 링 버퍼 용량 (30초 분량, MAX_AUDIO_BUFFER_MB를 넘지 않음)
+    AUDIO_RING_BUFFER_SIZE: int = 16000 * 2 * 30
+    AUDIO_OVERFLOW_NOTIFY_INTERVAL_SECONDS: float = 1.0  # 링 버퍼 용량 초과로 오디오를 버렸을 때 클라이언트 알림 최소 간격 (초)
+    
+    # 세션 간 동적 배치 추론 설정
+    INFERENCE_MAX_BATCH_SIZE: int = 8  # 한 번에 묶을 최대 윈도우 수
+    INFERENCE_MAX_WAIT_MS: int = 50  # 배치를 채우기 위해 기다리는 최대 시간 (ms)
+    # 초기 프롬프트(이전 인식 결과)가 있는 윈도우도 배치로 묶을지 여부
+    # 묶인 윈도우는 프롬프트 없이 디코딩하고, 혼자 실행되는 윈도우는 프롬프트를 그대로 사용 (False면 프롬프트가 있으면 항상 단독 실행)
+    INFERENCE_BATCH_PROMPTED_WINDOWS: bool = True
+    # 추론 대기열 제어 (추론 스레드 수는 MAX_WORKERS, 스레드당 CPU_THREADS)
+    INFERENCE_MAX_PENDING: int = 32  # 실행 대기 중인 윈도우 최대 개수
+    INFERENCE_QUEUE_TIMEOUT_SECONDS: float = 10.0  # 실행 전 최대 대기 시간 (넘으면 거절)
+    INFERENCE_OVERLOAD_POLICY: str = "drop_oldest"  # 과부하 정책 (drop_oldest, drop_newest, coalesce: 새 윈도우를 거절하고 세션이 다음 윈도우와 합쳐 처리)
+    # 추론 워커 프로세스 풀 (0이면 서버 프로세스 안에서 추론, N이면 모델 복제본을 가진 N개 프로세스에서 추론)
+    # 워커를 쓰면 동시 배치 수는 워커 수, 워커당 CTranslate2 스레드는 INFERENCE_THREADS_PER_WORKER
+    INFERENCE_WORKER_PROCESSES: int = 0  # 워커 프로세스 수
+    INFERENCE_THREADS_PER_WORKER: int = 4  # 워커당 CPU 스레드 수
+    INFERENCE_WORKER_START_TIMEOUT_SECONDS: float = 600.0  # 워커 모델 로딩 대기 시간 (초, 워밍업 포함)
+    # 워커로 넘기는 세션 오디오 윈도우용 공유 메모리 슬랩 (16-bit PCM, 워커를 쓸 때만 생성)
+    AUDIO_SLAB_SECONDS: float = 15.0  # 슬랩 하나의 길이 (초, 더 긴 윈도우는 워커 입력 버퍼로 전달)
+    AUDIO_SLAB_COUNT: int = 64  # 슬랩 수 (모두 사용 중이면 워커 입력 버퍼로 전달)
+    
+    # 시작 시 워밍업 (준비 상태 보고 전에 대표 입력으로 추론해 첫 요청의 메모리 할당/커널 선택 비용을 미리 치름)
+    WARMUP_ENABLED: bool = True
+    WARMUP_AUDIO_SECONDS: List[float] = [1.0, 5.0, 15.0]  # 워밍업 오디오 길이 (초)
+    WARMUP_BEAM_SIZES: List[int] = [5, 10]  # 워밍업 빔 크기 (발표/소개팅 5, 면접 10)
+    
+    # 메트릭 라벨에 그대로 쓰는 언어 코드 (그 밖의 값과 SCENARIO_VAD_PARAMS에 없는 시나리오는 other로 묶음)
+    METRIC_LANGUAGES: List[str] = ["ko", "en", "ja", "zh"]
     
     # 시나리오별 VAD 파라미터 (음성 감지 민감도)
     SCENARIO_VAD_PARAMS: Dict[str, Dict[str, Any]] = {
@@ -1,6 +1,9 @@
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
-from typing import Optional
+from typing import Dict, Optional, Tuple
 import os
 
 # 로그 포맷 설정
@@ -9,39 +12,110 @@ FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 # 로그 레벨 설정
 LOG_LEVEL = logging.INFO
 
+# 프레임 단위 로그를 같은 위치에서 다시 기록하기까지의 최소 간격 (초)
+FRAME_LOG_INTERVAL = 1.0
+
 # 로그 디렉토리 설정
 LOG_DIR = "logs"
 os.makedirs(LOG_DIR, exist_ok=True)
 
 
+class LazyQueueHandler(logging.handlers.QueueHandler):
+    """
+    레코드를 그대로 큐에 넣는 QueueHandler
+
+    기본 QueueHandler.prepare는 호출 스레드에서 메시지를 포맷팅하므로,
+    같은 프로세스의 리스너만 사용하는 경우 포맷팅까지 리스너 스레드로 미룬다.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    같은 호출 위치(파일, 줄)의 로그를 interval초에 한 번만 통과시키는 필터
+
+    생략된 건수는 다음으로 통과하는 레코드 메시지 끝에 덧붙인다.
+    """
+
+    def __init__(self, interval: float = FRAME_LOG_INTERVAL) -> None:
+        super().__init__()
+        self.interval = interval
+        self._last_emitted: Dict[Tuple[str, int], float] = {}
+        self._suppressed: Dict[Tuple[str, int], int] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        key = (record.pathname, record.lineno)
+        last = self._last_emitted.get(key)
+        if last is not None and record.created - last < self.interval:
+            self._suppressed[key] = self._suppressed.get(key, 0) + 1
+            return False
+
+        self._last_emitted[key] = record.created
+        suppressed = self._suppressed.pop(key, 0)
+        if suppressed:
+            record.msg = f"{record.msg} (직전 {self.interval:g}초간 {suppressed}건 생략)"
+        return True
+
+
 def setup_logger(name: str, log_file: Optional[str] = None, level: int = LOG_LEVEL) -> logging.Logger:
     """
     로거 설정 함수
-    
+
+    로거에는 큐 핸들러만 붙이고, 실제 콘솔/파일 출력은 QueueListener 스레드에서 수행하여
+    이벤트 루프가 I/O로 막히지 않도록 한다.
+
     Args:
         name: 로거 이름
         log_file: 로그 파일 경로 (None이면 파일 출력 안함)
         level: 로깅 레벨
-        
+
     Returns:
         설정된 로거 객체
     """
     logger = logging.getLogger(name)
     logger.setLevel(level)
-    
+
     # 콘솔 핸들러 설정
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(logging.Formatter(FORMAT))
-    logger.addHandler(console_handler)
-    
+    handlers = [console_handler]
+
     # 파일 핸들러 설정 (옵션)
     if log_file:
         file_handler = logging.FileHandler(os.path.join(LOG_DIR, log_file))
         file_handler.setFormatter(logging.Formatter(FORMAT))
-        logger.addHandler(file_handler)
-    
+        handlers.append(file_handler)
+
+    # 큐 핸들러 + 백그라운드 리스너 (종료 시 남은 로그 flush)
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(LazyQueueHandler(log_queue))
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
     return logger
 
 
+def setup_frame_logger(parent: logging.Logger, interval: float = FRAME_LOG_INTERVAL) -> logging.Logger:
+    """
+    오디오 프레임 단위 로그용 하위 로거 설정
+
+    호출 위치별로 interval초에 한 번만 기록되며, 부모 로거의 큐 핸들러로 전달된다.
+
+    Args:
+        parent: 부모 로거
+        interval: 같은 위치의 로그 사이 최소 간격 (초)
+
+    Returns:
+        속도 제한 필터가 적용된 로거 객체
+    """
+    frame_logger = parent.getChild("frames")
+    frame_logger.addFilter(RateLimitFilter(interval))
+    return frame_logger
+
+
 # 기본 로거 설정
-logger = setup_logger("stt_service", "stt_service.log") 
\ No newline at end of file
+logger = setup_logger("stt_service", "stt_service.log")
+frame_logger = setup_frame_logger(logger)
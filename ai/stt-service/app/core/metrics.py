@@ -0,0 +1,157 @@
+from typing import Optional, Tuple
+
+from prometheus_client import CONTENT_TYPE_LATEST, Counter, Gauge, Histogram, generate_latest
+
+from app.core.config import settings
+
+# 모든 메트릭 공통 라벨 (값은 metric_labels로 정규화)
+LABELS = ("scenario", "language")
+OTHER_LABEL = "other"
+
+# 추론 지연 시간 (배치 실행 시간, 초)
+INFERENCE_LATENCY = Histogram(
+    "stt_inference_latency_seconds",
+    "STT 모델 추론 시간",
+    LABELS,
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2, 5, 10, 30)
+)
+
+# 스케줄러 대기열 대기 시간 (초)
+QUEUE_WAIT = Histogram(
+    "stt_queue_wait_seconds",
+    "추론 스케줄러 대기열 대기 시간",
+    LABELS,
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5)
+)
+
+# 요청별 처리한 오디오 길이 (초, 합계는 누적 처리 시간)
+AUDIO_SECONDS = Histogram(
+    "stt_audio_processed_seconds",
+    "추론 요청별 오디오 길이",
+    LABELS,
+    buckets=(0.5, 1, 2, 5, 10, 15, 30, 60, 120)
+)
+
+# 실시간 배율 (추론 시간 / 오디오 길이)
+REAL_TIME_FACTOR = Histogram(
+    "stt_real_time_factor",
+    "추론 시간 대비 오디오 길이 비율",
+    LABELS,
+    buckets=(0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1, 2)
+)
+
+# 감정분석 서비스 호출 지연 시간 (초)
+EMOTION_CALL_LATENCY = Histogram(
+    "stt_emotion_call_latency_seconds",
+    "감정분석 서비스 호출 시간",
+    LABELS,
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+)
+
+# WebSocket 오디오 프레임 크기 (bytes)
+WEBSOCKET_FRAME_BYTES = Histogram(
+    "stt_websocket_frame_bytes",
+    "수신한 WebSocket 오디오 프레임 크기",
+    LABELS,
+    buckets=(320, 640, 1280, 2560, 4096, 8192, 16384, 32768, 65536)
+)
+
+# 활성 WebSocket 세션 수
+ACTIVE_SESSIONS = Gauge(
+    "stt_active_sessions",
+    "연결된 WebSocket 세션 수",
+    LABELS
+)
+
+# 실행 중인 추론 요청 수
+INFERENCE_IN_FLIGHT = Gauge(
+    "stt_inference_in_flight",
+    "모델에서 실행 중인 추론 요청 수",
+    LABELS
+)
+
+
+# 윈도우 처리 단계별 소요 시간 (초)
+STAGE_LATENCY = Histogram(
+    "stt_stage_latency_seconds",
+    "WebSocket 윈도우 처리 단계별 소요 시간 (buffering, queue_wait, inference, metrics, emotion, emotion_wait, total)",
+    ("stage",) + LABELS,
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 15, 30)
+)
+
+
+# 발화 구간 검출로 추론 전에 버린 무음 길이 (초)
+ENDPOINT_SKIPPED_SECONDS = Counter(
+    "stt_endpoint_skipped_audio_seconds",
+    "발화 구간 검출로 추론 전에 버린 무음 오디오 길이",
+    LABELS
+)
+
+# 절단 이유별 윈도우 수
+ENDPOINT_WINDOWS = Counter(
+    "stt_endpoint_windows",
+    "발화 구간 검출 윈도우 절단 횟수 (silence, max_length, final)",
+    ("reason",) + LABELS
+)
+
+
+# 무음 게이트로 추론을 생략한 윈도우 수
+SILENCE_GATE_WINDOWS = Counter(
+    "stt_silence_gate_windows",
+    "무음으로 판정되어 추론을 생략한 윈도우 수",
+    LABELS
+)
+
+# 무음 게이트로 추론을 생략한 오디오 길이 (초)
+SILENCE_GATE_AUDIO_SECONDS = Counter(
+    "stt_silence_gate_audio_seconds",
+    "무음으로 판정되어 추론을 생략한 오디오 길이",
+    LABELS
+)
+
+# 무음 게이트로 절약한 추정 추론 시간 (초, 오디오 길이 x 최근 실시간 배율)
+SILENCE_GATE_SAVED_INFERENCE_SECONDS = Counter(
+    "stt_silence_gate_saved_inference_seconds",
+    "무음 게이트로 절약한 추정 추론 시간",
+    LABELS
+)
+
+
+# 비정상 종료 후 다시 시작한 추론 워커 프로세스 수
+INFERENCE_WORKER_RESTARTS = Counter(
+    "stt_inference_worker_restarts",
+    "비정상 종료 후 다시 시작한 추론 워커 프로세스 수",
+    ("worker",)
+)
+
+
+# 시작 시 워밍업 추론에 걸린 시간 (초, 워커 풀이면 가장 오래 걸린 워커 기준)
+WARMUP_SECONDS = Gauge(
+    "stt_warmup_seconds",
+    "시작 시 워밍업 추론에 걸린 시간"
+)
+
+# 프로세스 시작 후 첫 추론 요청 처리 시간 (초, 워밍업 여부별)
+FIRST_REQUEST_LATENCY = Gauge(
+    "stt_first_request_latency_seconds",
+    "프로세스 시작 후 첫 추론 요청 처리 시간",
+    ("warmed_up",)
+)
+
+
+def metric_labels(scenario: str, language: Optional[str]) -> Tuple[str, str]:
+    """
+    메트릭 라벨 값 (시나리오, 언어)
+
+    라벨 값은 클라이언트 입력이므로 알려진 값만 그대로 쓰고 나머지는 other로 묶어
+    입력에 따라 시계열 수가 늘어나지 않게 한다.
+    """
+    return (
+        scenario if scenario in settings.SCENARIO_VAD_PARAMS else OTHER_LABEL,
+        language if language in settings.METRIC_LANGUAGES else ("auto" if language is None else OTHER_LABEL)
+    )
+
+
+def render_metrics() -> bytes:
+    """Prometheus 텍스트 형식으로 현재 메트릭 출력"""
+    return generate_latest()
@@ -0,0 +1,113 @@
+import json
+from typing import Any, Dict, FrozenSet, Optional, Union
+
+import msgpack
+from fastapi.responses import JSONResponse
+
+from app.core.config import settings
+from app.core.logging import logger
+
+try:
+    import orjson
+except ImportError:  # 미설치 시 표준 라이브러리 json으로 동작
+    orjson = None
+
+# 결과 메시지 인코딩 (WebSocket 연결 시 encoding 쿼리로 선택)
+# - json: 텍스트 프레임 (기본값)
+# - msgpack: 바이너리 프레임, 같은 구조를 MessagePack으로 인코딩
+ENCODINGS = ("json", "msgpack")
+
+# fields 선택자 그룹과 그룹에 속한 메시지 키
+# 어느 그룹에도 속하지 않는 키(type, segment_id, is_final, message 등)는 항상 포함된다.
+FIELD_GROUPS: Dict[str, tuple] = {
+    "text": ("text", "partial_text"),
+    "metrics": ("speech_metrics", "variability_metrics", "cumulative_metrics", "syllable_metrics", "pause_metrics", "pause_pattern"),
+    "segments": ("segments",),
+    "words": ("words",),
+    "emotion": ("emotion_analysis", "emotion_pending"),
+    "timing": ("timing",),
+}
+_GROUPED_KEYS = frozenset(key for keys in FIELD_GROUPS.values() for key in keys)
+
+# orjson 옵션: numpy 배열/스칼라와 문자열이 아닌 딕셔너리 키 허용
+ORJSON_OPTIONS = (orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS) if orjson is not None else 0
+
+if settings.JSON_SERIALIZER == "orjson" and orjson is None:
+    logger.warning("orjson 미설치 - 표준 라이브러리 json으로 직렬화합니다")
+
+
+def use_orjson() -> bool:
+    """orjson 빠른 경로 사용 여부"""
+    return settings.JSON_SERIALIZER == "orjson" and orjson is not None
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """
+    JSON 직렬화 (UTF-8 bytes, 한글은 이스케이프하지 않음)
+
+    orjson은 bytes로 바로 직렬화하며, 표준 라이브러리와 달리 NaN/Infinity를 null로 출력한다.
+
+    Args:
+        obj: 직렬화할 객체
+
+    Returns:
+        JSON bytes
+    """
+    if use_orjson():
+        return orjson.dumps(obj, option=ORJSON_OPTIONS)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """REST 기본 응답 클래스 (orjson 사용 가능하면 orjson, 아니면 Starlette 기본 직렬화)"""
+
+    def render(self, content: Any) -> bytes:
+        if use_orjson():
+            return orjson.dumps(content, option=ORJSON_OPTIONS)
+        return super().render(content)
+
+
+def parse_fields(fields: Optional[str]) -> Optional[FrozenSet[str]]:
+    """
+    fields 쿼리("text,metrics")를 제외할 메시지 키 집합으로 변환
+
+    Args:
+        fields: 쉼표로 구분한 그룹 이름 (None 또는 빈 문자열이면 전체)
+
+    Returns:
+        메시지에서 제외할 키 집합 (전체 포함이면 None)
+
+    Raises:
+        ValueError: 알 수 없는 그룹 이름
+    """
+    if not fields:
+        return None
+    groups = {group.strip() for group in fields.split(",") if group.strip()}
+    unknown = groups - FIELD_GROUPS.keys()
+    if unknown:
+        raise ValueError(f"알 수 없는 fields 그룹: {', '.join(sorted(unknown))}. 지원되는 그룹: {', '.join(FIELD_GROUPS)}")
+    selected = {key for group in groups for key in FIELD_GROUPS[group]}
+    return _GROUPED_KEYS - selected
+
+
+def select_fields(message: Dict[str, Any], excluded: Optional[FrozenSet[str]]) -> Dict[str, Any]:
+    """선택하지 않은 그룹의 키를 뺀 메시지 (excluded가 None이면 그대로 반환)"""
+    if not excluded:
+        return message
+    return {key: value for key, value in message.items() if key not in excluded}
+
+
+def encode_message(message: Dict[str, Any], encoding: str = "json") -> Union[str, bytes]:
+    """
+    결과 메시지 인코딩
+
+    Args:
+        message: 전송할 메시지
+        encoding: json(텍스트 프레임) 또는 msgpack(바이너리 프레임)
+
+    Returns:
+        json이면 str (dumps_bytes 결과를 UTF-8로 디코딩), msgpack이면 bytes
+    """
+    if encoding == "msgpack":
+        return msgpack.packb(message, use_bin_type=True)
+    return dumps_bytes(message).decode("utf-8")
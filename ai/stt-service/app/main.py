@@ -1,6 +1,6 @@
 import time
 import os
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 import uvicorn
@@ -9,8 +9,12 @@ import asyncio
 from app.api.api import api_router
 from app.core.config import settings
 from app.core.logging import logger
+from app.core.metrics import CONTENT_TYPE_LATEST, render_metrics
+from app.core.serialization import FastJSONResponse
 from app import __version__
 from app.services.stt_service import stt_processor
+from app.services.websocket_service import inference_scheduler
+from app.services.emotion_client import emotion_client
 
 # FastAPI 애플리케이션 생성
 app = FastAPI(
@@ -20,6 +24,7 @@ app = FastAPI(
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
     docs_url=f"{settings.API_V1_STR}/docs",
     redoc_url=f"{settings.API_V1_STR}/redoc",
+    default_response_class=FastJSONResponse,
 )
 
 # CORS 설정
@@ -54,25 +59,36 @@ async def add_process_time_header(request: Request, call_next):
 async def startup_event():
     logger.info(f"STT 서비스 시작 - 버전: {__version__}")
     
-    # 서버 시작 시 STT 모델 미리 로드
+    # 서버 시작 시 STT 모델 미리 로드 후 워밍업 (WARMUP_ENABLED, 끝나야 /ready가 200을 반환)
     try:
-        logger.info("서버 시작 시 STT 모델 사전 로딩 중...")
+        logger.info("서버 시작 시 STT 모델 사전 로딩 및 워밍업 중...")
         await stt_processor.load_model()
-        logger.info("STT 모델 사전 로딩 완료")
+        logger.info("STT 모델 사전 로딩 및 워밍업 완료")
     except Exception as e:
         logger.error(f"STT 모델 사전 로딩 실패: {str(e)}", exc_info=True)
         logger.warning("STT 모델 로딩 실패했지만 서버는 계속 실행됩니다. 첫 요청 시 다시 로드를 시도합니다.")
+    
+    # 감정분석 서비스 연결 풀 생성
+    await emotion_client.start()
 
 # 애플리케이션 종료 이벤트
 @app.on_event("shutdown")
 async def shutdown_event():
     logger.info("STT 서비스 종료")
+    await inference_scheduler.shutdown()
+    await stt_processor.shutdown()
+    await emotion_client.close()
 
 # 루트 엔드포인트
 @app.get("/")
 def read_root():
     return {"message": "STT 서비스에 오신 것을 환영합니다", "version": __version__}
 
+# Prometheus 메트릭 엔드포인트
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    return Response(render_metrics(), media_type=CONTENT_TYPE_LATEST)
+
 
 if __name__ == "__main__":
     # 개발 서버 실행
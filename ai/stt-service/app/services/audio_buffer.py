@@ -0,0 +1,129 @@
+from typing import Optional
+import numpy as np
+
+from app.core.logging import logger
+
+
+class AudioRingBuffer:
+    """
+    세션별 고정 용량 int16 링 버퍼
+
+    웹소켓으로 들어오는 16-bit PCM 프레임을 미리 할당된 배열에 한 번만 복사하고,
+    처리 시에는 복사 없이 NumPy 뷰(view)를 돌려준다.
+    `len()`은 기존 bytearray 버퍼와 동일하게 바이트 단위로 동작한다.
+    """
+
+    def __init__(self, capacity_bytes: int) -> None:
+        """
+        링 버퍼 초기화
+
+        Args:
+            capacity_bytes: 버퍼 용량 (bytes, 2바이트 단위로 내림)
+        """
+        self.capacity = max(capacity_bytes // 2, 1)  # 샘플 단위 용량
+        self._data = np.zeros(self.capacity, dtype=np.int16)
+        # 경계를 넘는 구간을 읽을 때만 사용하는 보조 배열
+        self._scratch: Optional[np.ndarray] = None
+        self._head = 0  # 읽기 시작 위치 (샘플)
+        self._size = 0  # 저장된 샘플 수
+        self._carry = b""  # 홀수 길이 프레임에서 남은 1바이트
+        self.dropped_samples = 0  # 용량 초과로 버려진 샘플 수
+        self.bytes_written = 0  # 링 버퍼에 복사된 누적 바이트 수
+
+    def __len__(self) -> int:
+        """저장된 데이터 크기 (bytes)"""
+        return self._size * 2 + len(self._carry)
+
+    @property
+    def num_samples(self) -> int:
+        """저장된 샘플 수"""
+        return self._size
+
+    def write(self, data: bytes) -> None:
+        """
+        PCM 바이트 데이터 추가
+
+        용량을 초과하면 가장 오래된 샘플부터 덮어쓴다.
+        버려진 양은 dropped_samples에 누적되며, 호출자가 이를 보고 클라이언트에 알린다.
+
+        Args:
+            data: 16-bit PCM 바이트 데이터
+        """
+        if self._carry:
+            data = self._carry + data
+            self._carry = b""
+        if len(data) % 2:
+            self._carry = data[-1:]
+            data = data[:-1]
+        if not data:
+            return
+
+        samples = np.frombuffer(data, dtype=np.int16)
+        count = len(samples)
+
+        # 용량보다 큰 입력은 뒷부분만 유지
+        if count > self.capacity:
+            self.dropped_samples += count - self.capacity
+            samples = samples[-self.capacity:]
+            count = self.capacity
+
+        # 공간이 부족하면 오래된 샘플을 버림
+        overflow = self._size + count - self.capacity
+        if overflow > 0:
+            self._head = (self._head + overflow) % self.capacity
+            self._size -= overflow
+            self.dropped_samples += overflow
+            logger.debug(f"오디오 링 버퍼 용량 초과: {overflow} 샘플 버림 (용량: {self.capacity} 샘플)")
+
+        tail = (self._head + self._size) % self.capacity
+        first = min(count, self.capacity - tail)
+        self._data[tail:tail + first] = samples[:first]
+        if first < count:
+            self._data[:count - first] = samples[first:]
+
+        self._size += count
+        self.bytes_written += count * 2
+
+    def peek(self, num_samples: Optional[int] = None) -> np.ndarray:
+        """
+        앞부분 샘플을 소비하지 않고 반환
+
+        구간이 버퍼 경계를 넘지 않으면 복사 없는 뷰를 반환하며,
+        경계를 넘는 경우에만 보조 배열로 한 번 복사한다.
+        반환된 배열은 다음 write() 전까지만 유효하다.
+
+        Args:
+            num_samples: 읽을 샘플 수 (None이면 전체)
+
+        Returns:
+            int16 샘플 배열
+        """
+        n = self._size if num_samples is None else min(num_samples, self._size)
+        end = self._head + n
+        if end <= self.capacity:
+            return self._data[self._head:end]
+
+        if self._scratch is None:
+            self._scratch = np.empty(self.capacity, dtype=np.int16)
+        first = self.capacity - self._head
+        self._scratch[:first] = self._data[self._head:]
+        self._scratch[first:n] = self._data[:n - first]
+        return self._scratch[:n]
+
+    def consume(self, num_samples: int) -> None:
+        """
+        앞부분 샘플 제거
+
+        Args:
+            num_samples: 제거할 샘플 수
+        """
+        n = min(num_samples, self._size)
+        self._size -= n
+        # 비워지면 처음 위치로 되돌려 다음 구간이 경계를 넘지 않도록 함
+        self._head = 0 if self._size == 0 else (self._head + n) % self.capacity
+
+    def clear(self) -> None:
+        """버퍼 초기화"""
+        self._head = 0
+        self._size = 0
+        self._carry = b""
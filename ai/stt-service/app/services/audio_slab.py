@@ -0,0 +1,146 @@
+from collections import Counter
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from app.core.config import settings
+from app.core.logging import logger
+
+
+class AudioSlab:
+    """공유 메모리 슬랩 하나에 쓴 윈도우 (워커에는 샘플 위치와 길이만 전달)"""
+
+    __slots__ = ("allocator", "index", "offset", "length", "session_id", "released")
+
+    def __init__(self, allocator: "AudioSlabAllocator", index: int, length: int, session_id: Optional[str]) -> None:
+        self.allocator = allocator
+        self.index = index
+        self.offset = index * allocator.slab_samples  # 공유 메모리 안의 시작 위치 (int16 샘플)
+        self.length = length
+        self.session_id = session_id
+        self.released = False
+
+    def __len__(self) -> int:
+        return self.length
+
+    def release(self) -> None:
+        """슬랩 반환 (여러 번 호출해도 한 번만 반환)"""
+        self.allocator.release(self)
+
+
+class AudioSlabAllocator:
+    """
+    세션 오디오 윈도우용 공유 메모리 슬랩 할당기
+
+    공유 메모리 하나를 AUDIO_SLAB_SECONDS 길이(16-bit PCM)의 고정 크기 슬랩으로 나누고,
+    윈도우를 자를 때 링 버퍼의 PCM을 빈 슬랩에 한 번 복사한다.
+    워커 프로세스는 같은 공유 메모리를 붙여 (위치, 길이)로 읽으므로 오디오가 파이프를 지나지 않는다.
+
+    슬랩은 추론 요청이 스케줄러를 떠날 때(결과 반환, 과부하 거절, 취소, 세션 종료) 반환된다.
+    빈 슬랩이 없거나 윈도우가 슬랩보다 길면 None을 반환하며, 호출자는 float32 배열 경로를 사용한다.
+    이벤트 루프 스레드에서만 호출한다.
+    """
+
+    def __init__(
+        self,
+        slab_count: int = settings.AUDIO_SLAB_COUNT,
+        slab_seconds: float = settings.AUDIO_SLAB_SECONDS,
+    ) -> None:
+        """
+        공유 메모리 생성 후 슬랩 초기화
+
+        Args:
+            slab_count: 슬랩 수
+            slab_seconds: 슬랩 하나의 길이 (초)
+        """
+        self.slab_count = max(slab_count, 1)
+        self.slab_samples = int(slab_seconds * settings.SAMPLE_RATE)
+        self._memory = SharedMemory(create=True, size=self.slab_count * self.slab_samples * 2)
+        self._samples = np.ndarray((self.slab_count * self.slab_samples,), dtype=np.int16, buffer=self._memory.buf)
+        # 최근에 반환된 슬랩부터 다시 사용 (캐시에 남아 있을 가능성이 높음)
+        self._free: List[int] = list(range(self.slab_count - 1, -1, -1))
+        self._in_use: Dict[int, AudioSlab] = {}
+
+        # 통계
+        self.allocations = 0
+        self.releases = 0
+        self.peak_in_use = 0
+        self.fallbacks: Counter = Counter()  # 슬랩을 쓰지 못한 사유별 윈도우 수 (exhausted, oversize)
+
+    @property
+    def name(self) -> str:
+        """워커 프로세스가 붙을 공유 메모리 이름"""
+        return self._memory.name
+
+    @property
+    def in_use(self) -> int:
+        """사용 중인 슬랩 수"""
+        return len(self._in_use)
+
+    def write(self, pcm: np.ndarray, session_id: Optional[str] = None) -> Optional[AudioSlab]:
+        """
+        16-bit PCM 윈도우를 빈 슬랩에 복사
+
+        Args:
+            pcm: int16 오디오 배열 (링 버퍼 뷰 가능, 호출 즉시 복사)
+            session_id: 윈도우를 보낸 세션 ID (세션 종료 시 일괄 반환)
+
+        Returns:
+            슬랩 (빈 슬랩이 없거나 윈도우가 슬랩보다 길면 None)
+        """
+        if self._samples is None:
+            return None
+        if len(pcm) > self.slab_samples:
+            self.fallbacks["oversize"] += 1
+            return None
+        if not self._free:
+            self.fallbacks["exhausted"] += 1
+            return None
+
+        slab = AudioSlab(self, self._free.pop(), len(pcm), session_id)
+        self._samples[slab.offset:slab.offset + slab.length] = pcm
+        self._in_use[slab.index] = slab
+        self.allocations += 1
+        self.peak_in_use = max(self.peak_in_use, len(self._in_use))
+        return slab
+
+    def view(self, slab: AudioSlab) -> np.ndarray:
+        """슬랩에 쓴 윈도우의 int16 뷰"""
+        return self._samples[slab.offset:slab.offset + slab.length]
+
+    def release(self, slab: AudioSlab) -> None:
+        """슬랩 반환 (이미 반환했거나 할당기가 닫혔으면 무시)"""
+        if slab.released:
+            return
+        slab.released = True
+        if self._in_use.pop(slab.index, None) is slab:
+            self._free.append(slab.index)
+            self.releases += 1
+
+    def session_slabs(self, session_id: str) -> List[AudioSlab]:
+        """세션이 사용 중인 슬랩 목록"""
+        return [slab for slab in self._in_use.values() if slab.session_id == session_id]
+
+    def close(self) -> None:
+        """공유 메모리 해제 (워커 종료 후 호출)"""
+        if self._samples is None:
+            return
+        if self._in_use:
+            logger.warning(f"반환되지 않은 오디오 슬랩 {len(self._in_use)}개와 함께 공유 메모리를 해제합니다")
+        self._in_use.clear()
+        self._samples = None
+        self._memory.close()
+        self._memory.unlink()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """슬랩 사용량, 할당/반환 횟수, 슬랩을 쓰지 못한 윈도우 수"""
+        return {
+            "slab_count": self.slab_count,
+            "slab_seconds": round(self.slab_samples / settings.SAMPLE_RATE, 2),
+            "in_use": self.in_use,
+            "peak_in_use": self.peak_in_use,
+            "allocations": self.allocations,
+            "releases": self.releases,
+            "fallbacks": dict(self.fallbacks),
+        }
@@ -0,0 +1,148 @@
+import asyncio
+import time
+from collections import deque
+from typing import Any, Dict, Optional
+
+import httpx
+
+from app.core.config import settings
+from app.core.logging import logger
+from app.core.metrics import EMOTION_CALL_LATENCY, metric_labels
+
+
+class EmotionAnalysisClient:
+    """
+    감정분석 서비스 HTTP 클라이언트
+
+    애플리케이션 수명 동안 하나의 연결 풀(keep-alive)을 공유하여
+    윈도우마다 TCP 연결과 클라이언트를 새로 만드는 비용을 없앤다.
+    """
+
+    ANALYZE_PATH = "/api/v1/emotion/analyze_bytes"
+
+    def __init__(self) -> None:
+        self._client: Optional[httpx.AsyncClient] = None
+        self.latencies = deque(maxlen=1000)  # 최근 호출 지연 시간 (초)
+        self.total_calls = 0
+        self.failed_calls = 0
+        self.cancelled_calls = 0  # 결과를 기다리던 윈도우 처리가 취소된 호출 (지연 시간 통계에서 제외)
+
+    async def start(self) -> None:
+        """연결 풀 생성 (앱 시작 시 호출)"""
+        if self._client is not None:
+            return
+
+        limits = httpx.Limits(
+            max_connections=settings.EMOTION_CLIENT_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.EMOTION_CLIENT_MAX_KEEPALIVE,
+            keepalive_expiry=settings.EMOTION_CLIENT_KEEPALIVE_EXPIRY
+        )
+        timeout = httpx.Timeout(
+            settings.EMOTION_CLIENT_TIMEOUT,
+            connect=settings.EMOTION_CLIENT_CONNECT_TIMEOUT
+        )
+        http2 = settings.EMOTION_CLIENT_HTTP2
+        try:
+            self._client = httpx.AsyncClient(base_url=settings.EMOTION_ANALYSIS_API, limits=limits, timeout=timeout, http2=http2)
+        except ImportError:
+            # h2 패키지가 없으면 HTTP/1.1 keep-alive로 동작
+            logger.warning("HTTP/2 사용 불가 (h2 미설치) - HTTP/1.1 keep-alive로 감정분석 서비스에 연결합니다")
+            http2 = False
+            self._client = httpx.AsyncClient(base_url=settings.EMOTION_ANALYSIS_API, limits=limits, timeout=timeout)
+
+        logger.info(
+            f"감정분석 클라이언트 시작 - 주소: {settings.EMOTION_ANALYSIS_API}, "
+            f"최대 연결: {settings.EMOTION_CLIENT_MAX_CONNECTIONS}, HTTP/2: {http2}"
+        )
+
+    async def close(self) -> None:
+        """연결 풀 종료 (앱 종료 시 호출)"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            logger.info("감정분석 클라이언트 종료")
+
+    async def analyze(self, audio_bytes: bytes, scenario: str, language: str) -> Optional[Dict[str, Any]]:
+        """
+        감정분석 서비스 호출
+
+        Args:
+            audio_bytes: 16-bit PCM 오디오 바이너리 데이터
+            scenario: 시나리오 (dating, interview, presentation)
+            language: 언어 코드
+
+        Returns:
+            감정분석 결과 또는 None (실패 시)
+        """
+        if self._client is None:
+            await self.start()
+
+        params = {
+            "scenario": scenario,
+            "language": language,
+            "apply_scenario_weights": True,
+            "top_k": 6  # 모든 감정 반환 (6개 모든 감정 라벨)
+        }
+
+        self.total_calls += 1
+        start_time = time.perf_counter()
+        cancelled = False
+        try:
+            response = await self._client.post(
+                self.ANALYZE_PATH,
+                content=audio_bytes,
+                params=params,
+                headers={"Content-Type": "application/octet-stream"}
+            )
+
+            if response.status_code == 200:
+                emotion_result = response.json()
+                logger.debug(f"감정분석 완료 - 주 감정: {emotion_result['primary_emotion']['emotion_kr']} ({emotion_result['primary_emotion']['probability']:.3f})")
+                return emotion_result
+
+            logger.warning(f"감정분석 서비스 오류: HTTP {response.status_code}")
+            self.failed_calls += 1
+            return None
+
+        except asyncio.CancelledError:
+            cancelled = True
+            self.cancelled_calls += 1
+            raise
+        except httpx.TimeoutException:
+            logger.warning("감정분석 서비스 호출 시간 초과")
+        except httpx.ConnectError:
+            logger.warning(f"감정분석 서비스에 연결할 수 없습니다 ({settings.EMOTION_ANALYSIS_API})")
+        except Exception as e:
+            logger.warning(f"감정분석 서비스 호출 중 오류: {str(e)}")
+        finally:
+            # 완료되거나 실패한 호출만 기록 (취소 시점까지의 시간은 호출 지연 시간이 아님)
+            if not cancelled:
+                elapsed = time.perf_counter() - start_time
+                self.latencies.append(elapsed)
+                EMOTION_CALL_LATENCY.labels(*metric_labels(scenario, language)).observe(elapsed)
+
+        self.failed_calls += 1
+        return None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """호출 수, 실패 수, 취소 수, 지연 시간 통계"""
+        latencies = sorted(self.latencies)
+
+        def percentile(p: float) -> float:
+            return round(latencies[min(int(len(latencies) * p), len(latencies) - 1)] * 1000, 2) if latencies else 0
+
+        return {
+            "total_calls": self.total_calls,
+            "failed_calls": self.failed_calls,
+            "cancelled_calls": self.cancelled_calls,
+            "latency_ms": {
+                "p50": percentile(0.5),
+                "p95": percentile(0.95),
+                "p99": percentile(0.99),
+                "max": round(latencies[-1] * 1000, 2) if latencies else 0,
+            },
+        }
+
+
+# 싱글톤 인스턴스 생성
+emotion_client = EmotionAnalysisClient()
@@ -0,0 +1,269 @@
+import math
+from collections import Counter, deque
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from app.core.config import settings
+from app.core.metrics import ENDPOINT_SKIPPED_SECONDS, ENDPOINT_WINDOWS, metric_labels
+
+# 잡음 하한 추적 (dBFS): 더 작은 프레임에는 즉시 맞추고, 큰 프레임에는 천천히 따라감
+NOISE_FLOOR_INITIAL_DBFS = -60.0
+NOISE_FLOOR_MIN_DBFS = -90.0
+NOISE_FLOOR_RISE = 0.002  # 프레임당 상승 비율 (20ms 프레임에서 시간 상수 약 10초)
+
+
+def frame_levels(samples: np.ndarray, frame_samples: int, full_scale: float = 32768.0) -> np.ndarray:
+    """
+    고정 길이 프레임별 RMS 레벨 (dBFS, 마지막 불완전 프레임은 제외)
+
+    Args:
+        samples: 오디오 샘플 (int16이면 full_scale=32768, [-1, 1] float이면 1.0)
+        frame_samples: 프레임 길이 (샘플)
+        full_scale: 0 dBFS에 해당하는 진폭
+
+    Returns:
+        프레임별 레벨 배열
+    """
+    n_frames = len(samples) // frame_samples
+    frames = samples[:n_frames * frame_samples].reshape(n_frames, frame_samples).astype(np.float32)
+    rms = np.sqrt(np.mean(frames * frames, axis=1)) / full_scale
+    return 20 * np.log10(rms + 1e-10)
+
+
+class EnergyEndpointer:
+    """
+    세션별 스트리밍 에너지 기반 발화 구간 검출기 (batch 모드)
+
+    수신 프레임을 ENDPOINT_FRAME_MS 단위로 나눠 RMS 레벨(dBFS)을 계산하고,
+    잡음 하한 대비 SNR을 0~1 점수로 바꿔 시나리오별 VAD threshold와 비교한다.
+    min_speech_duration_ms 이상 이어진 음성은 발화 시작, min_silence_duration_ms 이상 이어진 무음은 발화 끝으로 본다.
+
+    모든 위치는 링 버퍼 앞부분을 0으로 하는 샘플 인덱스이며, 버퍼를 소비할 때 consume()으로 함께 옮긴다.
+    """
+
+    def __init__(self, vad_params: Dict[str, Any], frame_ms: int = settings.ENDPOINT_FRAME_MS) -> None:
+        """
+        검출기 초기화
+
+        Args:
+            vad_params: 시나리오별 VAD 매개변수 (threshold, min_speech_duration_ms, min_silence_duration_ms)
+            frame_ms: 에너지 계산 프레임 길이 (ms)
+        """
+        self.frame_ms = frame_ms
+        self.frame_samples = int(settings.SAMPLE_RATE * frame_ms / 1000)
+        self.threshold = vad_params.get("threshold", 0.7)
+        self.min_speech_frames = max(math.ceil(vad_params.get("min_speech_duration_ms", 250) / frame_ms), 1)
+        self.min_silence_frames = max(math.ceil(vad_params.get("min_silence_duration_ms", 700) / frame_ms), 1)
+        self.pause_frames = max(math.ceil(settings.ENDPOINT_PAUSE_MS / frame_ms), 1)
+        self.padding = int(settings.ENDPOINT_PADDING_MS * settings.SAMPLE_RATE / 1000)
+        self.min_window = int(settings.ENDPOINT_MIN_WINDOW_SECONDS * settings.SAMPLE_RATE)
+        self.dropped_samples_seen = 0  # 링 버퍼 용량 초과로 버려진 샘플 수 (반영 완료분)
+        self.noise_floor = NOISE_FLOOR_INITIAL_DBFS  # 잡음 하한 (dBFS)
+        self.reset()
+
+    def reset(self) -> None:
+        """버퍼를 비울 때 검출 상태 초기화 (잡음 하한은 유지)"""
+        self._carry = b""  # 홀수 길이 프레임에서 남은 1바이트
+        self._pending = np.empty(0, dtype=np.int16)  # 분석 프레임 하나에 못 미치는 샘플
+        self.position = 0  # 분석을 마친 샘플 수
+        self.speech_run = 0  # 연속 음성 프레임 수
+        self.silence_run = 0  # 마지막 음성 이후 연속 무음 프레임 수
+        self.in_speech = False
+        self.utterance_start: Optional[int] = None  # 윈도우 안 첫 발화 시작 위치
+        self.speech_end: Optional[int] = None  # 마지막 음성 프레임 끝 위치
+        self.pause_cut: Optional[int] = None  # 발화 중 가장 최근 쉼의 가운데 위치
+        self.endpoint_reached = False
+
+    @property
+    def has_speech(self) -> bool:
+        """현재 윈도우에 확인된 발화가 있는지 여부"""
+        return self.utterance_start is not None
+
+    def feed(self, data: bytes) -> None:
+        """
+        수신한 16-bit PCM 프레임 분석 (링 버퍼에 쓴 데이터와 같은 바이트)
+
+        Args:
+            data: 16-bit PCM 바이트 데이터
+        """
+        if self._carry:
+            data = self._carry + data
+            self._carry = b""
+        if len(data) % 2:
+            self._carry = data[-1:]
+            data = data[:-1]
+
+        samples = np.frombuffer(data, dtype=np.int16)
+        if len(self._pending):
+            samples = np.concatenate([self._pending, samples])
+        n_frames = len(samples) // self.frame_samples
+        self._pending = samples[n_frames * self.frame_samples:].copy()
+        if n_frames == 0:
+            return
+
+        for level in frame_levels(samples, self.frame_samples).tolist():
+            self._update(level)
+
+    def _update(self, level: float) -> None:
+        """프레임 하나의 레벨(dBFS)로 상태 갱신"""
+        self.position += self.frame_samples
+
+        score = min(max((level - self.noise_floor) / settings.ENDPOINT_SNR_RANGE_DB, 0.0), 1.0)
+        is_speech = score >= self.threshold and level >= settings.ENDPOINT_MIN_SPEECH_DBFS
+
+        if level < self.noise_floor:
+            self.noise_floor = max(level, NOISE_FLOOR_MIN_DBFS)
+        else:
+            self.noise_floor += NOISE_FLOOR_RISE * (level - self.noise_floor)
+
+        if not is_speech:
+            self.speech_run = 0
+            self.silence_run += 1
+            if self.in_speech and self.silence_run >= self.min_silence_frames:
+                self.in_speech = False
+                self.endpoint_reached = True
+            return
+
+        self.speech_run += 1
+        if self.in_speech:
+            if self.silence_run >= self.pause_frames and self.speech_end is not None:
+                self.pause_cut = self.speech_end + self.silence_run * self.frame_samples // 2
+            self.silence_run = 0
+            self.speech_end = self.position
+        elif self.speech_run >= self.min_speech_frames:
+            run_start = self.position - self.speech_run * self.frame_samples
+            if self.utterance_start is None:
+                self.utterance_start = run_start
+            elif self.speech_end is not None:
+                # 같은 윈도우 안의 다음 발화: 사이 무음의 가운데를 절단 후보로 둠
+                self.pause_cut = self.speech_end + (run_start - self.speech_end) // 2
+            self.in_speech = True
+            self.endpoint_reached = False
+            self.silence_run = 0
+            self.speech_end = self.position
+
+    def droppable_samples(self) -> int:
+        """
+        발화가 시작되지 않은 앞부분 무음 중 버릴 수 있는 샘플 수
+
+        확인 중인 음성 프레임과 그 앞의 패딩은 남긴다.
+        """
+        if self.utterance_start is not None:
+            return 0
+        return max(self.position - self.speech_run * self.frame_samples - self.padding, 0)
+
+    def trailing_silence(self, buffered_samples: int) -> int:
+        """발화가 끝난 뒤 패딩을 넘어 이어진 무음 샘플 수 (최종 처리 시 추론에서 제외)"""
+        if self.in_speech or self.speech_end is None:
+            return 0
+        return max(buffered_samples - (self.speech_end + self.padding), 0)
+
+    def cut(self, buffered_samples: int, max_samples: int) -> Tuple[int, Optional[str]]:
+        """
+        지금 잘라낼 윈도우 길이와 절단 이유
+
+        - silence: 발화가 끝났고 윈도우가 최소 길이 이상이거나, 발화 후 무음이 ENDPOINT_FLUSH_SILENCE_MS 이상
+        - max_length: 발화가 이어진 채 최대 길이에 도달 (윈도우 후반의 쉼이 있으면 그 위치에서 절단)
+
+        Args:
+            buffered_samples: 링 버퍼의 샘플 수
+            max_samples: 윈도우 최대 길이 (샘플)
+
+        Returns:
+            (절단할 샘플 수, 이유), 자를 시점이 아니면 (0, None)
+        """
+        if self.utterance_start is None:
+            return 0, None
+
+        if self.endpoint_reached and self.speech_end is not None:
+            end = min(self.speech_end + self.padding, self.position)
+            if end >= self.min_window or self.silence_run * self.frame_ms >= settings.ENDPOINT_FLUSH_SILENCE_MS:
+                return end, "silence"
+
+        if buffered_samples >= max_samples:
+            if self.pause_cut is not None and max_samples // 2 <= self.pause_cut <= max_samples:
+                return self.pause_cut, "max_length"
+            return max_samples, "max_length"
+        return 0, None
+
+    def consume(self, num_samples: int) -> None:
+        """
+        링 버퍼 앞부분을 소비한 만큼 위치를 옮김
+
+        Args:
+            num_samples: 소비한 샘플 수
+        """
+        if num_samples <= 0:
+            return
+        if num_samples > self.position:
+            # 분석 전 샘플까지 소비한 경우 (최종 처리)
+            self._pending = self._pending[num_samples - self.position:]
+        self.position = max(self.position - num_samples, 0)
+        if self.speech_end is not None:
+            self.speech_end -= num_samples
+            if self.speech_end <= 0:
+                self.speech_end = None
+        if self.pause_cut is not None:
+            self.pause_cut -= num_samples
+            if self.pause_cut <= 0:
+                self.pause_cut = None
+        if self.utterance_start is not None and self.utterance_start > num_samples:
+            self.utterance_start -= num_samples
+        else:
+            # 남은 구간에 발화가 이어지면 윈도우 앞부터 발화로 봄
+            self.utterance_start = 0 if self.in_speech or self.speech_end is not None else None
+        self.endpoint_reached = self.endpoint_reached and self.speech_end is not None
+
+    def sync_dropped(self, dropped_samples: int) -> None:
+        """링 버퍼가 용량 초과로 버린 샘플만큼 위치를 옮김"""
+        if dropped_samples > self.dropped_samples_seen:
+            self.consume(dropped_samples - self.dropped_samples_seen)
+            self.dropped_samples_seen = dropped_samples
+
+
+class EndpointStats:
+    """발화 구간 검출 누적 통계 (전체 세션)"""
+
+    def __init__(self) -> None:
+        self.skipped_seconds = 0.0  # 추론 전에 버린 무음 길이 (초)
+        self.window_seconds = 0.0  # 추론으로 보낸 윈도우 길이 합계 (초)
+        self.windows: Counter = Counter()  # 절단 이유별 윈도우 수
+        self.recent_windows = deque(maxlen=1000)  # 최근 윈도우 길이 (초)
+
+    def record_skipped(self, num_samples: int, scenario: str, language: str) -> None:
+        seconds = num_samples / settings.SAMPLE_RATE
+        self.skipped_seconds += seconds
+        ENDPOINT_SKIPPED_SECONDS.labels(*metric_labels(scenario, language)).inc(seconds)
+
+    def record_window(self, num_samples: int, reason: str, scenario: str, language: str) -> None:
+        seconds = num_samples / settings.SAMPLE_RATE
+        self.window_seconds += seconds
+        self.windows[reason] += 1
+        self.recent_windows.append(seconds)
+        ENDPOINT_WINDOWS.labels(reason, *metric_labels(scenario, language)).inc()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """버린 무음 길이와 비율, 절단 이유별 윈도우 수, 윈도우 길이 통계"""
+        total = self.skipped_seconds + self.window_seconds
+        windows = sorted(self.recent_windows)
+
+        def percentile(p: float) -> float:
+            return round(windows[min(int(len(windows) * p), len(windows) - 1)], 2) if windows else 0
+
+        return {
+            "enabled": settings.ENDPOINTING_ENABLED,
+            "skipped_seconds": round(self.skipped_seconds, 2),
+            "window_seconds": round(self.window_seconds, 2),
+            "skipped_ratio": round(self.skipped_seconds / total, 4) if total > 0 else 0,
+            "windows": dict(self.windows),
+            "window_length_seconds": {
+                "p50": percentile(0.5),
+                "p95": percentile(0.95),
+                "max": round(windows[-1], 2) if windows else 0,
+            },
+        }
+
+
+# 싱글톤 인스턴스
+endpoint_stats = EndpointStats()
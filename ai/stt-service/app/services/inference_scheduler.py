@@ -0,0 +1,521 @@
+import asyncio
+import bisect
+import time
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+from faster_whisper import BatchedInferencePipeline
+from faster_whisper.vad import VadOptions, get_speech_timestamps, merge_segments
+
+from app.core.config import settings
+from app.core.logging import logger
+from app.core.metrics import (
+    AUDIO_SECONDS, INFERENCE_IN_FLIGHT, INFERENCE_LATENCY, QUEUE_WAIT, REAL_TIME_FACTOR, metric_labels
+)
+from app.services.audio_slab import AudioSlab
+from app.services.warmup import first_request
+
+# 배치 추론 한 청크의 최대 길이 (Whisper 입력 길이, 초)
+MAX_BATCH_CHUNK_SECONDS = 30
+
+# 배치 경로로 그대로 넘기는 디코딩 옵션 (요청마다 다르면 같은 배치로 묶지 않음)
+BATCH_DECODE_OPTIONS = (
+    "temperature", "best_of", "patience", "length_penalty", "repetition_penalty", "no_repeat_ngram_size",
+    "compression_ratio_threshold", "log_prob_threshold", "no_speech_threshold", "suppress_blank",
+    "suppress_tokens", "max_new_tokens", "hotwords",
+)
+
+
+def _hashable(value: Any) -> Any:
+    """배치 키에 넣을 수 있도록 리스트/딕셔너리를 튜플로 변환"""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _hashable(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_hashable(v) for v in value)
+    return value
+
+
+# 과부하 시 요청 거절 정책
+OVERLOAD_POLICIES = ("drop_oldest", "drop_newest", "coalesce")
+
+
+class InferenceOverloadedError(Exception):
+    """추론 대기열이 가득 차 요청이 실행 전에 거절됨"""
+
+    def __init__(self, reason: str, queue_depth: int, audio_seconds: float) -> None:
+        super().__init__(f"추론 대기열 과부하로 요청이 거절되었습니다 ({reason})")
+        self.reason = reason
+        self.queue_depth = queue_depth
+        self.audio_seconds = audio_seconds
+
+
+@dataclass
+class InferenceRequest:
+    """스케줄러 대기열에 들어가는 추론 요청"""
+    audio: np.ndarray
+    params: Dict[str, Any]
+    future: asyncio.Future
+    session_id: Optional[str] = None
+    # 이전 요청의 오디오를 포함하는 윈도우인지 여부 (스트리밍 모드)
+    cumulative: bool = False
+    # 메트릭 라벨용 시나리오
+    scenario: str = "unknown"
+    enqueued_at: float = field(default_factory=time.perf_counter)
+    # 호출자가 넘긴 경우 queue_enter, inference_start, inference_end 시각을 기록
+    timings: Optional[Dict[str, float]] = None
+    # 워커 프로세스로 위치/길이만 넘기는 공유 메모리 슬랩 (요청이 스케줄러를 떠날 때 반환)
+    slab: Optional[AudioSlab] = None
+
+    @property
+    def model_input(self) -> Any:
+        """모델(워커 풀)에 넘길 입력 (슬랩이 있으면 슬랩, 없으면 float32 배열)"""
+        return self.slab if self.slab is not None else self.audio
+
+    def release_slab(self) -> None:
+        if self.slab is not None:
+            self.slab.release()
+            self.slab = None
+
+    @property
+    def metric_labels(self) -> Tuple[str, str]:
+        """메트릭 라벨 (시나리오, 언어)"""
+        return metric_labels(self.scenario, self.params.get("language"))
+
+    @property
+    def batch_key(self) -> Tuple:
+        """
+        같은 배치로 묶을 수 있는 요청인지 판단하는 키
+
+        배치 경로가 단일 경로와 같은 결과를 낼 수 없는 요청은 배치하지 않는다 (키가 요청마다 달라 단독 실행).
+        - 30초 청크보다 긴 오디오
+        - 언어 자동 감지 요청 (배치 경로는 배치 전체에 감지한 언어 하나를 적용)
+        - INFERENCE_BATCH_PROMPTED_WINDOWS가 꺼져 있을 때 초기 프롬프트가 있는 요청
+        초기 프롬프트는 세션마다 달라 키에 넣지 않으며, 묶인 윈도우는 프롬프트 없이 디코딩한다
+        (배치 경로는 배치 전체에 프롬프트 하나만 적용할 수 있음).
+        VAD 설정과 디코딩 옵션이 같은 요청끼리만 묶으며, VAD는 배치 안에서 윈도우별로 적용한다.
+        """
+        batchable = (
+            len(self.audio) <= MAX_BATCH_CHUNK_SECONDS * settings.SAMPLE_RATE
+            and self.params.get("language") is not None
+            and (settings.INFERENCE_BATCH_PROMPTED_WINDOWS or not self.params.get("initial_prompt"))
+        )
+        if not batchable:
+            return (False,)
+        return (
+            True,
+            self.params.get("language"),
+            self.params.get("task", "transcribe"),
+            self.params.get("beam_size", 5),
+            self.params.get("word_timestamps", False),
+            self.params.get("vad_filter", False),
+            _hashable(self.params.get("vad_parameters")),
+            tuple((name, _hashable(self.params[name])) for name in BATCH_DECODE_OPTIONS if name in self.params),
+        )
+
+
+class InferenceScheduler:
+    """
+    세션 간 동적 배치 추론 스케줄러
+
+    모든 세션의 윈도우를 하나의 대기열로 모아 최대 배치 크기(INFERENCE_MAX_BATCH_SIZE)가 차거나
+    가장 오래된 요청의 대기 시간이 INFERENCE_MAX_WAIT_MS를 넘으면 배치로 실행하고,
+    결과를 각 세션의 코루틴으로 돌려준다.
+    요청이 하나뿐인 배치는 기존과 같은 단일 transcribe 경로(VAD, 초기 프롬프트 포함)를 사용하며,
+    언어를 자동 감지하는 요청은 항상 단일 경로로 실행한다.
+    여러 요청이 묶인 배치는 세션별 초기 프롬프트 없이 디코딩한다 (batch_key 참고).
+
+    배치는 전용 스레드 풀에서 실행되며 동시 배치 수는 스레드 수를 넘지 않는다.
+    대기열이 INFERENCE_MAX_PENDING을 넘거나 대기 시간이 INFERENCE_QUEUE_TIMEOUT_SECONDS를 넘은 요청은
+    실행을 시작하기 전에 InferenceOverloadedError로 거절된다. 이미 시작된 추론은 끝까지 기다린다.
+    """
+
+    def __init__(
+        self,
+        get_model: Callable[[], Any],
+        max_batch_size: int = settings.INFERENCE_MAX_BATCH_SIZE,
+        max_wait_ms: int = settings.INFERENCE_MAX_WAIT_MS,
+        max_concurrent_batches: int = settings.MAX_WORKERS,
+        max_pending: int = settings.INFERENCE_MAX_PENDING,
+        overload_policy: str = settings.INFERENCE_OVERLOAD_POLICY,
+        queue_timeout: float = settings.INFERENCE_QUEUE_TIMEOUT_SECONDS,
+    ) -> None:
+        """
+        스케줄러 초기화
+
+        Args:
+            get_model: 현재 로드된 faster-whisper 모델을 반환하는 함수
+            max_batch_size: 최대 배치 크기
+            max_wait_ms: 배치를 채우기 위해 기다리는 최대 시간 (ms)
+            max_concurrent_batches: 동시에 실행할 수 있는 배치 수 (전용 스레드 풀 크기)
+            max_pending: 대기열 최대 길이
+            overload_policy: 대기열이 가득 찼을 때의 정책 (drop_oldest, drop_newest, coalesce)
+            queue_timeout: 실행 전 최대 대기 시간 (초)
+        """
+        if overload_policy not in OVERLOAD_POLICIES:
+            raise ValueError(f"알 수 없는 과부하 정책: {overload_policy}. 지원되는 정책: {', '.join(OVERLOAD_POLICIES)}")
+
+        self.get_model = get_model
+        self.max_batch_size = max(max_batch_size, 1)
+        self.max_wait = max_wait_ms / 1000
+        self.max_concurrent_batches = max(max_concurrent_batches, 1)
+        self.max_pending = max(max_pending, 1)
+        self.overload_policy = overload_policy
+        self.queue_timeout = queue_timeout
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        self._pending: List[InferenceRequest] = []
+        self._wakeup: Optional[asyncio.Event] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._dispatcher: Optional[asyncio.Task] = None
+
+        # 통계
+        self.batch_size_histogram: Counter = Counter()
+        self.wait_times = deque(maxlen=1000)  # 최근 요청 대기 시간 (초)
+        self.total_requests = 0
+        self.total_batches = 0
+        self.rejected: Counter = Counter()  # 거절 사유별 요청 수
+        self.real_time_factor: Optional[float] = None  # 최근 배치 실시간 배율 (지수 이동 평균)
+
+    @property
+    def queue_depth(self) -> int:
+        """대기 중인 요청 수"""
+        return len(self._pending)
+
+    async def submit(
+        self,
+        audio: np.ndarray,
+        params: Dict[str, Any],
+        session_id: Optional[str] = None,
+        cumulative: bool = False,
+        scenario: str = "unknown",
+        timings: Optional[Dict[str, float]] = None,
+        slab: Optional[AudioSlab] = None
+    ) -> Tuple[list, Any]:
+        """
+        추론 요청 제출 후 결과 대기
+
+        Args:
+            audio: float32 오디오 배열 (16kHz, 모노)
+            params: transcribe 매개변수
+            session_id: 요청한 세션 ID (세션 종료 시 cancel_session으로 대기 중인 요청 취소)
+            cumulative: 같은 세션의 이전 윈도우를 포함하는 윈도우인지 여부
+            scenario: 요청한 세션의 시나리오 (메트릭 라벨)
+            timings: 대기열 진입/추론 시작/추론 종료 시각(time.perf_counter)을 기록할 딕셔너리
+            slab: audio와 같은 윈도우를 담은 공유 메모리 슬랩 (스케줄러가 반환까지 소유)
+
+        Returns:
+            (세그먼트 리스트, 추론 정보)
+
+        Raises:
+            InferenceOverloadedError: 과부하로 실행 전에 거절된 경우
+        """
+        self._ensure_started()
+        self._shed_expired()
+        request = InferenceRequest(
+            audio=audio,
+            params=params,
+            future=asyncio.get_running_loop().create_future(),
+            session_id=session_id,
+            cumulative=cumulative,
+            scenario=scenario,
+            timings=timings,
+            slab=slab
+        )
+        self.total_requests += 1
+        if len(self._pending) >= self.max_pending:
+            self._admit_overloaded(request)
+        else:
+            self._pending.append(request)
+        self._wakeup.set()
+        return await request.future
+
+    def _admit_overloaded(self, request: InferenceRequest) -> None:
+        """
+        대기열이 가득 찼을 때 정책에 따라 새 요청을 받거나 거절
+
+        세션은 윈도우를 하나씩만 처리하므로(이전 윈도우가 끝나야 다음 윈도우를 자름)
+        같은 세션의 요청이 대기열에 둘 이상 있을 수 없다. 그래서 coalesce는 세션 단위로 동작한다:
+        새 요청을 "coalesce" 사유로 거절하고, 호출자(WebSocket 세션)가 거절된 오디오를 보관해 다음 윈도우 앞에 붙인다.
+        """
+        if self.overload_policy == "drop_oldest":
+            self._reject(self._pending.pop(0), "drop_oldest")
+            self._pending.append(request)
+        else:
+            self._reject(request, self.overload_policy)
+
+    def _reject(self, request: InferenceRequest, reason: str) -> None:
+        self.rejected[reason] += 1
+        request.release_slab()
+        if not request.future.done():
+            request.future.set_exception(InferenceOverloadedError(
+                reason,
+                queue_depth=len(self._pending),
+                audio_seconds=len(request.audio) / settings.SAMPLE_RATE
+            ))
+
+    def _ensure_started(self) -> None:
+        if self._dispatcher is None or self._dispatcher.done():
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_concurrent_batches,
+                    thread_name_prefix="stt-inference"
+                )
+            self._wakeup = asyncio.Event()
+            self._slots = asyncio.Semaphore(self.max_concurrent_batches)
+            self._dispatcher = asyncio.create_task(self._dispatch_loop())
+            logger.info(
+                f"추론 스케줄러 시작 - 최대 배치: {self.max_batch_size}, 최대 대기: {self.max_wait * 1000:.0f}ms, "
+                f"추론 스레드: {self.max_concurrent_batches}, 최대 대기열: {self.max_pending}, 과부하 정책: {self.overload_policy}"
+            )
+
+    async def shutdown(self) -> None:
+        """디스패처 종료, 대기 중인 요청 취소, 전용 스레드 풀 정리"""
+        if self._dispatcher is not None:
+            self._dispatcher.cancel()
+            try:
+                await self._dispatcher
+            except asyncio.CancelledError:
+                pass
+            self._dispatcher = None
+        for request in self._pending:
+            request.release_slab()
+            if not request.future.done():
+                request.future.cancel()
+        self._pending.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def _dispatch_loop(self) -> None:
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            self._shed_expired()
+            if not self._pending:
+                continue
+
+            # 실행 슬롯이 빌 때까지 기다리는 동안에도 요청은 계속 쌓인다
+            await self._slots.acquire()
+            try:
+                batch = await self._collect_batch()
+            except BaseException:
+                self._slots.release()
+                raise
+            if not batch:
+                self._slots.release()
+                continue
+
+            asyncio.create_task(self._run_batch(batch))
+            if self._pending:
+                self._wakeup.set()
+
+    def _shed_expired(self) -> None:
+        """취소된 요청을 제거하고 대기 시간 한도를 넘은 요청은 실행 전에 거절"""
+        deadline = time.perf_counter() - self.queue_timeout
+        pending = []
+        for request in self._pending:
+            if request.future.done():
+                request.release_slab()
+                continue
+            if request.enqueued_at < deadline:
+                self._reject(request, "queue_timeout")
+                continue
+            pending.append(request)
+        self._pending = pending
+
+    async def _collect_batch(self) -> List[InferenceRequest]:
+        """가장 오래된 요청과 같은 키의 요청을 배치 크기 또는 대기 시간 한도까지 모음"""
+        while True:
+            self._shed_expired()
+            if not self._pending:
+                return []
+            key = self._pending[0].batch_key
+            same_key = [r for r in self._pending if r.batch_key == key]
+            remaining = self._pending[0].enqueued_at + self.max_wait - time.perf_counter()
+            if not key[0] or len(same_key) >= self.max_batch_size or remaining <= 0:
+                break
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=remaining)
+                self._wakeup.clear()
+            except asyncio.TimeoutError:
+                pass
+
+        batch = same_key[:self.max_batch_size] if key[0] else same_key[:1]
+        batch_ids = {id(r) for r in batch}
+        self._pending = [r for r in self._pending if id(r) not in batch_ids]
+        return batch
+
+    async def _run_batch(self, batch: List[InferenceRequest]) -> None:
+        now = time.perf_counter()
+        for request in batch:
+            self.wait_times.append(now - request.enqueued_at)
+            QUEUE_WAIT.labels(*request.metric_labels).observe(now - request.enqueued_at)
+            INFERENCE_IN_FLIGHT.labels(*request.metric_labels).inc()
+        self.batch_size_histogram[len(batch)] += 1
+        self.total_batches += 1
+
+        try:
+            model = self.get_model()
+            if model is None:
+                raise RuntimeError("STT 모델이 초기화되지 않았습니다.")
+            loop = asyncio.get_running_loop()
+            if len(batch) == 1:
+                results = [await loop.run_in_executor(self._executor, self._transcribe_single, model, batch[0])]
+            else:
+                results = await loop.run_in_executor(self._executor, self._transcribe_batch, model, batch)
+            finished = time.perf_counter()
+            self._observe_batch(batch, finished - now)
+            first_request.observe(finished - now)
+            self._update_real_time_factor(batch, finished - now)
+            for request in batch:
+                if request.timings is not None:
+                    request.timings.update(queue_enter=request.enqueued_at, inference_start=now, inference_end=finished)
+            for request, result in zip(batch, results):
+                if not request.future.done():
+                    request.future.set_result(result)
+        except Exception as e:
+            logger.error(f"배치 추론 실패 (배치 크기: {len(batch)}): {str(e)}", exc_info=True)
+            for request in batch:
+                if not request.future.done():
+                    request.future.set_exception(e)
+        finally:
+            for request in batch:
+                INFERENCE_IN_FLIGHT.labels(*request.metric_labels).dec()
+                request.release_slab()
+            self._slots.release()
+            self._wakeup.set()
+
+    def cancel_session(self, session_id: str) -> int:
+        """
+        종료된 세션의 대기 중인 요청 취소 (실행 중인 요청은 끝난 뒤 슬랩을 반환)
+
+        Args:
+            session_id: 세션 ID
+
+        Returns:
+            취소한 요청 수
+        """
+        cancelled = [r for r in self._pending if r.session_id == session_id]
+        if not cancelled:
+            return 0
+        self._pending = [r for r in self._pending if r.session_id != session_id]
+        for request in cancelled:
+            request.release_slab()
+            if not request.future.done():
+                request.future.cancel()
+        return len(cancelled)
+
+    @staticmethod
+    def _observe_batch(batch: List[InferenceRequest], elapsed: float) -> None:
+        """배치 추론 시간, 오디오 길이, 실시간 배율 기록 (배율은 배치 전체 오디오 기준)"""
+        batch_audio_seconds = sum(len(r.audio) for r in batch) / settings.SAMPLE_RATE
+        for request in batch:
+            labels = request.metric_labels
+            INFERENCE_LATENCY.labels(*labels).observe(elapsed)
+            AUDIO_SECONDS.labels(*labels).observe(len(request.audio) / settings.SAMPLE_RATE)
+            if batch_audio_seconds > 0:
+                REAL_TIME_FACTOR.labels(*labels).observe(elapsed / batch_audio_seconds)
+
+    def _update_real_time_factor(self, batch: List[InferenceRequest], elapsed: float) -> None:
+        """배치 실시간 배율의 지수 이동 평균 갱신 (무음 게이트의 절약 시간 추정에 사용)"""
+        batch_audio_seconds = sum(len(r.audio) for r in batch) / settings.SAMPLE_RATE
+        if batch_audio_seconds <= 0:
+            return
+        rtf = elapsed / batch_audio_seconds
+        self.real_time_factor = rtf if self.real_time_factor is None else 0.9 * self.real_time_factor + 0.1 * rtf
+
+    @staticmethod
+    def _transcribe_single(model, request: InferenceRequest) -> Tuple[list, Any]:
+        segments, info = model.transcribe(request.model_input, **request.params)
+        # 제너레이터는 실제 디코딩을 수행하므로 작업 스레드 안에서 소비
+        return list(segments), info
+
+    @staticmethod
+    def _transcribe_batch(model, batch: List[InferenceRequest]) -> List[Tuple[list, Any]]:
+        """
+        여러 세션의 윈도우를 이어 붙여 한 번의 배치 추론으로 처리
+
+        각 윈도우를 clip_timestamps 청크로 지정하므로 윈도우끼리 섞이지 않으며,
+        결과 세그먼트는 청크 시작 위치를 기준으로 원래 요청에 돌려준다.
+        vad_filter가 켜져 있으면 윈도우마다 Silero VAD로 발화 구간만 청크로 만들고,
+        발화가 없는 윈도우는 디코딩하지 않는다 (무음에서 환각 방지).
+        batch_key가 배치 안의 매개변수를 같게 보장하므로 batch[0]의 매개변수를 사용하며,
+        세션마다 다른 초기 프롬프트는 배치 경로에 넘기지 않는다.
+        transcribe_batch를 제공하는 백엔드(synthetic, 워커 풀)는 자체 배치 경로를 사용한다.
+        """
+        if hasattr(model, "transcribe_batch"):
+            return model.transcribe_batch([r.model_input for r in batch], batch[0].params)
+
+        sample_rate = settings.SAMPLE_RATE
+        params = batch[0].params
+        offsets = np.cumsum([0] + [len(r.audio) for r in batch])
+        starts = [offsets[i] / sample_rate for i in range(len(batch))]
+
+        clips = []
+        if params.get("vad_filter", False):
+            vad_options = VadOptions(**{
+                **(params.get("vad_parameters") or {}),
+                "max_speech_duration_s": MAX_BATCH_CHUNK_SECONDS
+            })
+            for i, request in enumerate(batch):
+                speech = get_speech_timestamps(request.audio, vad_options)
+                for clip in merge_segments(speech, vad_options):
+                    clips.append({"start": int(offsets[i] + clip["start"]), "end": int(offsets[i] + clip["end"])})
+            if not clips:
+                # 모든 윈도우가 무음이면 단일 경로로 빈 결과와 정보를 만듦 (VAD만 다시 실행, 프롬프트 없이)
+                params = {name: value for name, value in params.items() if name != "initial_prompt"}
+                return [InferenceScheduler._transcribe_single(model, replace(request, params=params)) for request in batch]
+        else:
+            clips = [{"start": int(offsets[i]), "end": int(offsets[i + 1])} for i in range(len(batch))]
+
+        pipeline = BatchedInferencePipeline(model=model)
+        segments, info = pipeline.transcribe(
+            np.concatenate([r.audio for r in batch]),
+            language=params.get("language"),
+            task=params.get("task", "transcribe"),
+            beam_size=params.get("beam_size", 5),
+            word_timestamps=params.get("word_timestamps", False),
+            without_timestamps=False,  # 타임스탬프 토큰으로 청크를 세그먼트 단위로 분할
+            clip_timestamps=clips,
+            batch_size=len(batch),
+            **{name: params[name] for name in BATCH_DECODE_OPTIONS if name in params},
+        )
+
+        results: List[list] = [[] for _ in batch]
+        for segment in segments:
+            index = max(bisect.bisect_right(starts, segment.start + 1e-3) - 1, 0)
+            offset = starts[index]
+            words = None
+            if segment.words:
+                words = [replace(w, start=w.start - offset, end=w.end - offset) for w in segment.words]
+            results[index].append(
+                replace(segment, start=segment.start - offset, end=segment.end - offset, words=words)
+            )
+
+        return [(segments_list, info) for segments_list in results]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """대기열 길이, 배치 크기 분포, 대기 시간 통계"""
+        waits = sorted(self.wait_times)
+
+        def percentile(p: float) -> float:
+            return round(waits[min(int(len(waits) * p), len(waits) - 1)] * 1000, 2) if waits else 0
+
+        return {
+            "queue_depth": self.queue_depth,
+            "max_pending": self.max_pending,
+            "overload_policy": self.overload_policy,
+            "total_requests": self.total_requests,
+            "total_batches": self.total_batches,
+            "rejected": dict(self.rejected),
+            "real_time_factor": round(self.real_time_factor, 4) if self.real_time_factor is not None else None,
+            "batch_size_histogram": dict(sorted(self.batch_size_histogram.items())),
+            "wait_ms": {
+                "p50": percentile(0.5),
+                "p95": percentile(0.95),
+                "max": round(waits[-1] * 1000, 2) if waits else 0,
+            },
+        }
@@ -0,0 +1,180 @@
+from bisect import bisect_right, insort
+from typing import Any, Dict, List
+
+from app.services.speech_metrics import SegmentColumns, classify_speed
+
+
+class P2Quantile:
+    """
+    P² 알고리즘 스트리밍 분위수 추정 (Jain & Chlamtac, 1985)
+
+    관측값을 저장하지 않고 마커 5개만 유지하므로 관측 수와 관계없이 메모리가 일정하다.
+    관측이 5개 이하일 때는 정확한 값을 반환한다.
+    """
+
+    def __init__(self, p: float) -> None:
+        self.p = p
+        self.count = 0
+        self._heights: List[float] = []  # 마커 높이 (추정 분위수)
+        self._positions = [1, 2, 3, 4, 5]  # 마커 실제 위치
+        self._desired = [1, 1 + 2 * p, 1 + 4 * p, 3 + 2 * p, 5]  # 마커 목표 위치
+        self._increments = [0, p / 2, p, (1 + p) / 2, 1]
+
+    def add(self, x: float) -> None:
+        """관측값 추가"""
+        self.count += 1
+        q = self._heights
+        if self.count <= 5:
+            insort(q, x)
+            return
+
+        n = self._positions
+        if x < q[0]:
+            q[0] = x
+            k = 0
+        elif x >= q[4]:
+            q[4] = x
+            k = 3
+        else:
+            k = bisect_right(q, x) - 1
+
+        for i in range(k + 1, 5):
+            n[i] += 1
+        for i in range(5):
+            self._desired[i] += self._increments[i]
+
+        # 가운데 마커를 목표 위치 쪽으로 한 칸씩 이동하며 높이 보정
+        for i in range(1, 4):
+            d = self._desired[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                step = 1 if d > 0 else -1
+                height = self._parabolic(i, step)
+                if not q[i - 1] < height < q[i + 1]:
+                    height = q[i] + step * (q[i + step] - q[i]) / (n[i + step] - n[i])
+                q[i] = height
+                n[i] += step
+
+    def _parabolic(self, i: int, step: int) -> float:
+        q, n = self._heights, self._positions
+        return q[i] + step / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + step) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - step) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+        )
+
+    @property
+    def value(self) -> float:
+        """현재 분위수 추정값"""
+        if self.count == 0:
+            return 0
+        if self.count <= 5:
+            return self._heights[min(int(self.count * self.p), self.count - 1)]
+        return self._heights[2]
+
+
+class SessionMetricsAccumulator:
+    """
+    세션 전체 말하기 속도 누적 메트릭
+
+    윈도우마다 해당 윈도우의 세그먼트만으로 갱신하며(세션 길이와 무관한 O(1) 갱신),
+    합계, Welford 분산, P² 분위수만 유지하므로 세션이 길어져도 메모리가 일정하다.
+    전사 결과가 있는 윈도우는 세그먼트로, 무음 게이트로 건너뛰었거나 전사 결과가 없는 윈도우는
+    윈도우 전체를 pause 하나로 집계한다. 윈도우 경계를 넘는 pause는 포함하지 않는다.
+    """
+
+    def __init__(self) -> None:
+        self.window_count = 0
+        self.total_duration = 0.0  # 집계한 오디오 길이 (초)
+        self.speech_duration = 0.0  # 세그먼트 길이 합 (초)
+        self.word_count = 0
+        self.pause_count = 0
+        self.pause_duration = 0.0
+
+        # 세그먼트 WPM 통계 (Welford)
+        self.wpm_count = 0
+        self.wpm_mean = 0.0
+        self._wpm_m2 = 0.0
+        self.wpm_median = P2Quantile(0.5)
+        self.wpm_p90 = P2Quantile(0.9)
+
+    def update(self, columns: SegmentColumns, audio_duration: float) -> None:
+        """
+        윈도우 하나의 세그먼트로 누적 메트릭 갱신
+
+        Args:
+            columns: 윈도우의 세그먼트 열
+            audio_duration: 윈도우 오디오 길이 (초)
+        """
+        self.window_count += 1
+        self.total_duration += audio_duration
+        self.speech_duration += float(columns.durations.sum())
+        self.word_count += int(columns.word_counts.sum())
+
+        pauses = columns.starts[1:] - columns.ends[:-1]
+        pauses = pauses[pauses > 0]
+        self.pause_count += len(pauses)
+        self.pause_duration += float(pauses.sum())
+
+        wpm = columns.wpm()
+        for value in wpm[wpm > 0].tolist():
+            self.wpm_count += 1
+            delta = value - self.wpm_mean
+            self.wpm_mean += delta / self.wpm_count
+            self._wpm_m2 += delta * (value - self.wpm_mean)
+            self.wpm_median.add(value)
+            self.wpm_p90.add(value)
+
+    def add_silence(self, audio_duration: float) -> None:
+        """
+        무음 윈도우 반영 (윈도우 전체를 pause 하나로 집계)
+
+        무음 게이트로 추론을 건너뛴 윈도우와 추론했지만 전사 결과가 없는 윈도우에 사용한다.
+
+        Args:
+            audio_duration: 윈도우 오디오 길이 (초)
+        """
+        self.window_count += 1
+        self.total_duration += audio_duration
+        self.pause_count += 1
+        self.pause_duration += audio_duration
+
+    @property
+    def wpm_std(self) -> float:
+        """세그먼트 WPM 모표준편차"""
+        return (self._wpm_m2 / self.wpm_count) ** 0.5 if self.wpm_count else 0.0
+
+    def snapshot(self, scenario: str, language: str) -> Dict[str, Any]:
+        """
+        현재까지의 누적 메트릭
+
+        Args:
+            scenario: 시나리오 타입 (속도 카테고리 임계값)
+            language: 언어 코드 (속도 카테고리 임계값)
+
+        Returns:
+            세션 누적 메트릭 딕셔너리
+        """
+        wpm_std = self.wpm_std
+        wpm_cv = wpm_std / self.wpm_mean if self.wpm_mean > 0 else 0
+        average_pause = self.pause_duration / self.pause_count if self.pause_count else 0
+
+        return {
+            "window_count": self.window_count,
+            "total_duration": round(self.total_duration, 2),
+            "speech_duration": round(self.speech_duration, 2),
+            "word_count": self.word_count,
+            "wpm_active": round(self.word_count / self.speech_duration * 60, 2) if self.speech_duration > 0 else 0,
+            "wpm_total": round(self.word_count / self.total_duration * 60, 2) if self.total_duration > 0 else 0,
+            "speech_density": round(self.speech_duration / self.total_duration, 3) if self.total_duration > 0 else 0,
+            "average_segment_wpm": round(self.wpm_mean, 2),
+            "median_segment_wpm": round(self.wpm_median.value, 2),
+            "p90_segment_wpm": round(self.wpm_p90.value, 2),
+            "wpm_std": round(wpm_std, 2),
+            "wpm_cv": round(wpm_cv, 3),
+            "pause_metrics": {
+                "count": self.pause_count,
+                "total_duration": round(self.pause_duration, 2),
+                "average_duration": round(average_pause, 2),
+                "pause_ratio": round(self.pause_duration / self.total_duration, 3) if self.total_duration > 0 else 0
+            },
+            "speed_category": classify_speed(self.wpm_mean, scenario, language) if self.wpm_count else "no_data"
+        }
@@ -0,0 +1,147 @@
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from app.core.config import settings
+from app.core.metrics import (
+    SILENCE_GATE_AUDIO_SECONDS, SILENCE_GATE_SAVED_INFERENCE_SECONDS, SILENCE_GATE_WINDOWS, metric_labels
+)
+from app.services.endpointer import frame_levels
+
+GATE_FRAME_MS = 20  # 활성 프레임 판정 단위 (ms)
+
+
+@dataclass
+class GateDecision:
+    """윈도우 하나의 무음 판정 결과"""
+    silent: bool
+    rms_dbfs: float  # 윈도우 전체 RMS 레벨
+    active_seconds: float  # SILENCE_GATE_FRAME_DBFS를 넘은 프레임 길이 합계
+    vad_speech_seconds: Optional[float] = None  # Silero VAD 음성 구간 합계 (사용한 경우)
+
+
+class SilenceGate:
+    """
+    추론 전 무음 윈도우 판정
+
+    윈도우 RMS와 활성 프레임 길이로 먼저 판정하고 (수백 µs),
+    SILENCE_GATE_USE_VAD가 켜져 있으면 에너지로 통과한 윈도우만 Silero VAD로 다시 확인한다.
+    무음 윈도우는 빔 서치 추론과 감정분석 호출을 모두 생략한다.
+    """
+
+    def __init__(self) -> None:
+        self.windows = 0  # 추론을 생략한 윈도우 수
+        self.audio_seconds = 0.0  # 추론을 생략한 오디오 길이 (초)
+        self.saved_inference_seconds = 0.0  # 절약한 추정 추론 시간 (초)
+        self.checked_windows = 0  # 판정한 전체 윈도우 수
+
+    @property
+    def enabled(self) -> bool:
+        return settings.SILENCE_GATE_ENABLED
+
+    def check_energy(self, audio: np.ndarray, vad_params: Dict[str, Any]) -> GateDecision:
+        """
+        에너지 기반 무음 판정
+
+        Args:
+            audio: float32 오디오 배열 ([-1, 1], 16kHz)
+            vad_params: 시나리오별 VAD 매개변수 (min_speech_duration_ms 사용)
+
+        Returns:
+            판정 결과
+        """
+        rms = float(np.sqrt(np.mean(np.square(audio, dtype=np.float32)))) if len(audio) else 0.0
+        rms_dbfs = float(20 * np.log10(rms + 1e-10))
+        levels = frame_levels(audio, int(settings.SAMPLE_RATE * GATE_FRAME_MS / 1000), full_scale=1.0)
+        active_seconds = int(np.count_nonzero(levels >= settings.SILENCE_GATE_FRAME_DBFS)) * GATE_FRAME_MS / 1000
+
+        silent = (
+            rms_dbfs < settings.SILENCE_GATE_RMS_DBFS
+            or active_seconds * 1000 < vad_params.get("min_speech_duration_ms", 250)
+        )
+        return GateDecision(silent=silent, rms_dbfs=round(rms_dbfs, 1), active_seconds=round(active_seconds, 2))
+
+    @staticmethod
+    def vad_speech_seconds(audio: np.ndarray, vad_params: Dict[str, Any]) -> float:
+        """Silero VAD로 찾은 음성 구간 길이 합계 (초, 작업 스레드에서 호출)"""
+        from faster_whisper.vad import VadOptions, get_speech_timestamps
+
+        options = VadOptions(
+            threshold=vad_params.get("threshold", 0.5),
+            min_speech_duration_ms=vad_params.get("min_speech_duration_ms", 250),
+            min_silence_duration_ms=vad_params.get("min_silence_duration_ms", 700),
+            speech_pad_ms=0
+        )
+        chunks = get_speech_timestamps(audio, options, sampling_rate=settings.SAMPLE_RATE)
+        return sum(chunk["end"] - chunk["start"] for chunk in chunks) / settings.SAMPLE_RATE
+
+    async def evaluate(self, audio: np.ndarray, vad_params: Dict[str, Any]) -> GateDecision:
+        """
+        윈도우 무음 판정 (VAD 확인은 이벤트 루프 밖에서 수행)
+
+        Args:
+            audio: float32 오디오 배열 ([-1, 1], 16kHz)
+            vad_params: 시나리오별 VAD 매개변수
+
+        Returns:
+            판정 결과
+        """
+        self.checked_windows += 1
+        decision = self.check_energy(audio, vad_params)
+        if not decision.silent and settings.SILENCE_GATE_USE_VAD:
+            loop = asyncio.get_running_loop()
+            speech_seconds = await loop.run_in_executor(None, self.vad_speech_seconds, audio, vad_params)
+            decision.vad_speech_seconds = round(speech_seconds, 2)
+            decision.silent = speech_seconds * 1000 < vad_params.get("min_speech_duration_ms", 250)
+        return decision
+
+    def record(self, audio_seconds: float, real_time_factor: Optional[float], scenario: str, language: str) -> None:
+        """
+        추론을 생략한 윈도우 집계
+
+        Args:
+            audio_seconds: 윈도우 오디오 길이 (초)
+            real_time_factor: 최근 추론의 실시간 배율 (아직 추론 기록이 없으면 None, 절약 시간 추정 생략)
+            scenario: 시나리오 타입 (메트릭 라벨)
+            language: 언어 코드 (메트릭 라벨)
+        """
+        self.windows += 1
+        self.audio_seconds += audio_seconds
+        labels = metric_labels(scenario, language)
+        SILENCE_GATE_WINDOWS.labels(*labels).inc()
+        SILENCE_GATE_AUDIO_SECONDS.labels(*labels).inc(audio_seconds)
+        if real_time_factor is not None:
+            saved = audio_seconds * real_time_factor
+            self.saved_inference_seconds += saved
+            SILENCE_GATE_SAVED_INFERENCE_SECONDS.labels(*labels).inc(saved)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """생략한 윈도우 수와 오디오 길이, 절약한 추정 추론 시간"""
+        return {
+            "enabled": self.enabled,
+            "use_vad": settings.SILENCE_GATE_USE_VAD,
+            "checked_windows": self.checked_windows,
+            "silent_windows": self.windows,
+            "skipped_audio_seconds": round(self.audio_seconds, 2),
+            "saved_inference_seconds": round(self.saved_inference_seconds, 3),
+        }
+
+
+def silence_pause_metrics(audio_seconds: float) -> Dict[str, Any]:
+    """무음 윈도우 전체를 pause 하나로 본 pause 메트릭 (transcription 메시지와 같은 키)"""
+    return {
+        "count": 1,
+        "total_duration": audio_seconds,
+        "average_duration": audio_seconds,
+        "max_duration": audio_seconds,
+        "min_duration": audio_seconds,
+        "pause_ratio": 1.0,
+        # 기존 호환성
+        "avg_duration": audio_seconds
+    }
+
+
+# 싱글톤 인스턴스
+silence_gate = SilenceGate()
@@ -0,0 +1,402 @@
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from app.core.config import settings
+
+# 언어별 음절로 세는 유니코드 코드포인트 범위 (양 끝 포함)
+_SYLLABLE_RANGES = {
+    "ko": ((0xAC00, 0xD7A3),),  # 한글 음절 (가-힣)
+    "ja": ((0x3040, 0x309F), (0x30A0, 0x30FF), (0x4E00, 0x9FAF)),  # 히라가나, 가타카나, 한자
+    "zh": ((0x4E00, 0x9FAF),),  # 한자
+}
+_VOWELS = np.array([ord(c) for c in "aeiouAEIOU"], dtype=np.uint32)  # 영어 등: 모음 기준
+
+
+def _syllable_mask(text: str, language: str) -> np.ndarray:
+    """문자별 음절 여부 (UTF-32 코드포인트 배열에서 범위 비교)"""
+    codepoints = np.frombuffer(text.encode("utf-32-le", "surrogatepass"), dtype=np.uint32)
+    ranges = _SYLLABLE_RANGES.get(language)
+    if ranges is None:
+        return np.isin(codepoints, _VOWELS)
+    mask = np.zeros(len(codepoints), dtype=bool)
+    for low, high in ranges:
+        mask |= (codepoints >= low) & (codepoints <= high)
+    return mask
+
+
+def count_syllables_per_text(texts: List[str], language: str) -> np.ndarray:
+    """
+    여러 텍스트의 음절 수를 한 번에 계산
+
+    텍스트를 이어 붙여 한 번만 인코딩하고, 누적합으로 텍스트별 개수를 구한다.
+
+    Args:
+        texts: 텍스트 목록
+        language: 언어 코드
+
+    Returns:
+        텍스트별 음절 수 배열
+    """
+    lengths = np.fromiter(map(len, texts), dtype=np.int64, count=len(texts))
+    cumulative = np.concatenate(([0], np.cumsum(_syllable_mask("".join(texts), language), dtype=np.int64)))
+    ends = np.cumsum(lengths)
+    return cumulative[ends] - cumulative[ends - lengths]
+
+
+@dataclass
+class SegmentColumns:
+    """
+    세그먼트 목록의 열(column) 표현
+
+    메트릭 계산에 필요한 값을 한 번만 추출하여 배열로 보관한다.
+    segments_list는 faster-whisper Segment (start, end, text, words)를 가정한다.
+    """
+    texts: List[str]
+    starts: np.ndarray
+    ends: np.ndarray
+    durations: np.ndarray
+    word_counts: np.ndarray
+    has_words: np.ndarray
+
+    @classmethod
+    def from_segments(cls, segments_list: list) -> "SegmentColumns":
+        count = len(segments_list)
+        starts = np.fromiter((s.start for s in segments_list), dtype=np.float64, count=count)
+        ends = np.fromiter((s.end for s in segments_list), dtype=np.float64, count=count)
+        has_words = np.fromiter((bool(s.words) for s in segments_list), dtype=bool, count=count)
+        # words가 없는 경우 텍스트 기반 추정
+        word_counts = np.fromiter(
+            (len(s.words) if s.words else len(s.text.split()) for s in segments_list),
+            dtype=np.int64,
+            count=count
+        )
+        return cls(
+            texts=[s.text for s in segments_list],
+            starts=starts,
+            ends=ends,
+            durations=ends - starts,
+            word_counts=word_counts,
+            has_words=has_words
+        )
+
+    def wpm(self) -> np.ndarray:
+        """세그먼트별 WPM (길이가 0 이하인 세그먼트는 0)"""
+        return _per_minute(self.word_counts, self.durations)
+
+
+def _per_minute(counts: np.ndarray, durations: np.ndarray) -> np.ndarray:
+    """길이가 양수인 항목만 분당 개수 계산 (나머지는 0)"""
+    positive = durations > 0
+    return np.divide(counts, durations, out=np.zeros(len(durations)), where=positive) * 60
+
+
+def calculate_segment_based_metrics(
+    segments_list: list,
+    audio_duration: float,
+    scenario: str = "presentation",
+    language: str = "ko",
+    columns: Optional[SegmentColumns] = None
+) -> Dict[str, Any]:
+    """
+    세그먼트별 말하기 속도 및 관련 메트릭 계산
+
+    합계는 내장 sum, 제곱/제곱근은 float ** 연산으로 계산하여
+    기존 구현과 같은 값(같은 JSON)을 만든다.
+
+    Args:
+        segments_list: 인식된 세그먼트 목록
+        audio_duration: 오디오 길이 (초)
+        scenario: 시나리오 타입
+        language: 언어 코드
+        columns: 미리 추출한 세그먼트 열 (없으면 새로 추출)
+
+    Returns:
+        - segment_wpm_list: 각 세그먼트의 WPM
+        - average_segment_wpm: 세그먼트 WPM의 평균
+        - median_segment_wpm: 세그먼트 WPM의 중앙값
+        - pause_metrics: pause 관련 메트릭
+        - speech_pattern: 말하기 패턴 분석
+    """
+    if not segments_list or audio_duration <= 0:
+        return {
+            "segment_wpm_list": [],
+            "average_segment_wpm": 0,
+            "median_segment_wpm": 0,
+            "wpm_active": 0,
+            "wpm_total": 0,
+            "speech_density": 0,
+            "pause_metrics": {},
+            "speech_pattern": "no_data",
+            "speed_category": "no_data"
+        }
+
+    if columns is None:
+        columns = SegmentColumns.from_segments(segments_list)
+
+    # 1. 세그먼트별 WPM / SPM 계산
+    durations = columns.durations
+    positive = durations > 0
+    wpm = columns.wpm()
+    spm = _per_minute(count_syllables_per_text(columns.texts, language), durations)
+
+    segment_metrics = [
+        {
+            "index": i,
+            "text": text,
+            "start": start,
+            "end": end,
+            "duration": duration,
+            "word_count": word_count,
+            "wpm": segment_wpm if is_positive else 0,
+            "spm": segment_spm if is_positive else 0
+        }
+        for i, (text, start, end, duration, word_count, segment_wpm, segment_spm, is_positive) in enumerate(zip(
+            columns.texts,
+            columns.starts.tolist(),
+            columns.ends.tolist(),
+            durations.tolist(),
+            columns.word_counts.tolist(),
+            wpm.tolist(),
+            spm.tolist(),
+            positive.tolist()
+        ))
+    ]
+
+    total_word_count = int(columns.word_counts.sum())
+    total_speech_duration = sum(durations.tolist())
+
+    # Pause 계산 (다음 세그먼트와의 간격)
+    pauses = columns.starts[1:] - columns.ends[:-1]
+    pauses = pauses[pauses > 0]
+    pause_durations = pauses.tolist()
+
+    # 2. 세그먼트 WPM 통계
+    wpm_values = wpm[wpm > 0]
+    segment_wpm_list = wpm_values.tolist()
+
+    if segment_wpm_list:
+        average_segment_wpm = sum(segment_wpm_list) / len(segment_wpm_list)
+        median_index = len(segment_wpm_list) // 2
+        median_segment_wpm = float(np.partition(wpm_values, median_index)[median_index])
+        wpm_std = (sum(d ** 2 for d in (wpm_values - average_segment_wpm).tolist()) / len(segment_wpm_list)) ** 0.5
+        wpm_cv = wpm_std / average_segment_wpm if average_segment_wpm > 0 else 0
+    else:
+        average_segment_wpm = median_segment_wpm = wpm_std = wpm_cv = 0
+
+    # 3. 기존 메트릭 호환성 (wpm_active, wpm_total)
+    wpm_active = (total_word_count / total_speech_duration * 60) if total_speech_duration > 0 else 0
+    wpm_total = (total_word_count / audio_duration * 60) if audio_duration > 0 else 0
+
+    # 4. 발화 밀도
+    speech_density = total_speech_duration / audio_duration if audio_duration > 0 else 0
+
+    # 5. Pause 분석
+    if pause_durations:
+        total_pause = sum(pause_durations)
+        pause_metrics = {
+            "count": len(pause_durations),
+            "total_duration": total_pause,
+            "average_duration": total_pause / len(pause_durations),
+            "max_duration": float(pauses.max()),
+            "min_duration": float(pauses.min()),
+            "pause_ratio": total_pause / audio_duration,
+            # 기존 호환성
+            "avg_duration": total_pause / len(pause_durations)
+        }
+
+        # Pause 패턴 분류
+        pause_pattern = classify_pause(pause_metrics["average_duration"])
+    else:
+        pause_metrics = {
+            "count": 0,
+            "total_duration": 0,
+            "average_duration": 0,
+            "max_duration": 0,
+            "min_duration": 0,
+            "pause_ratio": 0,
+            # 기존 호환성
+            "avg_duration": 0
+        }
+        pause_pattern = "no_pause"
+
+    # 6. 말하기 패턴 분석
+    speech_pattern = analyze_speech_pattern(
+        speech_density,
+        pause_pattern,
+        wpm_cv,
+        average_segment_wpm,
+        pause_metrics.get("pause_ratio", 0)
+    )
+
+    # 7. 속도 카테고리 결정 (세그먼트 평균 기준)
+    # 평가 기준 선택
+    if speech_pattern in ["staccato", "very_sparse"]:
+        # 끊어 말하기 패턴일 경우 중앙값 사용
+        evaluation_wpm = median_segment_wpm
+    else:
+        # 일반적인 경우 평균 사용
+        evaluation_wpm = average_segment_wpm
+
+    # 속도 카테고리
+    speed_category = classify_speed(evaluation_wpm, scenario, language)
+
+    return {
+        # 세그먼트 정보
+        "segment_metrics": segment_metrics,
+        "segment_wpm_list": segment_wpm_list,
+        "average_segment_wpm": round(average_segment_wpm, 2),
+        "median_segment_wpm": round(median_segment_wpm, 2),
+        "wpm_std": round(wpm_std, 2),
+        "wpm_cv": round(wpm_cv, 3),
+        # 기존 호환성 메트릭
+        "wpm_active": round(wpm_active, 2),
+        "wpm_total": round(wpm_total, 2),
+        "evaluation_wpm": round(evaluation_wpm, 2),
+        "word_count": total_word_count,
+        "speech_duration": round(total_speech_duration, 2),
+        "total_duration": round(audio_duration, 2),
+        "speech_density": round(speech_density, 3),
+        # Pause 메트릭
+        "pause_metrics": pause_metrics,
+        "pause_pattern": pause_pattern,
+        # 패턴 및 평가
+        "speech_pattern": speech_pattern,
+        "speed_category": speed_category
+    }
+
+
+def classify_pause(average_pause: float) -> str:
+    """평균 pause 길이(초)로 pause 패턴 분류"""
+    if average_pause < 0.5:
+        return "very_short"
+    elif average_pause < 1.0:
+        return "short"
+    elif average_pause < 2.0:
+        return "normal"
+    elif average_pause < 3.0:
+        return "long"
+    return "very_long"
+
+
+def classify_speed(evaluation_wpm: float, scenario: str, language: str) -> str:
+    """시나리오/언어별 임계값으로 말하기 속도 카테고리 결정"""
+    thresholds = settings.SCENARIO_SPEED_THRESHOLDS.get(scenario, {}).get(
+        language,
+        settings.SCENARIO_SPEED_THRESHOLDS["presentation"]["ko"]
+    )
+
+    if evaluation_wpm < thresholds["very_slow"]:
+        return "very_slow"
+    elif evaluation_wpm < thresholds["slow"]:
+        return "slow"
+    elif evaluation_wpm < thresholds["normal"]:
+        return "normal"
+    elif evaluation_wpm < thresholds["fast"]:
+        return "fast"
+    return "very_fast"
+
+
+def analyze_speech_pattern(
+    speech_density: float,
+    pause_pattern: str,
+    wpm_cv: float,
+    average_wpm: float,
+    pause_ratio: float
+) -> str:
+    """말하기 패턴 분석"""
+
+    # 1. 매우 긴 pause가 많은 경우
+    if pause_ratio > 0.5:
+        return "very_sparse"  # 매우 띄엄띄엄
+
+    # 2. 짧은 문장 + 긴 pause 패턴
+    if pause_pattern in ["long", "very_long"] and speech_density < 0.6:
+        return "staccato"  # 끊어 말하기
+
+    # 3. 연속적인 발화
+    if speech_density > 0.8 and pause_pattern in ["very_short", "short", "no_pause"]:
+        return "continuous"  # 연속적
+
+    # 4. 일정한 속도의 발화
+    if wpm_cv < 0.2:
+        return "steady"  # 일정한 속도
+
+    # 5. 변화가 큰 발화
+    if wpm_cv > 0.4:
+        return "variable"  # 속도 변화 큼
+
+    # 6. 기본
+    return "normal"  # 일반적
+
+
+# 기존 호환성을 위한 별칭 (구 함수명 유지)
+def calculate_speech_metrics(
+    segments_list: list,
+    audio_duration: float,
+    scenario: str = "presentation",
+    language: str = "ko"
+) -> Dict[str, Any]:
+    """기존 호환성을 위한 래퍼 함수"""
+    result = calculate_segment_based_metrics(segments_list, audio_duration, scenario, language)
+
+    # 기존 형식으로 변환
+    return {
+        "wpm_active": result["wpm_active"],
+        "wpm_total": result["wpm_total"],
+        "evaluation_wpm": result["evaluation_wpm"],
+        "word_count": result["word_count"],
+        "speech_duration": result["speech_duration"],
+        "total_duration": result["total_duration"],
+        "speech_density": result["speech_density"],
+        "pause_pattern": result["pause_metrics"],
+        "speed_category": result["speed_category"],
+        # 새로운 메트릭 추가
+        "segment_metrics": result["segment_metrics"],
+        "average_segment_wpm": result["average_segment_wpm"],
+        "median_segment_wpm": result["median_segment_wpm"],
+        "speech_pattern": result["speech_pattern"]
+    }
+
+
+def count_syllables(text: str, language: str) -> int:
+    """언어별 음절 수 계산 (코드포인트 범위 비교)"""
+    return int(np.count_nonzero(_syllable_mask(text, language)))
+
+
+def calculate_speech_variability(segments_list: list, columns: Optional[SegmentColumns] = None) -> Dict[str, float]:
+    """
+    세그먼트 간 속도 변동성 계산
+
+    Args:
+        segments_list: 인식된 세그먼트 목록
+        columns: 미리 추출한 세그먼트 열 (없으면 새로 추출)
+
+    Returns:
+        변동계수, 표준편차, 평균
+    """
+    if not segments_list or len(segments_list) < 2:
+        return {"cv": 0, "std": 0, "mean": 0}
+
+    if columns is None:
+        columns = SegmentColumns.from_segments(segments_list)
+
+    # 단어 타임스탬프가 있고 길이가 양수인 세그먼트만 사용
+    mask = columns.has_words & (columns.durations > 0)
+    speeds = columns.word_counts[mask] / columns.durations[mask] * 60
+    segment_speeds = speeds.tolist()
+
+    if not segment_speeds:
+        return {"cv": 0, "std": 0, "mean": 0}
+
+    mean_speed = sum(segment_speeds) / len(segment_speeds)
+    variance = sum(d ** 2 for d in (speeds - mean_speed).tolist()) / len(segment_speeds)
+    std_speed = variance ** 0.5
+    cv = std_speed / mean_speed if mean_speed > 0 else 0
+
+    return {
+        "cv": round(cv, 3),           # 변동계수
+        "std": round(std_speed, 2),    # 표준편차
+        "mean": round(mean_speed, 2)   # 평균
+    }
@@ -0,0 +1,67 @@
+import time
+from typing import Any, Dict, Optional
+
+from app.core.metrics import STAGE_LATENCY, metric_labels
+
+# 단계 이름과 구간 (시작 표시, 끝 표시)
+STAGES = (
+    ("buffering", "buffer_start", "buffer_cut"),  # 윈도우 첫 프레임 수신 ~ 버퍼 절단
+    ("queue_wait", "queue_enter", "inference_start"),  # 스케줄러 대기열
+    ("inference", "inference_start", "inference_end"),  # 모델 추론 (배치 단위)
+    ("metrics", "inference_end", "metrics_end"),  # 결과 정리 및 말하기 속도 메트릭
+    ("emotion", "emotion_start", "emotion_end"),  # 감정분석 서비스 호출 (전사와 병렬)
+    ("emotion_wait", "metrics_end", "emotion_merged"),  # 메트릭 이후 감정분석 결과 대기
+    ("total", "buffer_cut", "send"),  # 버퍼 절단 ~ 결과 전송
+)
+
+
+class StageTimer:
+    """
+    윈도우 처리 단계별 monotonic 시각(time.perf_counter) 기록
+
+    모든 윈도우의 단계별 소요 시간은 stt_stage_latency_seconds 히스토그램에 집계되고,
+    timing 플래그가 켜진 연결에는 전송 메시지의 timing 블록으로도 포함된다.
+    """
+
+    def __init__(self, buffer_start: Optional[float] = None) -> None:
+        self.marks: Dict[str, float] = {}
+        if buffer_start is not None:
+            self.marks["buffer_start"] = buffer_start
+
+    def mark(self, name: str, at: Optional[float] = None) -> None:
+        """단계 시각 기록 (at이 없으면 현재 시각)"""
+        self.marks[name] = time.perf_counter() if at is None else at
+
+    def durations(self) -> Dict[str, float]:
+        """시작/끝 시각이 모두 기록된 단계의 소요 시간 (초)"""
+        durations = {}
+        for stage, start, end in STAGES:
+            if start in self.marks and end in self.marks:
+                durations[stage] = max(self.marks[end] - self.marks[start], 0.0)
+        return durations
+
+    def observe(self, scenario: str, language: str) -> None:
+        """단계별 소요 시간을 히스토그램에 기록"""
+        labels = metric_labels(scenario, language)
+        for stage, seconds in self.durations().items():
+            STAGE_LATENCY.labels(stage, *labels).observe(seconds)
+
+    def breakdown(self, audio_seconds: float) -> Dict[str, Any]:
+        """
+        전송 메시지용 timing 블록
+
+        Args:
+            audio_seconds: 윈도우 오디오 길이 (초)
+
+        Returns:
+            단계별 소요 시간(ms), 버퍼 절단 기준 시각(ms), 실시간 배율
+        """
+        durations = self.durations()
+        origin = self.marks.get("buffer_cut", 0.0)
+        inference = durations.get("inference")
+        return {
+            "stages_ms": {stage: round(durations[stage] * 1000, 2) if stage in durations else None for stage, _, _ in STAGES},
+            "marks_ms": {name: round((at - origin) * 1000, 2) for name, at in sorted(self.marks.items(), key=lambda item: item[1])},
+            "audio_seconds": round(audio_seconds, 2),
+            "real_time_factor": round(inference / audio_seconds, 4) if inference is not None and audio_seconds > 0 else None
+        }
@@ -0,0 +1,153 @@
+import re
+from dataclasses import dataclass
+from typing import List, Optional
+
+from app.core.config import settings
+
+
+@dataclass
+class StreamWord:
+    """스트리밍 가설 단어 (세션 기준 절대 시간)"""
+    start: float
+    end: float
+    word: str
+
+
+_NORMALIZE_PATTERN = re.compile(r"[^\w]+")
+
+
+def _normalize(word: str) -> str:
+    """비교용 단어 정규화 (구두점/공백 제거, 소문자)"""
+    return _NORMALIZE_PATTERN.sub("", word).lower()
+
+
+def join_words(words: List[StreamWord]) -> str:
+    """단어 목록을 텍스트로 결합"""
+    return "".join(w.word for w in words).strip()
+
+
+class LocalAgreementPolicy:
+    """
+    Local Agreement 확정 정책
+
+    연속된 두 가설이 공통으로 갖는 가장 긴 접두 단어열만 확정(commit)하고,
+    나머지는 불안정(unstable) 부분으로 남겨 다음 가설과 다시 비교한다.
+    """
+
+    def __init__(self) -> None:
+        self.committed_end = 0.0  # 마지막으로 확정된 단어의 종료 시간
+        self.committed: List[StreamWord] = []
+        self.previous: List[StreamWord] = []
+
+    def insert(self, words: List[StreamWord]) -> List[StreamWord]:
+        """
+        새 가설을 넣고 이번에 확정된 단어 반환
+
+        Args:
+            words: 현재 윈도우의 가설 단어 목록
+
+        Returns:
+            새로 확정된 단어 목록
+        """
+        # 이미 확정된 구간의 단어 제거
+        new = [w for w in words if w.start > self.committed_end - 0.1]
+        new = self._drop_repeated_ngram(new)
+
+        commit = []
+        while new and self.previous and _normalize(new[0].word) == _normalize(self.previous[0].word):
+            commit.append(new.pop(0))
+            self.previous.pop(0)
+
+        self.previous = new
+        self._commit(commit)
+        return commit
+
+    def flush(self) -> List[StreamWord]:
+        """불안정 단어를 모두 확정"""
+        commit = self.previous
+        self.previous = []
+        self._commit(commit)
+        return commit
+
+    @property
+    def unstable(self) -> List[StreamWord]:
+        """아직 확정되지 않은 단어 목록"""
+        return self.previous
+
+    def _commit(self, words: List[StreamWord]) -> None:
+        if words:
+            self.committed.extend(words)
+            self.committed_end = words[-1].end
+            # 프롬프트/중복 제거에 필요한 만큼만 유지
+            del self.committed[:-50]
+
+    def _drop_repeated_ngram(self, new: List[StreamWord]) -> List[StreamWord]:
+        """윈도우 경계에서 이미 확정된 단어열이 다시 나오면 제거"""
+        if not new or not self.committed or abs(new[0].start - self.committed_end) >= 1.0:
+            return new
+        max_n = min(len(self.committed), len(new), 5)
+        for n in range(max_n, 0, -1):
+            tail = [_normalize(w.word) for w in self.committed[-n:]]
+            head = [_normalize(w.word) for w in new[:n]]
+            if tail == head:
+                return new[n:]
+        return new
+
+
+class StreamingState:
+    """
+    세션별 슬라이딩 윈도우 스트리밍 상태
+
+    링 버퍼의 앞부분은 아직 확정되지 않은 오디오이며, 확정된 단어 끝까지 잘라낸다.
+    따라서 연속된 윈도우는 불안정 구간만큼 서로 겹친다.
+    """
+
+    def __init__(self) -> None:
+        self.policy = LocalAgreementPolicy()
+        self.buffer_offset = 0.0  # 링 버퍼 시작 위치의 세션 기준 시간 (초)
+        self.samples_since_decode = 0  # 마지막 추론 이후 새로 들어온 샘플 수
+        self.dropped_samples_seen = 0  # 링 버퍼 용량 초과로 버려진 샘플 수 (반영 완료분)
+
+    @property
+    def hop_samples(self) -> int:
+        return int(settings.STREAMING_HOP_SECONDS * settings.SAMPLE_RATE)
+
+    def prompt(self) -> Optional[str]:
+        """확정된 텍스트의 끝부분을 초기 프롬프트로 사용"""
+        text = join_words(self.policy.committed)
+        return text[-settings.STREAMING_PROMPT_CHARS:] if text else None
+
+    def sync_dropped(self, dropped_samples: int) -> None:
+        """링 버퍼가 버린 샘플만큼 오프셋을 앞으로 이동"""
+        if dropped_samples > self.dropped_samples_seen:
+            self.buffer_offset += (dropped_samples - self.dropped_samples_seen) / settings.SAMPLE_RATE
+            self.dropped_samples_seen = dropped_samples
+
+    def needs_flush(self, window_seconds: float) -> bool:
+        """윈도우가 최대 길이를 넘었는데 확정된 구간이 없는지 여부"""
+        return (
+            window_seconds >= settings.STREAMING_MAX_WINDOW_SECONDS
+            and self.policy.committed_end <= self.buffer_offset
+        )
+
+    def trim_samples(self, window_seconds: float, drop_all: bool = False) -> int:
+        """
+        링 버퍼에서 잘라낼 샘플 수 계산 후 오프셋 갱신
+
+        확정된 단어 끝까지 잘라내며, drop_all이면 윈도우 전체를 버린다 (무음 구간).
+
+        Args:
+            window_seconds: 현재 윈도우 길이 (초)
+            drop_all: 윈도우 전체 제거 여부
+
+        Returns:
+            잘라낼 샘플 수
+        """
+        window_end = self.buffer_offset + window_seconds
+        trim_to = window_end if drop_all else min(self.policy.committed_end, window_end)
+        if trim_to <= self.buffer_offset:
+            return 0
+
+        samples = int((trim_to - self.buffer_offset) * settings.SAMPLE_RATE)
+        self.buffer_offset += samples / settings.SAMPLE_RATE
+        return samples
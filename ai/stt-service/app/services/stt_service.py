@@ -1,6 +1,5 @@
-import os
 import time
-import tempfile
+import asyncio
 from typing import Optional, Dict, Any, List, Tuple, BinaryIO
 import torch
 import whisperx
@@ -10,23 +9,70 @@ import faster_whisper
 
 from app.core.config import settings
 from app.core.logging import logger
+from app.core.metrics import AUDIO_SECONDS, INFERENCE_LATENCY, REAL_TIME_FACTOR, WARMUP_SECONDS, metric_labels
 from app.core.models import STTResponse, TimestampedWord
+from app.services.audio_decoder import decode_audio
+from app.services.synthetic_backend import SyntheticWhisperModel
+from app.services.warmup import first_request, warmup_model
+from app.services.worker_pool import InferenceWorkerPool
+
+# 지원하는 추론 백엔드
+# - faster_whisper: WhisperModel (CTranslate2)
+# - synthetic: 모델 없이 설정된 지연 시간 분포로 합성 결과 반환 (성능 테스트용)
+INFERENCE_BACKENDS = ("faster_whisper", "synthetic")
 
 class STTProcessor:
     """WhisperX 모델을 사용한 STT 처리 클래스"""
     
-    def __init__(self) -> None:
-        """STT 프로세서 초기화"""
+    def __init__(self, backend: Optional[str] = None) -> None:
+        """
+        STT 프로세서 초기화
+        
+        Args:
+            backend: 추론 백엔드 (None이면 settings.INFERENCE_BACKEND)
+        """
+        self.backend = backend or settings.INFERENCE_BACKEND
+        if self.backend not in INFERENCE_BACKENDS:
+            raise ValueError(f"알 수 없는 추론 백엔드: {self.backend}. 지원되는 백엔드: {', '.join(INFERENCE_BACKENDS)}")
+        
         self.model = None
+        self.worker_pool: Optional[InferenceWorkerPool] = None  # INFERENCE_WORKER_PROCESSES > 0이면 model과 같은 객체
+        self.warmed_up = False  # 워밍업을 마쳤는지 여부 (실패해도 시도했으면 True)
+        self.warmup_stats: Optional[Dict[str, Any]] = None
         self.device = settings.DEVICE if torch.cuda.is_available() else "cpu"
         self.compute_type = settings.COMPUTE_TYPE
         self.model_name = settings.WHISPER_MODEL
         
-        logger.info(f"STT Processor 초기화 - 장치: {self.device}, 연산 타입: {self.compute_type}, 모델: {self.model_name}")
+        logger.info(f"STT Processor 초기화 - 장치: {self.device}, 연산 타입: {self.compute_type}, 모델: {self.model_name}, 백엔드: {self.backend}")
         
+    @property
+    def ready(self) -> bool:
+        """요청을 받을 준비가 되었는지 여부 (모델 로드 후 워밍업까지 마침)"""
+        return self.model is not None and (self.warmed_up or not settings.WARMUP_ENABLED)
+    
     async def load_model(self) -> None:
-        """WhisperX 모델 로드 (지연 로딩)"""
-        if self.model is None:
+        """WhisperX 모델 로드 후 워밍업 (지연 로딩, INFERENCE_WORKER_PROCESSES > 0이면 워커 프로세스마다 로드)"""
+        if self.model is None and settings.INFERENCE_WORKER_PROCESSES > 0:
+            pool = InferenceWorkerPool(
+                backend=self.backend,
+                model_name=self.model_name,
+                device=self.device,
+                compute_type=self.compute_type
+            )
+            try:
+                await asyncio.get_running_loop().run_in_executor(None, pool.start)
+            except Exception as e:
+                logger.error(f"추론 워커 풀 시작 실패: {str(e)}", exc_info=True)
+                raise RuntimeError(f"모델 로딩 실패: {str(e)}")
+            self.worker_pool = pool
+            self.model = pool
+        elif self.model is None and self.backend == "synthetic":
+            self.model = SyntheticWhisperModel()
+            logger.info(
+                f"합성 추론 백엔드 사용 - 지연 시간: {settings.SYNTHETIC_LATENCY_MS}ms + "
+                f"{settings.SYNTHETIC_LATENCY_PER_AUDIO_SECOND_MS}ms/오디오 초 (sigma {settings.SYNTHETIC_LATENCY_SIGMA})"
+            )
+        elif self.model is None:
             logger.info("WhisperX 모델 로딩 시작...")
             start_time = time.time()
             
@@ -63,6 +109,51 @@ class STTProcessor:
                 gc.collect()
                 
                 raise RuntimeError(f"모델 로딩 실패: {str(e)}")
+        
+        if self.model is not None and not self.warmed_up and settings.WARMUP_ENABLED:
+            await self._warmup()
+    
+    async def _warmup(self) -> None:
+        """
+        대표 입력으로 모델 워밍업 (빔 크기 x 오디오 길이 조합, 배치 경로, VAD)
+        
+        워커 풀은 워커마다 시작할 때 스스로 워밍업하므로 결과만 모은다.
+        워밍업이 실패해도 서비스는 계속 실행한다 (첫 요청이 초기화 비용을 치름).
+        """
+        if self.worker_pool is not None:
+            workers = [w["warmup_seconds"] for w in self.worker_pool.get_stats()["workers"]]
+            completed = [seconds for seconds in workers if seconds is not None]
+            self.warmup_stats = {"workers": workers, "seconds": max(completed) if completed else None}
+        else:
+            logger.info(f"모델 워밍업 시작 - 오디오 길이: {settings.WARMUP_AUDIO_SECONDS}초, 빔 크기: {settings.WARMUP_BEAM_SIZES}")
+            try:
+                self.warmup_stats = await asyncio.get_running_loop().run_in_executor(None, warmup_model, self.model)
+            except Exception as e:
+                logger.warning(f"모델 워밍업 실패 (서비스는 계속 실행): {str(e)}", exc_info=True)
+                self.warmup_stats = {"error": str(e), "seconds": None}
+        
+        if self.warmup_stats["seconds"] is not None:
+            WARMUP_SECONDS.set(self.warmup_stats["seconds"])
+            first_request.warmed_up = True
+        self.warmed_up = True
+    
+    async def shutdown(self) -> None:
+        """추론 워커 풀 종료 (워커를 사용하지 않으면 아무 것도 하지 않음)"""
+        if self.worker_pool is not None:
+            pool, self.worker_pool, self.model = self.worker_pool, None, None
+            self.warmed_up = False
+            await asyncio.get_running_loop().run_in_executor(None, pool.close)
+    
+    @staticmethod
+    def _observe_inference(scenario: str, language: Optional[str], elapsed: float, num_samples: int) -> None:
+        """파일 업로드 경로의 추론 시간, 오디오 길이, 실시간 배율 기록"""
+        labels = metric_labels(scenario, language)
+        audio_seconds = num_samples / settings.SAMPLE_RATE
+        first_request.observe(elapsed)
+        INFERENCE_LATENCY.labels(*labels).observe(elapsed)
+        AUDIO_SECONDS.labels(*labels).observe(audio_seconds)
+        if audio_seconds > 0:
+            REAL_TIME_FACTOR.labels(*labels).observe(elapsed / audio_seconds)
     
     def _prepare_transcribe_params(self, language: str, scenario: str, return_timestamps: bool) -> Dict[str, Any]:
         """
@@ -132,6 +223,11 @@ class STTProcessor:
         logger.info(f"단어 타임스탬프 처리 완료. 총 {len(words_list)}개 단어")
         return words_list
     
+    def _transcribe(self, audio: np.ndarray, transcribe_params: Dict[str, Any]) -> Tuple[list, Any]:
+        """모델 추론 후 세그먼트 제너레이터를 리스트로 변환 (작업 스레드에서 실행)"""
+        segments, info = self.model.transcribe(audio, **transcribe_params)
+        return list(segments), info
+    
     async def process_audio(
         self, 
         audio_file: UploadFile, 
@@ -155,11 +251,6 @@ class STTProcessor:
         """
         start_time = time.time()
         
-        # 임시 파일 저장
-        temp_file_path = await self._save_temp_file(audio_file)
-        
-        logger.info(f"임시 파일 저장 완료: {temp_file_path}, 파일명: {audio_file.filename}")
-        
         # 임시로 연산 타입 변경이 필요한 경우
         current_compute_type = self.compute_type
         if compute_type and compute_type != self.compute_type:
@@ -170,20 +261,21 @@ class STTProcessor:
             # 오디오 처리
             logger.info(f"오디오 파일 처리 시작: {audio_file.filename}")
             
-            # 오디오 로드
-            audio = whisperx.load_audio(temp_file_path)
+            # 오디오 로드 (업로드 파일 객체에서 바로 디코딩, 임시 파일 없음)
+            loop = asyncio.get_running_loop()
+            audio = await loop.run_in_executor(None, decode_audio, audio_file.file, audio_file.filename)
             
             logger.info(f"오디오 로드 완료. 오디오 길이: {len(audio) / settings.SAMPLE_RATE:.2f}초")
             
             # transcribe 매개변수 준비
             transcribe_params = self._prepare_transcribe_params(language, scenario, return_timestamps)
             
-            # 모델 추론
-            segments, info = self.model.transcribe(audio, **transcribe_params)
+            # 모델 추론 (워커 풀은 워커가 빌 때까지, 로컬 모델은 제너레이터를 소비하며 디코딩하는 동안 스레드를 막으므로 작업 스레드에서 실행)
+            inference_start = time.perf_counter()
+            segments_list, info = await loop.run_in_executor(None, self._transcribe, audio, transcribe_params)
             logger.info(f"모델 추론 완료. 감지된 언어: {info.language}, 확률: {info.language_probability:.2f}")
             
-            # 결과 수집
-            segments_list = list(segments)  # 제너레이터를 리스트로 변환
+            self._observe_inference(scenario, language, time.perf_counter() - inference_start, len(audio))
             
             # 세그먼트 텍스트 추출
             segment_texts = [segment.text for segment in segments_list]
@@ -215,33 +307,9 @@ class STTProcessor:
             return response
             
         finally:
-            # 임시 파일 삭제
-            if os.path.exists(temp_file_path):
-                os.remove(temp_file_path)
-            
             # 원래 계산 타입으로 복원
             if compute_type:
                 self.compute_type = current_compute_type
-    
-    async def _save_temp_file(self, file: UploadFile) -> str:
-        """
-        업로드된 파일을 임시 파일로 저장
-        
-        Args:
-            file: 업로드된 파일
-            
-        Returns:
-            임시 파일 경로
-        """
-        # 임시 파일 생성
-        temp_file = tempfile.NamedTemporaryFile(delete=False, dir=settings.TEMP_AUDIO_DIR, suffix=f".{file.filename.split('.')[-1]}")
-        
-        # 파일 내용 쓰기
-        content = await file.read()
-        temp_file.write(content)
-        temp_file.close()
-        
-        return temp_file.name
 
 
 # 싱글톤 인스턴스 생성
@@ -0,0 +1,125 @@
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+from faster_whisper.transcribe import Segment, Word
+
+from app.core.config import settings
+
+# 합성 전사에 사용하는 단어 (한국어 발표 문장)
+SYNTHETIC_WORDS = ("안녕하세요", "오늘", "발표", "주제는", "실시간", "음성", "인식과", "감정", "분석", "입니다")
+SYNTHETIC_SEGMENT_SECONDS = 3.0  # 세그먼트 길이 (초)
+SYNTHETIC_WORDS_PER_SECOND = 2.5  # 발화 속도 (150 WPM)
+
+
+class SyntheticLatency:
+    """
+    합성 추론 지연 시간 분포
+
+    (기본 + 오디오 초당 지연) ms에 중앙값 1인 로그정규 배수를 곱한 시간만큼
+    작업 스레드를 재운다 (GIL을 놓으므로 실제 추론 스레드처럼 동작).
+    """
+
+    def __init__(
+        self,
+        base_ms: float = settings.SYNTHETIC_LATENCY_MS,
+        per_audio_second_ms: float = settings.SYNTHETIC_LATENCY_PER_AUDIO_SECOND_MS,
+        sigma: float = settings.SYNTHETIC_LATENCY_SIGMA,
+        seed: int = settings.SYNTHETIC_SEED,
+    ) -> None:
+        self.base_ms = base_ms
+        self.per_audio_second_ms = per_audio_second_ms
+        self.sigma = sigma
+        self._rng = np.random.default_rng(seed)
+        self._lock = threading.Lock()
+
+    def sample(self, audio_seconds: float) -> float:
+        """지연 시간 추출 (초)"""
+        with self._lock:
+            factor = self._rng.lognormal(0.0, self.sigma) if self.sigma > 0 else 1.0
+        return (self.base_ms + self.per_audio_second_ms * audio_seconds) * factor / 1000
+
+    def wait(self, audio_seconds: float) -> None:
+        time.sleep(self.sample(audio_seconds))
+
+
+@dataclass
+class SyntheticTranscriptionInfo:
+    """faster_whisper TranscriptionInfo 중 서비스가 사용하는 필드"""
+    language: str
+    language_probability: float
+    duration: float
+    duration_after_vad: float
+
+
+class SyntheticWhisperModel:
+    """
+    faster_whisper.WhisperModel 대체 합성 백엔드
+
+    실제 모델 없이 설정된 지연 시간 분포만큼 기다린 뒤, 오디오 길이에 맞춘 세그먼트와
+    단어 타임스탬프를 faster_whisper와 같은 자료형으로 반환한다.
+    스케줄러, 버퍼링, 직렬화, 네트워크 오버헤드를 모델 비용과 분리해 측정하는 용도.
+    """
+
+    def __init__(self, latency: Optional[SyntheticLatency] = None) -> None:
+        self.latency = latency or SyntheticLatency()
+
+    def transcribe(self, audio: np.ndarray, **params: Any) -> Tuple[Iterator[Segment], SyntheticTranscriptionInfo]:
+        """WhisperModel.transcribe와 같은 형식 (세그먼트 이터레이터, 정보)"""
+        duration = len(audio) / settings.SAMPLE_RATE
+        self.latency.wait(duration)
+        return iter(self._segments(duration, params.get("word_timestamps", False))), self._info(duration, params)
+
+    def transcribe_batch(self, audios: List[np.ndarray], params: Dict[str, Any]) -> List[Tuple[list, SyntheticTranscriptionInfo]]:
+        """
+        여러 윈도우를 한 번의 배치로 처리 (지연 시간은 배치 전체 오디오 기준으로 한 번)
+
+        Returns:
+            요청 순서대로 (세그먼트 리스트, 정보)
+        """
+        durations = [len(audio) / settings.SAMPLE_RATE for audio in audios]
+        self.latency.wait(sum(durations))
+        word_timestamps = params.get("word_timestamps", False)
+        return [(self._segments(d, word_timestamps), self._info(d, params)) for d in durations]
+
+    @staticmethod
+    def _info(duration: float, params: Dict[str, Any]) -> SyntheticTranscriptionInfo:
+        return SyntheticTranscriptionInfo(
+            language=params.get("language") or "ko",
+            language_probability=1.0,
+            duration=duration,
+            duration_after_vad=duration
+        )
+
+    @staticmethod
+    def _segments(duration: float, word_timestamps: bool) -> List[Segment]:
+        segments = []
+        start = 0.0
+        while duration - start >= 0.5:
+            end = min(start + SYNTHETIC_SEGMENT_SECONDS, duration)
+            count = max(int((end - start) * SYNTHETIC_WORDS_PER_SECOND), 1)
+            step = (end - start) / count
+            tokens = [SYNTHETIC_WORDS[(len(segments) + i) % len(SYNTHETIC_WORDS)] for i in range(count)]
+            words = None
+            if word_timestamps:
+                words = [
+                    Word(start=round(start + i * step, 2), end=round(start + (i + 0.8) * step, 2), word=" " + token, probability=0.9)
+                    for i, token in enumerate(tokens)
+                ]
+            segments.append(Segment(
+                id=len(segments) + 1,
+                seek=int(start * 100),
+                start=round(start, 2),
+                end=round(end, 2),
+                text=" " + " ".join(tokens),
+                tokens=[],
+                avg_logprob=-0.2,
+                compression_ratio=1.2,
+                no_speech_prob=0.01,
+                words=words,
+                temperature=0.0
+            ))
+            start = end
+        return segments
@@ -0,0 +1,110 @@
+import time
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from app.core.config import settings
+from app.core.logging import logger
+from app.core.metrics import FIRST_REQUEST_LATENCY
+
+
+def warmup_audio(seconds: float) -> np.ndarray:
+    """워밍업용 합성 신호 (음성 대역 배음이 0.5초 간격으로 켜지고 꺼지는 신호 + 약한 잡음)"""
+    samples = int(seconds * settings.SAMPLE_RATE)
+    t = np.arange(samples) / settings.SAMPLE_RATE
+    rng = np.random.default_rng(0)
+    voiced = sum(np.sin(2 * np.pi * 180 * k * t) / k for k in range(1, 6)) * (np.sin(2 * np.pi * t) > 0)
+    return (0.1 * voiced + 0.01 * rng.standard_normal(samples)).astype(np.float32)
+
+
+def warmup_model(
+    model,
+    audio_seconds: Optional[List[float]] = None,
+    beam_sizes: Optional[List[int]] = None,
+) -> Dict[str, Any]:
+    """
+    대표 입력으로 모델을 미리 실행해 첫 요청의 초기화 비용(메모리 할당, 커널 선택, 토크나이저/특징 추출기 첫 호출)을 치름
+
+    빔 크기와 오디오 길이 조합마다 단일 추론(단어 타임스탬프 포함)을 실행하고,
+    INFERENCE_MAX_BATCH_SIZE > 1이면 빔 크기마다 배치 추론도 한 번 실행한다.
+    디코더까지 실행되도록 VAD 없이 추론한 뒤, 마지막에 Silero VAD를 켠 추론을 한 번 더 실행한다.
+
+    Args:
+        model: WhisperModel 또는 같은 인터페이스의 모델 (synthetic, 워커 안의 복제본)
+        audio_seconds: 워밍업 오디오 길이 목록 (None이면 settings.WARMUP_AUDIO_SECONDS)
+        beam_sizes: 워밍업 빔 크기 목록 (None이면 settings.WARMUP_BEAM_SIZES)
+
+    Returns:
+        실행 횟수, 전체 시간, 실행별 시간
+    """
+    # inference_scheduler가 first_request를 가져오므로 순환 import를 피해 함수 안에서 import
+    from app.services.inference_scheduler import MAX_BATCH_CHUNK_SECONDS, InferenceRequest, InferenceScheduler
+
+    audio_seconds = audio_seconds or settings.WARMUP_AUDIO_SECONDS
+    beam_sizes = beam_sizes or settings.WARMUP_BEAM_SIZES
+    batch_seconds = min(min(audio_seconds), MAX_BATCH_CHUNK_SECONDS)
+    audios = {seconds: warmup_audio(seconds) for seconds in {*audio_seconds, batch_seconds}}
+    batch_size = min(settings.INFERENCE_MAX_BATCH_SIZE, 2)
+
+    runs = []
+    start_time = time.perf_counter()
+
+    def run(name: str, seconds: float, params: Dict[str, Any], count: int = 1) -> None:
+        requests = [InferenceRequest(audio=audios[seconds], params=params, future=None) for _ in range(count)]
+        started = time.perf_counter()
+        if count == 1:
+            InferenceScheduler._transcribe_single(model, requests[0])
+        else:
+            InferenceScheduler._transcribe_batch(model, requests)
+        elapsed = time.perf_counter() - started
+        runs.append({"run": name, "audio_seconds": seconds, "beam_size": params["beam_size"], "seconds": round(elapsed, 3)})
+        logger.debug(f"워밍업 {name} - 오디오 {seconds:g}초, 빔 {params['beam_size']}: {elapsed:.3f}초")
+
+    for beam_size in beam_sizes:
+        params = {
+            "language": "ko",
+            "beam_size": beam_size,
+            "word_timestamps": True,
+            "vad_filter": False,
+            "task": settings.TRANSCRIBE_PARAMS.get("task", "transcribe"),
+            "condition_on_previous_text": settings.TRANSCRIBE_PARAMS.get("condition_on_previous_text", True),
+        }
+        for seconds in audio_seconds:
+            run("single", seconds, params)
+        if batch_size > 1:
+            run("batch", batch_seconds, params, count=batch_size)
+
+    run("vad", max(audio_seconds), {
+        "language": "ko",
+        "beam_size": beam_sizes[0],
+        "word_timestamps": True,
+        "vad_filter": True,
+        "vad_parameters": settings.TRANSCRIBE_PARAMS["vad_parameters"],
+    })
+
+    total = time.perf_counter() - start_time
+    logger.info(
+        f"모델 워밍업 완료 - {len(runs)}회 추론, 소요 시간: {total:.2f}초 "
+        f"(첫 추론 {runs[0]['seconds']:.3f}초, 마지막 추론 {runs[-1]['seconds']:.3f}초)"
+    )
+    return {"runs": len(runs), "seconds": round(total, 3), "details": runs}
+
+
+class FirstRequestTracker:
+    """프로세스 시작 후 첫 추론 요청의 처리 시간 기록 (워밍업 효과 확인용)"""
+
+    def __init__(self) -> None:
+        self.warmed_up = False  # 첫 요청 전에 워밍업을 마쳤는지 여부
+        self.latency: Optional[float] = None
+
+    def observe(self, elapsed: float) -> None:
+        """추론 시간 기록 (프로세스당 처음 한 번만)"""
+        if self.latency is not None:
+            return
+        self.latency = elapsed
+        FIRST_REQUEST_LATENCY.labels(str(self.warmed_up).lower()).set(elapsed)
+        logger.info(f"첫 추론 요청 처리 시간: {elapsed:.3f}초 (워밍업 {'완료' if self.warmed_up else '없음'})")
+
+
+# 싱글톤 인스턴스 생성
+first_request = FirstRequestTracker()
@@ -1,23 +1,41 @@
 import asyncio
 import json
+import logging
 import time
 import uuid
-from typing import Dict, List, Any, Optional, Callable, Awaitable
+from typing import Dict, FrozenSet, List, Any, Optional, Callable, Awaitable, Tuple
 import numpy as np
 import whisperx
 from fastapi import WebSocket, WebSocketDisconnect
 from starlette.websockets import WebSocketState
-import httpx
 
-from app.core.logging import logger
+from app.core.logging import logger, frame_logger
+from app.core.metrics import ACTIVE_SESSIONS, WEBSOCKET_FRAME_BYTES, metric_labels
 from app.core.config import settings
+from app.core.serialization import encode_message, parse_fields, select_fields
 from app.services.stt_service import stt_processor
+from app.core.models import STTStreamingResponse
+from app.services.audio_buffer import AudioRingBuffer
+from app.services.streaming_service import StreamingState, StreamWord, join_words
+from app.services.inference_scheduler import MAX_BATCH_CHUNK_SECONDS, InferenceScheduler, InferenceOverloadedError
+from app.services.emotion_client import emotion_client
+from app.services.session_metrics import SessionMetricsAccumulator
+from app.services.stage_timing import StageTimer
+from app.services.endpointer import EnergyEndpointer, endpoint_stats
+from app.services.silence_gate import GateDecision, silence_gate, silence_pause_metrics
+from app.services.speech_metrics import (
+    SegmentColumns,
+    calculate_segment_based_metrics,
+    calculate_speech_variability,
+    classify_pause,
+    count_syllables
+)
 
 # WhisperX 3.3.4에서는 whisperx.audio 모듈이 제거되었으므로 직접 상수 정의
 
 async def call_emotion_analysis(audio_bytes: bytes, scenario: str, language: str) -> Optional[Dict[str, Any]]:
     """
-    감정분석 서비스 호출
+    감정분석 서비스 호출 (앱 공용 연결 풀 사용)
     
     Args:
         audio_bytes: 오디오 바이너리 데이터
@@ -27,339 +45,32 @@ async def call_emotion_analysis(audio_bytes: bytes, scenario: str, language: str
     Returns:
         감정분석 결과 또는 None (실패 시)
     """
-    try:
-        emotion_service_url = "http://localhost:8001/api/v1/emotion/analyze_bytes"
-        
-        params = {
-            "scenario": scenario,
-            "language": language,
-            "apply_scenario_weights": True,
-            "top_k": 6  # 모든 감정 반환 (6개 모든 감정 라벨)
-        }
-        
-        async with httpx.AsyncClient(timeout=30.0) as client:  # 타임아웃 30초로 증가
-            response = await client.post(
-                emotion_service_url,
-                content=audio_bytes,
-                params=params,
-                headers={"Content-Type": "application/octet-stream"}
-            )
-            
-            if response.status_code == 200:
-                emotion_result = response.json()
-                logger.debug(f"감정분석 완료 - 주 감정: {emotion_result['primary_emotion']['emotion_kr']} ({emotion_result['primary_emotion']['probability']:.3f})")
-                return emotion_result
-            else:
-                logger.warning(f"감정분석 서비스 오류: HTTP {response.status_code}")
-                return None
-                
-    except httpx.TimeoutException:
-        logger.warning("감정분석 서비스 호출 시간 초과")
-        return None
-    except httpx.ConnectError:
-        logger.warning("감정분석 서비스에 연결할 수 없습니다 (포트 8001)")
-        return None
-    except Exception as e:
-        logger.warning(f"감정분석 서비스 호출 중 오류: {str(e)}")
-        return None
+    return await emotion_client.analyze(audio_bytes, scenario, language)
 
 
-def calculate_segment_based_metrics(
-    segments_list: list,
-    audio_duration: float,
-    scenario: str = "presentation",
-    language: str = "ko"
-) -> Dict[str, Any]:
+def format_emotion_result(emotion_result: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
     """
-    세그먼트별 말하기 속도 및 관련 메트릭 계산
+    감정분석 결과에서 클라이언트로 전송할 필드만 추출
     
+    Args:
+        emotion_result: 감정분석 서비스 응답 또는 None
+        
     Returns:
-        - segment_wpm_list: 각 세그먼트의 WPM
-        - average_segment_wpm: 세그먼트 WPM의 평균
-        - median_segment_wpm: 세그먼트 WPM의 중앙값
-        - pause_metrics: pause 관련 메트릭
-        - speech_pattern: 말하기 패턴 분석
+        전송용 감정분석 결과 또는 None
     """
-    if not segments_list or audio_duration <= 0:
-        return {
-            "segment_wpm_list": [],
-            "average_segment_wpm": 0,
-            "median_segment_wpm": 0,
-            "wpm_active": 0,
-            "wpm_total": 0,
-            "speech_density": 0,
-            "pause_metrics": {},
-            "speech_pattern": "no_data",
-            "speed_category": "no_data"
-        }
-    
-    # 1. 세그먼트별 WPM 계산
-    segment_metrics = []
-    total_word_count = 0
-    total_speech_duration = 0
-    pause_durations = []
-    
-    for i, segment in enumerate(segments_list):
-        if hasattr(segment, 'start') and hasattr(segment, 'end'):
-            segment_duration = segment.end - segment.start
-            
-            # 단어 수 계산
-            word_count = 0
-            if hasattr(segment, 'words') and segment.words:
-                word_count = len(segment.words)
-            elif hasattr(segment, 'text'):
-                # words가 없는 경우 텍스트 기반 추정
-                word_count = len(segment.text.split())
-            
-            total_word_count += word_count
-            total_speech_duration += segment_duration
-            
-            # 세그먼트 WPM 계산
-            segment_wpm = (word_count / segment_duration * 60) if segment_duration > 0 else 0
-            
-            segment_metrics.append({
-                "index": i,
-                "text": segment.text if hasattr(segment, 'text') else "",
-                "start": segment.start,
-                "end": segment.end,
-                "duration": segment_duration,
-                "word_count": word_count,
-                "wpm": segment_wpm,
-                "spm": count_syllables(segment.text, language) / segment_duration * 60 if segment_duration > 0 else 0
-            })
-            
-            # Pause 계산 (다음 세그먼트와의 간격)
-            if i < len(segments_list) - 1:
-                next_segment = segments_list[i + 1]
-                if hasattr(next_segment, 'start'):
-                    pause = next_segment.start - segment.end
-                    if pause > 0:
-                        pause_durations.append(pause)
-    
-    # 2. 세그먼트 WPM 통계
-    segment_wpm_list = [m["wpm"] for m in segment_metrics if m["wpm"] > 0]
-    
-    if segment_wpm_list:
-        average_segment_wpm = sum(segment_wpm_list) / len(segment_wpm_list)
-        median_segment_wpm = sorted(segment_wpm_list)[len(segment_wpm_list) // 2]
-        wpm_std = (sum((w - average_segment_wpm) ** 2 for w in segment_wpm_list) / len(segment_wpm_list)) ** 0.5
-        wpm_cv = wpm_std / average_segment_wpm if average_segment_wpm > 0 else 0
-    else:
-        average_segment_wpm = median_segment_wpm = wpm_std = wpm_cv = 0
-    
-    # 3. 기존 메트릭 호환성 (wpm_active, wpm_total)
-    wpm_active = (total_word_count / total_speech_duration * 60) if total_speech_duration > 0 else 0
-    wpm_total = (total_word_count / audio_duration * 60) if audio_duration > 0 else 0
-    
-    # 4. 발화 밀도
-    speech_density = total_speech_duration / audio_duration if audio_duration > 0 else 0
-    
-    # 5. Pause 분석
-    if pause_durations:
-        pause_metrics = {
-            "count": len(pause_durations),
-            "total_duration": sum(pause_durations),
-            "average_duration": sum(pause_durations) / len(pause_durations),
-            "max_duration": max(pause_durations),
-            "min_duration": min(pause_durations),
-            "pause_ratio": sum(pause_durations) / audio_duration,
-            # 기존 호환성
-            "avg_duration": sum(pause_durations) / len(pause_durations)
-        }
-        
-        # Pause 패턴 분류
-        avg_pause = pause_metrics["average_duration"]
-        if avg_pause < 0.5:
-            pause_pattern = "very_short"
-        elif avg_pause < 1.0:
-            pause_pattern = "short"
-        elif avg_pause < 2.0:
-            pause_pattern = "normal"
-        elif avg_pause < 3.0:
-            pause_pattern = "long"
-        else:
-            pause_pattern = "very_long"
-    else:
-        pause_metrics = {
-            "count": 0,
-            "total_duration": 0,
-            "average_duration": 0,
-            "max_duration": 0,
-            "min_duration": 0,
-            "pause_ratio": 0,
-            # 기존 호환성
-            "avg_duration": 0
-        }
-        pause_pattern = "no_pause"
-    
-    # 6. 말하기 패턴 분석
-    speech_pattern = analyze_speech_pattern(
-        speech_density,
-        pause_pattern,
-        wpm_cv,
-        average_segment_wpm,
-        pause_metrics.get("pause_ratio", 0)
-    )
+    if not emotion_result:
+        return None
     
-    # 7. 속도 카테고리 결정 (세그먼트 평균 기준)
-    thresholds = settings.SCENARIO_SPEED_THRESHOLDS.get(scenario, {}).get(
-        language, 
-        settings.SCENARIO_SPEED_THRESHOLDS["presentation"]["ko"]
+    logger.info(
+        "감정분석 결과 포함 - 주 감정: %s (%.3f)",
+        emotion_result["primary_emotion"]["emotion_kr"], emotion_result["primary_emotion"]["probability"]
     )
-    
-    # 평가 기준 선택
-    if speech_pattern in ["staccato", "very_sparse"]:
-        # 끊어 말하기 패턴일 경우 중앙값 사용
-        evaluation_wpm = median_segment_wpm
-    else:
-        # 일반적인 경우 평균 사용
-        evaluation_wpm = average_segment_wpm
-    
-    # 속도 카테고리
-    if evaluation_wpm < thresholds["very_slow"]:
-        speed_category = "very_slow"
-    elif evaluation_wpm < thresholds["slow"]:
-        speed_category = "slow"
-    elif evaluation_wpm < thresholds["normal"]:
-        speed_category = "normal"
-    elif evaluation_wpm < thresholds["fast"]:
-        speed_category = "fast"
-    else:
-        speed_category = "very_fast"
-    
     return {
-        # 세그먼트 정보
-        "segment_metrics": segment_metrics,
-        "segment_wpm_list": segment_wpm_list,
-        "average_segment_wpm": round(average_segment_wpm, 2),
-        "median_segment_wpm": round(median_segment_wpm, 2),
-        "wpm_std": round(wpm_std, 2),
-        "wpm_cv": round(wpm_cv, 3),
-        # 기존 호환성 메트릭
-        "wpm_active": round(wpm_active, 2),
-        "wpm_total": round(wpm_total, 2),
-        "evaluation_wpm": round(evaluation_wpm, 2),
-        "word_count": total_word_count,
-        "speech_duration": round(total_speech_duration, 2),
-        "total_duration": round(audio_duration, 2),
-        "speech_density": round(speech_density, 3),
-        # Pause 메트릭
-        "pause_metrics": pause_metrics,
-        "pause_pattern": pause_pattern,
-        # 패턴 및 평가
-        "speech_pattern": speech_pattern,
-        "speed_category": speed_category
-    }
-
-
-def analyze_speech_pattern(
-    speech_density: float,
-    pause_pattern: str,
-    wpm_cv: float,
-    average_wpm: float,
-    pause_ratio: float
-) -> str:
-    """말하기 패턴 분석"""
-    
-    # 1. 매우 긴 pause가 많은 경우
-    if pause_ratio > 0.5:
-        return "very_sparse"  # 매우 띄엄띄엄
-    
-    # 2. 짧은 문장 + 긴 pause 패턴
-    if pause_pattern in ["long", "very_long"] and speech_density < 0.6:
-        return "staccato"  # 끊어 말하기
-    
-    # 3. 연속적인 발화
-    if speech_density > 0.8 and pause_pattern in ["very_short", "short", "no_pause"]:
-        return "continuous"  # 연속적
-    
-    # 4. 일정한 속도의 발화
-    if wpm_cv < 0.2:
-        return "steady"  # 일정한 속도
-    
-    # 5. 변화가 큰 발화
-    if wpm_cv > 0.4:
-        return "variable"  # 속도 변화 큼
-    
-    # 6. 기본
-    return "normal"  # 일반적
-
-
-# 기존 호환성을 위한 별칭 (구 함수명 유지)
-def calculate_speech_metrics(
-    segments_list: list,
-    audio_duration: float,
-    scenario: str = "presentation",
-    language: str = "ko"
-) -> Dict[str, Any]:
-    """기존 호환성을 위한 래퍼 함수"""
-    result = calculate_segment_based_metrics(segments_list, audio_duration, scenario, language)
-    
-    # 기존 형식으로 변환
-    return {
-        "wpm_active": result["wpm_active"],
-        "wpm_total": result["wpm_total"],
-        "evaluation_wpm": result["evaluation_wpm"],
-        "word_count": result["word_count"],
-        "speech_duration": result["speech_duration"],
-        "total_duration": result["total_duration"],
-        "speech_density": result["speech_density"],
-        "pause_pattern": result["pause_metrics"],
-        "speed_category": result["speed_category"],
-        # 새로운 메트릭 추가
-        "segment_metrics": result["segment_metrics"],
-        "average_segment_wpm": result["average_segment_wpm"],
-        "median_segment_wpm": result["median_segment_wpm"],
-        "speech_pattern": result["speech_pattern"]
-    }
-
-
-def count_syllables(text: str, language: str) -> int:
-    """언어별 음절 수 계산"""
-    if language == "ko":
-        # 한글 음절 수 (공백 제외)
-        return len([char for char in text if '가' <= char <= '힣'])
-    elif language == "ja":
-        # 일본어: 히라가나, 가타카나, 한자
-        return len([char for char in text if (
-            '\u3040' <= char <= '\u309F' or  # 히라가나
-            '\u30A0' <= char <= '\u30FF' or  # 가타카나
-            '\u4E00' <= char <= '\u9FAF'     # 한자
-        )])
-    elif language == "zh":
-        # 중국어: 한자
-        return len([char for char in text if '\u4E00' <= char <= '\u9FAF'])
-    else:
-        # 영어 등: 대략적인 음절 수 (모음 기준)
-        vowels = "aeiouAEIOU"
-        return sum(1 for char in text if char in vowels)
-
-
-def calculate_speech_variability(segments_list: list) -> Dict[str, float]:
-    """세그먼트 간 속도 변동성 계산"""
-    if not segments_list or len(segments_list) < 2:
-        return {"cv": 0, "std": 0, "mean": 0}
-    
-    segment_speeds = []
-    for segment in segments_list:
-        if hasattr(segment, 'words') and segment.words and hasattr(segment, 'start') and hasattr(segment, 'end'):
-            duration = segment.end - segment.start
-            if duration > 0:
-                wpm = len(segment.words) / duration * 60
-                segment_speeds.append(wpm)
-    
-    if not segment_speeds:
-        return {"cv": 0, "std": 0, "mean": 0}
-    
-    mean_speed = sum(segment_speeds) / len(segment_speeds)
-    variance = sum((s - mean_speed) ** 2 for s in segment_speeds) / len(segment_speeds)
-    std_speed = variance ** 0.5
-    cv = std_speed / mean_speed if mean_speed > 0 else 0
-    
-    return {
-        "cv": round(cv, 3),           # 변동계수
-        "std": round(std_speed, 2),    # 표준편차
-        "mean": round(mean_speed, 2)   # 평균
+        "primary_emotion": emotion_result["primary_emotion"],
+        "top_emotions": emotion_result["top_emotions"],
+        "scenario_applied": emotion_result["scenario_applied"],
+        "processing_time": emotion_result["processing_time"],
+        "model_used": emotion_result["model_used"]
     }
 
 
@@ -369,6 +80,8 @@ class ConnectionManager:
     """
     def __init__(self):
         self.active_connections: Dict[str, WebSocket] = {}
+        # 연결별 결과 메시지 형식 (인코딩, 제외할 키)
+        self.formats: Dict[str, Tuple[str, Optional[FrozenSet[str]]]] = {}
         
     async def connect(self, websocket: WebSocket) -> str:
         """
@@ -402,6 +115,18 @@ class ConnectionManager:
         if connection_id in self.active_connections:
             logger.info(f"WebSocket 연결 종료: {connection_id}")
             del self.active_connections[connection_id]
+        self.formats.pop(connection_id, None)
+    
+    def set_format(self, connection_id: str, encoding: str = "json", excluded: Optional[FrozenSet[str]] = None) -> None:
+        """
+        연결의 결과 메시지 형식 지정
+        
+        Args:
+            connection_id: 연결 ID
+            encoding: json 또는 msgpack
+            excluded: 메시지에서 제외할 키 (fields 선택자, None이면 전체)
+        """
+        self.formats[connection_id] = (encoding, excluded)
     
     async def send_text(self, connection_id: str, message: str) -> None:
         """
@@ -423,17 +148,44 @@ class ConnectionManager:
                 logger.error(f"메시지 전송 실패: {connection_id} - {str(e)}")
                 self.disconnect(connection_id)
     
+    async def send_bytes(self, connection_id: str, message: bytes) -> None:
+        """
+        바이너리 메시지 전송
+        
+        Args:
+            connection_id: 연결 ID
+            message: 전송할 바이너리 메시지
+        """
+        if connection_id in self.active_connections:
+            try:
+                websocket = self.active_connections[connection_id]
+                if websocket.client_state == WebSocketState.CONNECTED:
+                    await websocket.send_bytes(message)
+                else:
+                    logger.warning(f"연결이 닫힌 상태입니다: {connection_id}")
+                    self.disconnect(connection_id)
+            except Exception as e:
+                logger.error(f"메시지 전송 실패: {connection_id} - {str(e)}")
+                self.disconnect(connection_id)
+    
     async def send_json(self, connection_id: str, data: Dict[str, Any]) -> None:
         """
-        JSON 메시지 전송
+        결과 메시지 전송 (연결별 인코딩과 fields 선택 적용)
+        
+        json 연결은 텍스트 프레임, msgpack 연결은 바이너리 프레임으로 전송한다.
         
         Args:
             connection_id: 연결 ID
-            data: 전송할 JSON 데이터
+            data: 전송할 메시지
         """
         if connection_id in self.active_connections:
             try:
-                await self.send_text(connection_id, json.dumps(data))
+                encoding, excluded = self.formats.get(connection_id, ("json", None))
+                payload = encode_message(select_fields(data, excluded), encoding)
+                if isinstance(payload, bytes):
+                    await self.send_bytes(connection_id, payload)
+                else:
+                    await self.send_text(connection_id, payload)
             except Exception as e:
                 logger.error(f"JSON 메시지 전송 실패: {connection_id} - {str(e)}")
                 self.disconnect(connection_id)
@@ -447,7 +199,7 @@ class STTWebSocketManager:
         self.connection_manager = ConnectionManager()
         self.sessions: Dict[str, Dict[str, Any]] = {}
         
-    async def _initialize_session(self, connection_id: str, language: str, scenario: str = "presentation") -> None:
+    async def _initialize_session(self, connection_id: str, language: str, scenario: str = "presentation", mode: str = "batch", timing: bool = False) -> None:
         """
         WebSocket 세션 초기화
         
@@ -455,10 +207,13 @@ class STTWebSocketManager:
             connection_id: 연결 ID
             language: 인식 언어
             scenario: 시나리오 타입 (dating, interview, presentation)
+            mode: 처리 모드 (batch, streaming)
+            timing: 결과 메시지에 단계별 timing 블록 포함 여부
         """
-        logger.info(f"WebSocket 세션 초기화 시작: {connection_id}, 언어: {language}, 시나리오: {scenario}")
+        logger.info(f"WebSocket 세션 초기화 시작: {connection_id}, 언어: {language}, 시나리오: {scenario}, 모드: {mode}")
+        buffer_capacity = min(settings.AUDIO_RING_BUFFER_SIZE, settings.MAX_AUDIO_BUFFER_MB * 1024 * 1024)
         self.sessions[connection_id] = {
-            "buffer": bytearray(),
+            "buffer": AudioRingBuffer(buffer_capacity),
             "last_chunk_time": time.time(),
             "is_processing": False,
             "language": language,
@@ -466,10 +221,33 @@ class STTWebSocketManager:
             "segment_count": 0,
             "last_transcription": "",
             "is_first_segment": True,
-            "is_recording": False  # 초기에는 False로 설정
+            "is_recording": False,  # 초기에는 False로 설정
+            "mode": mode,
+            # 스트리밍 모드에서만 사용하는 슬라이딩 윈도우 상태
+            "streaming": StreamingState() if mode == "streaming" else None,
+            # batch 모드에서 발화 경계로 윈도우를 자르는 에너지 기반 검출기
+            "endpointer": self._create_endpointer(scenario) if mode != "streaming" else None,
+            # 세션 전체 누적 말하기 속도 메트릭
+            "session_metrics": SessionMetricsAccumulator(),
+            # 결과 메시지에 단계별 timing 블록 포함 여부
+            "timing": timing,
+            # 현재 윈도우의 첫 프레임 수신 시각 (time.perf_counter)
+            "buffer_started_at": None,
+            # 링 버퍼 용량 초과로 버려진 샘플 중 클라이언트에 알린 양과 마지막 알림 시각
+            "overflow_reported_samples": 0,
+            "overflow_reported_at": 0.0,
+            # coalesce 정책으로 거절되어 다음 윈도우 앞에 붙여 처리할 16-bit PCM (batch 모드)
+            "coalesced_pcm": None
         }
         logger.info(f"WebSocket 세션 초기화 완료: {connection_id}, 초기 녹음 상태: {self.sessions[connection_id]['is_recording']}")
     
+    @staticmethod
+    def _create_endpointer(scenario: str) -> Optional[EnergyEndpointer]:
+        """시나리오별 VAD 매개변수로 발화 구간 검출기 생성 (비활성화 시 None)"""
+        if not settings.ENDPOINTING_ENABLED:
+            return None
+        return EnergyEndpointer(settings.SCENARIO_VAD_PARAMS.get(scenario, settings.TRANSCRIBE_PARAMS["vad_parameters"]))
+    
     async def _load_model_if_needed(self, connection_id: str) -> bool:
         """
         필요한 경우 STT 모델 로드
@@ -602,10 +380,17 @@ class STTWebSocketManager:
                     # 버퍼 초기화 명령
                     elif command == "reset":
                         session = self.sessions[connection_id]
-                        session["buffer"] = bytearray()
+                        session["buffer"].clear()
+                        session["buffer_started_at"] = None
+                        session["coalesced_pcm"] = None
                         session["segment_count"] = 0
                         session["last_transcription"] = ""
                         session["is_first_segment"] = True
+                        session["session_metrics"] = SessionMetricsAccumulator()
+                        if session["streaming"] is not None:
+                            session["streaming"] = StreamingState()
+                        if session["endpointer"] is not None:
+                            session["endpointer"].reset()
                         
                         logger.info(f"버퍼 초기화: {connection_id}")
                         
@@ -644,33 +429,79 @@ class STTWebSocketManager:
             
         session = self.sessions[connection_id]
         
-        # 바이너리 데이터 수신 로그 (항상 기록)
-        logger.info(f"바이너리 데이터 수신: {connection_id}, 크기: {len(binary_data)} bytes")
+        # 프레임 단위 로그는 호출 위치별 속도 제한 (FRAME_LOG_INTERVAL)
+        frame_logger.debug("바이너리 데이터 수신: %s, 크기: %d bytes", connection_id, len(binary_data))
         
         # 녹음 상태가 아니면 오디오 데이터 무시하지만 로그는 남김
         if not session.get("is_recording", False):
-            logger.warning(f"녹음 상태가 아니므로 오디오 데이터 무시: {connection_id}, 현재 녹음 상태: {session.get('is_recording', 'None')}")
+            logger.warning("녹음 상태가 아니므로 오디오 데이터 무시: %s, 현재 녹음 상태: %s", connection_id, session.get("is_recording"))
             # 자동으로 녹음 상태를 True로 설정 (웹 클라이언트 호환성)
-            logger.info(f"자동으로 녹음 상태를 활성화: {connection_id}")
+            logger.info("자동으로 녹음 상태를 활성화: %s", connection_id)
             session["is_recording"] = True
         
+        WEBSOCKET_FRAME_BYTES.labels(*metric_labels(session["scenario"], session["language"])).observe(len(binary_data))
+        
         # 데이터 버퍼에 추가
-        session["buffer"].extend(binary_data)
+        if session["buffer_started_at"] is None:
+            session["buffer_started_at"] = time.perf_counter()
+        session["buffer"].write(binary_data)
         session["last_chunk_time"] = time.time()
+        if session["buffer"].dropped_samples > session["overflow_reported_samples"]:
+            await self._send_buffer_overflow(connection_id)
+        
+        frame_logger.info(
+            "오디오 데이터 버퍼에 추가: %s, 추가된 크기: %d bytes, 현재 버퍼 크기: %d bytes",
+            connection_id, len(binary_data), len(session["buffer"])
+        )
         
-        logger.info(f"오디오 데이터 버퍼에 추가: {connection_id}, 추가된 크기: {len(binary_data)} bytes, 현재 버퍼 크기: {len(session['buffer'])} bytes")
+        # 스트리밍 모드: hop 길이만큼 새 오디오가 쌓이면 윈도우 재추론
+        streaming = session["streaming"]
+        if streaming is not None:
+            streaming.samples_since_decode += len(binary_data) // 2
+            if streaming.samples_since_decode >= streaming.hop_samples and not session["is_processing"]:
+                asyncio.create_task(self._process_streaming_window(connection_id))
+            return True
         
         # 버퍼 크기 확인 및 처리
         buffer_threshold = min(settings.DEFAULT_BUFFER_SIZE, settings.MAX_AUDIO_BUFFER_MB * 1024 * 1024)
         
+        # 발화 구간 검출: 발화 경계(또는 최대 길이)에서만 절단하고, 발화 전 무음은 추론 전에 버림
+        endpointer = session["endpointer"]
+        if endpointer is not None:
+            audio_buffer = session["buffer"]
+            endpointer.feed(binary_data)
+            endpointer.sync_dropped(audio_buffer.dropped_samples)
+            
+            droppable = endpointer.droppable_samples()
+            if droppable:
+                audio_buffer.consume(droppable)
+                endpointer.consume(droppable)
+                endpoint_stats.record_skipped(droppable, session["scenario"], session["language"])
+                # 남은 패딩 구간을 현재 윈도우의 시작으로 봄 (실시간 수신 기준)
+                session["buffer_started_at"] = time.perf_counter() - audio_buffer.num_samples / settings.SAMPLE_RATE
+            
+            cut_samples, _ = endpointer.cut(audio_buffer.num_samples, buffer_threshold // 2)
+            if cut_samples and not session["is_processing"]:
+                asyncio.create_task(self._process_audio_buffer(connection_id))
+            return True
+        
         if len(session["buffer"]) >= buffer_threshold and not session["is_processing"]:
-            logger.info(f"버퍼 임계값 도달, 처리 시작: {connection_id}, 임계값: {buffer_threshold}, 현재 크기: {len(session['buffer'])}")
+            logger.info("버퍼 임계값 도달, 처리 시작: %s, 임계값: %d, 현재 크기: %d", connection_id, buffer_threshold, len(session["buffer"]))
             # 병렬로 처리
             asyncio.create_task(self._process_audio_buffer(connection_id))
         
         return True
         
-    async def handle_connection(self, websocket: WebSocket, language: str = "ko", scenario: str = "presentation") -> None:
+    async def handle_connection(
+        self,
+        websocket: WebSocket,
+        language: str = "ko",
+        scenario: str = "presentation",
+        mode: str = "batch",
+        timing: bool = False,
+        encoding: str = "json",
+        fields: Optional[str] = None
+    ) -> None:
         """
         WebSocket 연결 처리
         
@@ -678,11 +509,27 @@ class STTWebSocketManager:
             websocket: WebSocket 연결
             language: 인식 언어
             scenario: 시나리오 타입 (dating, interview, presentation)
+            mode: 처리 모드 (batch, streaming)
+            timing: 결과 메시지에 단계별 timing 블록 포함 여부
+            encoding: 결과 메시지 인코딩 (json, msgpack)
+            fields: 결과 메시지에 포함할 그룹 (쉼표 구분, None이면 전체)
         """
         connection_id = await self.connection_manager.connect(websocket)
         
+        # 결과 메시지 형식 (잘못된 fields는 오류 메시지 후 연결 종료)
+        try:
+            excluded = parse_fields(fields)
+        except ValueError as e:
+            await self.connection_manager.send_json(connection_id, {"type": "error", "message": str(e)})
+            await websocket.close(code=1008)
+            self.connection_manager.disconnect(connection_id)
+            return
+        self.connection_manager.set_format(connection_id, encoding, excluded)
+        
         # 세션 초기화
-        await self._initialize_session(connection_id, language, scenario)
+        await self._initialize_session(connection_id, language, scenario, mode, timing)
+        session_gauge = ACTIVE_SESSIONS.labels(*metric_labels(scenario, language))
+        session_gauge.inc()
         
         try:
             # STT 모델 로드 확인
@@ -693,7 +540,8 @@ class STTWebSocketManager:
             await self.connection_manager.send_json(connection_id, {
                 "type": "connected",
                 "message": "STT 서비스에 연결되었습니다. 오디오 데이터를 전송해주세요.",
-                "connection_id": connection_id
+                "connection_id": connection_id,
+                "mode": mode
             })
             
             # 메시지 수신 대기
@@ -704,10 +552,10 @@ class STTWebSocketManager:
                         logger.info(f"WebSocket이 이미 연결 해제됨: {connection_id}")
                         break
                     
-                    logger.debug(f"WebSocket 메시지 수신 대기 중: {connection_id}")
+                    logger.debug("WebSocket 메시지 수신 대기 중: %s", connection_id)
                     # 메시지 수신
                     message = await websocket.receive()
-                    logger.debug(f"WebSocket 메시지 수신: {connection_id}, 타입: {'text' if 'text' in message else 'bytes'}")
+                    logger.debug("WebSocket 메시지 수신: %s, 타입: %s", connection_id, "text" if "text" in message else "bytes")
                     
                     # 텍스트 메시지인 경우 (명령)
                     if "text" in message:
@@ -747,12 +595,322 @@ class STTWebSocketManager:
         
         finally:
             # 세션 정리
+            session_gauge.dec()
             if connection_id in self.sessions:
                 del self.sessions[connection_id]
+            # 대기 중인 추론 요청 취소 (공유 메모리 슬랩 반환)
+            inference_scheduler.cancel_session(connection_id)
             
             # 연결 종료
             self.connection_manager.disconnect(connection_id)
     
+    def _build_transcribe_params(self, session: Dict[str, Any], initial_prompt: Optional[str] = None) -> Dict[str, Any]:
+        """
+        세션 설정에 맞는 transcribe 매개변수 생성
+        
+        Args:
+            session: 세션 정보
+            initial_prompt: 초기 프롬프트 (이전 인식 결과)
+            
+        Returns:
+            transcribe 매개변수 딕셔너리
+        """
+        scenario = session.get("scenario", "presentation")
+        vad_params = settings.SCENARIO_VAD_PARAMS.get(scenario, settings.TRANSCRIBE_PARAMS["vad_parameters"])
+        
+        transcribe_params = {
+            "language": session["language"],
+            "beam_size": 5 if scenario != "interview" else 10,  # 면접은 더 정확하게
+            "word_timestamps": True,  # 실시간 처리에서는, 단어 타임스탬프가 필요
+            "vad_filter": settings.TRANSCRIBE_PARAMS.get("vad_filter", True),
+            "task": settings.TRANSCRIBE_PARAMS.get("task", "transcribe"),
+            "condition_on_previous_text": settings.TRANSCRIBE_PARAMS.get("condition_on_previous_text", True),
+            "vad_parameters": vad_params
+        }
+        if initial_prompt:
+            transcribe_params["initial_prompt"] = initial_prompt
+        
+        logger.debug(f"WebSocket Transcribe 매개변수: {transcribe_params}")
+        return transcribe_params
+    
+    async def _run_transcribe(
+        self,
+        audio_np: np.ndarray,
+        transcribe_params: Dict[str, Any],
+        connection_id: str,
+        cumulative: bool = False,
+        timings: Optional[Dict[str, float]] = None,
+        pcm: Optional[np.ndarray] = None
+    ):
+        """
+        모델 추론 실행 (세션 간 배치 스케줄러 경유)
+        
+        과부하 시에는 실행 전에 InferenceOverloadedError가 발생하며,
+        실행이 시작된 추론은 취소하지 않고 끝까지 기다린다.
+        추론 워커 풀을 사용하면 PCM 윈도우를 공유 메모리 슬랩에 써서 워커에 위치와 길이만 넘긴다.
+        
+        Args:
+            audio_np: float32 오디오 배열
+            transcribe_params: transcribe 매개변수
+            connection_id: 연결 ID
+            cumulative: 이전 윈도우를 포함하는 윈도우인지 여부 (스트리밍 모드)
+            timings: 대기열/추론 시각을 기록할 딕셔너리
+            pcm: audio_np와 같은 윈도우의 16-bit PCM 배열 (링 버퍼 뷰 가능, await 전에 슬랩으로 복사)
+            
+        Returns:
+            (세그먼트 리스트, 추론 정보)
+        """
+        slab = None
+        if pcm is not None and stt_processor.worker_pool is not None:
+            slab = stt_processor.worker_pool.slabs.write(pcm, connection_id)
+        return await inference_scheduler.submit(
+            audio_np,
+            transcribe_params,
+            session_id=connection_id,
+            cumulative=cumulative,
+            scenario=self.sessions[connection_id]["scenario"],
+            timings=timings,
+            slab=slab
+        )
+    
+    @staticmethod
+    def _keep_coalesced(session: Dict[str, Any], audio_bytes: bytes) -> float:
+        """
+        coalesce 정책으로 거절된 윈도우를 세션에 보관 (다음 윈도우 앞에 붙여 처리)
+        
+        보관 길이는 배치 청크 길이(30초)까지이며, 넘는 앞부분은 버린다.
+        
+        Args:
+            session: 세션 정보
+            audio_bytes: 거절된 윈도우의 16-bit PCM (이전에 보관한 오디오 포함)
+            
+        Returns:
+            보관하지 못하고 버린 오디오 길이 (초)
+        """
+        pcm = np.frombuffer(audio_bytes, dtype=np.int16)
+        max_samples = MAX_BATCH_CHUNK_SECONDS * settings.SAMPLE_RATE
+        session["coalesced_pcm"] = pcm[-max_samples:]
+        return max(len(pcm) - max_samples, 0) / settings.SAMPLE_RATE
+    
+    async def _send_overloaded(self, connection_id: str, error: InferenceOverloadedError, dropped_seconds: Optional[float] = None) -> None:
+        """
+        과부하로 윈도우가 거절되었음을 알림
+        
+        Args:
+            connection_id: 연결 ID
+            error: 과부하 예외
+            dropped_seconds: 실제로 버린 오디오 길이 (None이면 거절된 윈도우 전체를 버림, 값이 있으면 오디오를 보관해 다음 윈도우와 합쳐 처리)
+        """
+        kept = dropped_seconds is not None
+        if dropped_seconds is None:
+            dropped_seconds = error.audio_seconds
+        logger.warning(f"추론 과부하로 윈도우 거절: {connection_id}, 사유: {error.reason}, 대기열: {error.queue_depth}")
+        await self.connection_manager.send_json(connection_id, {
+            "type": "overloaded",
+            "reason": error.reason,
+            "policy": inference_scheduler.overload_policy,
+            "queue_depth": error.queue_depth,
+            "dropped_audio_seconds": round(dropped_seconds, 2),
+            "message": "서버가 혼잡하여 오디오 구간을 다음 결과와 합쳐 처리합니다."
+                       if kept else "서버가 혼잡하여 일부 오디오 구간의 인식을 건너뛰었습니다."
+        })
+    
+    async def _send_buffer_overflow(self, connection_id: str) -> None:
+        """
+        링 버퍼 용량 초과로 버려진 오디오를 overloaded 메시지로 알림
+        
+        처리가 수신 속도를 따라가지 못하는 동안 프레임마다 알리지 않도록
+        AUDIO_OVERFLOW_NOTIFY_INTERVAL_SECONDS 간격으로 그동안 버려진 양을 모아서 보낸다.
+        
+        Args:
+            connection_id: 연결 ID
+        """
+        session = self.sessions[connection_id]
+        now = time.perf_counter()
+        if now - session["overflow_reported_at"] < settings.AUDIO_OVERFLOW_NOTIFY_INTERVAL_SECONDS:
+            return
+        dropped = session["buffer"].dropped_samples - session["overflow_reported_samples"]
+        session["overflow_reported_samples"] = session["buffer"].dropped_samples
+        session["overflow_reported_at"] = now
+        
+        logger.warning(f"오디오 버퍼 용량 초과로 오디오 버림: {connection_id}, {dropped / settings.SAMPLE_RATE:.2f}초")
+        await self.connection_manager.send_json(connection_id, {
+            "type": "overloaded",
+            "reason": "buffer_overflow",
+            "policy": inference_scheduler.overload_policy,
+            "queue_depth": inference_scheduler.queue_depth,
+            "dropped_audio_seconds": round(dropped / settings.SAMPLE_RATE, 2),
+            "message": "서버가 혼잡하여 처리하지 못한 오래된 오디오를 버렸습니다."
+        })
+    
+    async def _send_silence(self, connection_id: str, decision: GateDecision, audio_seconds: float, is_final: bool) -> None:
+        """
+        무음 윈도우를 추론 없이 pause 메트릭만 담아 알림
+        
+        Args:
+            connection_id: 연결 ID
+            decision: 무음 판정 결과
+            audio_seconds: 윈도우 오디오 길이 (초)
+            is_final: 최종 처리 여부
+        """
+        session = self.sessions.get(connection_id)
+        if session is None:
+            return
+        scenario, language = session["scenario"], session["language"]
+        session["session_metrics"].add_silence(audio_seconds)
+        silence_gate.record(audio_seconds, inference_scheduler.real_time_factor, scenario, language)
+        logger.info(
+            "무음 윈도우 추론 생략: %s, 길이: %.2f초, RMS: %.1f dBFS, 활성 구간: %.2f초",
+            connection_id, audio_seconds, decision.rms_dbfs, decision.active_seconds
+        )
+        
+        try:
+            await self.connection_manager.send_json(connection_id, {
+                "type": "silence",
+                "is_final": is_final,
+                "scenario": scenario,
+                "language": language,
+                "duration": round(audio_seconds, 2),
+                "rms_dbfs": decision.rms_dbfs,
+                "pause_metrics": silence_pause_metrics(round(audio_seconds, 2)),
+                "pause_pattern": classify_pause(audio_seconds),
+                "cumulative_metrics": session["session_metrics"].snapshot(scenario, language)
+            })
+        except (RuntimeError, WebSocketDisconnect) as e:
+            logger.info(f"결과 전송 중 연결 종료: {connection_id} - {str(e)}")
+    
+    async def _send_emotion_result(self, connection_id: str, segment_id: int, emotion_task: "asyncio.Task") -> None:
+        """
+        마감 시간 안에 끝나지 않은 감정분석 결과를 후속 메시지로 전송
+        
+        Args:
+            connection_id: 연결 ID
+            segment_id: 전사 결과와 같은 세그먼트 ID
+            emotion_task: 진행 중인 감정분석 작업
+        """
+        try:
+            emotion_result = await emotion_task
+        except Exception as e:
+            logger.warning(f"감정분석 서비스 호출 실패: {str(e)}")
+            emotion_result = None
+        
+        if connection_id not in self.sessions:
+            return
+        
+        await self.connection_manager.send_json(connection_id, {
+            "type": "emotion_analysis",
+            "segment_id": segment_id,
+            "emotion_analysis": format_emotion_result(emotion_result)
+        })
+    
+    async def _process_streaming_window(self, connection_id: str, is_final: bool = False) -> None:
+        """
+        스트리밍 모드 슬라이딩 윈도우 처리
+        
+        아직 확정되지 않은 오디오 전체(이전 윈도우와 겹침)를 다시 추론하고,
+        Local Agreement로 확정된 단어는 최종 결과로, 나머지는 부분 결과로 전송한다.
+        
+        Args:
+            connection_id: 연결 ID
+            is_final: 최종 처리 여부 (남은 단어를 모두 확정)
+        """
+        if connection_id not in self.sessions:
+            return
+        
+        session = self.sessions[connection_id]
+        state: StreamingState = session["streaming"]
+        if is_final:
+            # 최종 처리는 건너뛰지 않고 진행 중인 윈도우가 끝날 때까지 대기
+            while session["is_processing"] and connection_id in self.sessions:
+                await asyncio.sleep(0.05)
+        if session["is_processing"]:
+            logger.debug(f"이미 처리 중이므로 스트리밍 윈도우를 건너뛰었습니다: {connection_id}")
+            return
+        
+        session["is_processing"] = True
+        state.samples_since_decode = 0
+        
+        try:
+            audio_buffer = session["buffer"]
+            state.sync_dropped(audio_buffer.dropped_samples)
+            # 윈도우는 소비하지 않음 - 확정된 부분만 나중에 잘라냄
+            window = audio_buffer.peek()
+            audio_np = np.divide(window, 32768.0, dtype=np.float32)
+            window_seconds = len(audio_np) / settings.SAMPLE_RATE
+            
+            if len(audio_np) < 512:  # 너무 짧은 오디오는 처리하지 않음
+                return
+            
+            if stt_processor.model is None:
+                logger.error(f"STT 모델이 초기화되지 않았습니다: {connection_id}")
+                await self.connection_manager.send_json(connection_id, {
+                    "type": "error",
+                    "message": "STT 모델이 초기화되지 않았습니다."
+                })
+                return
+            
+            transcribe_params = self._build_transcribe_params(session, state.prompt())
+            segments_list, info = await self._run_transcribe(audio_np, transcribe_params, connection_id, cumulative=True, pcm=window)
+            
+            # 윈도우 기준 시간을 세션 기준 시간으로 변환
+            hypothesis = [
+                StreamWord(start=state.buffer_offset + word.start, end=state.buffer_offset + word.end, word=word.word)
+                for segment in segments_list if segment.words
+                for word in segment.words
+            ]
+            
+            committed = state.policy.insert(hypothesis)
+            drop_all = False
+            if is_final or state.needs_flush(window_seconds):
+                committed += state.policy.flush()
+                # 확정할 단어가 전혀 없으면 무음 윈도우로 보고 전부 버림
+                drop_all = not committed
+            
+            if committed:
+                segment_id = session["segment_count"]
+                session["segment_count"] += 1
+                text = join_words(committed)
+                session["last_transcription"] = text
+                await self.connection_manager.send_json(connection_id, {
+                    "type": "transcription",
+                    "text": text,
+                    "scenario": session["scenario"],
+                    "language": info.language,
+                    **STTStreamingResponse(
+                        partial_text=text,
+                        is_final=True,
+                        segment_id=segment_id
+                    ).model_dump()
+                })
+            
+            unstable_text = join_words(state.policy.unstable)
+            if unstable_text:
+                await self.connection_manager.send_json(connection_id, {
+                    "type": "partial_transcription",
+                    **STTStreamingResponse(
+                        partial_text=unstable_text,
+                        is_final=False,
+                        segment_id=session["segment_count"]
+                    ).model_dump()
+                })
+            
+            # 확정된 구간은 링 버퍼에서 제거 (다음 윈도우는 불안정 구간부터 시작)
+            audio_buffer.consume(state.trim_samples(window_seconds, drop_all=drop_all or is_final))
+            
+        except InferenceOverloadedError as e:
+            # 윈도우는 소비하지 않았으므로 다음 hop에서 다시 시도됨 (버린 오디오 없음)
+            await self._send_overloaded(connection_id, e, dropped_seconds=0.0)
+        except (RuntimeError, WebSocketDisconnect) as e:
+            logger.info(f"스트리밍 결과 전송 중 연결 종료: {connection_id} - {str(e)}")
+        except Exception as e:
+            logger.error(f"스트리밍 윈도우 처리 중 오류 발생: {connection_id} - {str(e)}", exc_info=True)
+            await self.connection_manager.send_json(connection_id, {
+                "type": "error",
+                "message": f"오디오 처리 중 오류 발생: {str(e)}"
+            })
+        finally:
+            session["is_processing"] = False
+    
     async def _process_audio_buffer(self, connection_id: str, is_final: bool = False) -> None:
         """
         오디오 버퍼 처리
@@ -766,46 +924,98 @@ class STTWebSocketManager:
         
         session = self.sessions[connection_id]
         
+        # 스트리밍 모드는 슬라이딩 윈도우 경로로 처리
+        if session["streaming"] is not None:
+            await self._process_streaming_window(connection_id, is_final=is_final)
+            return
+        
         # 이미 처리 중인 경우 반환
-        logger.info(f"오디오 버퍼 처리 시작: {connection_id}, 최종 처리: {is_final}, 현재 버퍼 크기: {len(session['buffer'])} bytes")
+        logger.info("오디오 버퍼 처리 시작: %s, 최종 처리: %s, 현재 버퍼 크기: %d bytes", connection_id, is_final, len(session["buffer"]))
         if session["is_processing"]:
-            logger.warning(f"이미 처리 중이므로 건너뛰었습니다: {connection_id}")
+            logger.warning("이미 처리 중이므로 건너뛰었습니다: %s", connection_id)
             return
         
         # 처리 중 플래그 설정
         session["is_processing"] = True
         
         try:
-            # 버퍼에 데이터가 있는지 확인
-            if len(session["buffer"]) == 0:
+            # 버퍼에 데이터가 있는지 확인 (최종 처리에서는 보관 중인 coalesce 오디오도 처리)
+            pending_coalesced = is_final and session["coalesced_pcm"] is not None
+            if len(session["buffer"]) == 0 and not pending_coalesced:
                 session["is_processing"] = False
-                logger.info(f"처리할 오디오 데이터 없음: {connection_id}")
+                logger.info("처리할 오디오 데이터 없음: %s", connection_id)
                 return
             
-            # 버퍼에서 데이터 가져오기
-            if is_final:
-                # 최종 처리인 경우 모든 데이터 사용
-                audio_data = bytes(session["buffer"])
-                session["buffer"] = bytearray()
-            else:
-                # 일부 처리인 경우 버퍼 앞부분 사용
-                buffer_size = len(session["buffer"])
-                use_size = min(buffer_size, settings.MAX_AUDIO_BUFFER_MB * 1024 * 1024)
+            try:
+                # 버퍼에서 데이터 가져오기
+                audio_buffer = session["buffer"]
+                endpointer = session["endpointer"]
+                cut_reason = "final"
+                skipped_tail = 0
+                if is_final:
+                    # 최종 처리인 경우 모든 데이터 사용
+                    use_samples = audio_buffer.num_samples
+                elif endpointer is not None:
+                    # 발화 경계까지 사용 (아직 자를 시점이 아니면 0)
+                    max_samples = min(settings.DEFAULT_BUFFER_SIZE, settings.MAX_AUDIO_BUFFER_MB * 1024 * 1024) // 2
+                    use_samples, cut_reason = endpointer.cut(audio_buffer.num_samples, max_samples)
+                else:
+                    # 일부 처리인 경우 버퍼 앞부분 사용
+                    use_samples = min(audio_buffer.num_samples, settings.MAX_AUDIO_BUFFER_MB * 1024 * 1024 // 2)
                 
-                audio_data = bytes(session["buffer"][:use_size])
-                session["buffer"] = session["buffer"][use_size:]
+                if endpointer is not None:
+                    if not use_samples and not pending_coalesced:
+                        return
+                    if not endpointer.has_speech and not pending_coalesced:
+                        # 발화가 확인되지 않은 남은 구간 (최종 처리)은 추론하지 않음
+                        audio_buffer.consume(use_samples)
+                        endpointer.consume(use_samples)
+                        endpoint_stats.record_skipped(use_samples, session["scenario"], session["language"])
+                        session["buffer_started_at"] = None
+                        logger.info("발화 없는 구간 추론 생략: %s, 길이: %.2f초", connection_id, use_samples / settings.SAMPLE_RATE)
+                        return
+                    if is_final:
+                        # 발화 뒤에 남은 무음은 패딩만 남기고 추론에서 제외
+                        skipped_tail = endpointer.trailing_silence(use_samples)
+                        use_samples -= skipped_tail
+                        endpoint_stats.record_skipped(skipped_tail, session["scenario"], session["language"])
+                    endpointer.consume(use_samples + skipped_tail)
+                    endpoint_stats.record_window(use_samples, cut_reason, session["scenario"], session["language"])
                 
-            try:
-                # 바이너리 데이터를 numpy 배열로 변환
-                # 16-bit PCM, 단일 채널 오디오 가정
-                audio_np = np.frombuffer(audio_data, dtype=np.int16).astype(np.float32) / 32768.0
+                # 링 버퍼 뷰(16-bit PCM, 단일 채널)를 float32로 변환
+                # 뷰는 다음 write() 전까지만 유효하므로 await 없이 변환 후 소비
+                window = audio_buffer.peek(use_samples)
+                if session["coalesced_pcm"] is not None:
+                    # 과부하(coalesce)로 거절된 이전 윈도우를 앞에 붙여 함께 처리
+                    window = np.concatenate([session["coalesced_pcm"], window])
+                    session["coalesced_pcm"] = None
+                audio_np = np.divide(window, 32768.0, dtype=np.float32)
+                # 감정분석용 원본 PCM 바이트 (float32 -> int16 역변환 없이 그대로 사용)
+                audio_bytes = window.tobytes()
+                audio_buffer.consume(use_samples + skipped_tail)
                 
-                logger.info(f"오디오 데이터 NumPy 배열로 변환 완료: {connection_id}, 배열 크기: {audio_np.shape}, 오디오 길이: {len(audio_np) / settings.SAMPLE_RATE:.2f}초")
+                # 단계별 시각 기록 (남은 버퍼는 절단 시각부터 다음 윈도우로 집계)
+                timer = StageTimer(session["buffer_started_at"])
+                timer.mark("buffer_cut")
+                session["buffer_started_at"] = timer.marks["buffer_cut"] if audio_buffer.num_samples else None
+                
+                logger.debug(
+                    "오디오 데이터 NumPy 배열로 변환 완료: %s, 배열 크기: %s, 오디오 길이: %.2f초",
+                    connection_id, audio_np.shape, len(audio_np) / settings.SAMPLE_RATE
+                )
                 
                 # 오디오 데이터가 충분한지 확인
                 if len(audio_np) < 512:  # 너무 짧은 오디오는 처리하지 않음
                     session["is_processing"] = False
                     return
+                
+                # 무음 윈도우는 추론과 감정분석 호출 없이 silence 메시지로 응답
+                if silence_gate.enabled:
+                    vad_params = settings.SCENARIO_VAD_PARAMS.get(session["scenario"], settings.TRANSCRIBE_PARAMS["vad_parameters"])
+                    decision = await silence_gate.evaluate(audio_np, vad_params)
+                    if decision.silent:
+                        await self._send_silence(connection_id, decision, len(audio_np) / settings.SAMPLE_RATE, is_final)
+                        return
                     
                 # WhisperX 처리
                 segment_id = session["segment_count"]
@@ -813,38 +1023,23 @@ class STTWebSocketManager:
                 
                 # 실제 STT 처리
                 if stt_processor.model is not None:
+                    # 윈도우를 자르자마자 감정분석을 시작하여 전사와 병렬로 진행
+                    scenario = session.get("scenario", "presentation")
+                    timer.mark("emotion_start")
+                    emotion_task = asyncio.create_task(
+                        call_emotion_analysis(audio_bytes, scenario, session["language"])
+                    )
+                    emotion_task.add_done_callback(lambda _: timer.mark("emotion_end"))
+                    emotion_handed_off = False
                     try:
-                        # 시나리오별 transcribe 파라미터 준비
-                        scenario = session.get("scenario", "presentation")
-                        vad_params = settings.SCENARIO_VAD_PARAMS.get(scenario, settings.TRANSCRIBE_PARAMS["vad_parameters"])
-                        
-                        transcribe_params = {
-                            "language": session["language"],
-                            "beam_size": 5 if scenario != "interview" else 10,  # 면접은 더 정확하게
-                            "word_timestamps": True,  # 실시간 처리에서는, 단어 타임스탬프가 필요
-                            "vad_filter": settings.TRANSCRIBE_PARAMS.get("vad_filter", True),
-                            "task": settings.TRANSCRIBE_PARAMS.get("task", "transcribe"),
-                            "condition_on_previous_text": settings.TRANSCRIBE_PARAMS.get("condition_on_previous_text", True),
-                            "vad_parameters": vad_params
-                        }
-                        
                         # 이전 인식 결과를 초기 프롬프트로 사용하여 연속성 보장
-                        if session["last_transcription"]:
-                            transcribe_params["initial_prompt"] = session["last_transcription"]
-                        
-                        logger.debug(f"WebSocket Transcribe 매개변수: {transcribe_params}")
+                        transcribe_params = self._build_transcribe_params(session, session["last_transcription"])
                         
-                        # 타임아웃 설정 - 10초 이상 걸리면 취소
-                        segments, info = await asyncio.wait_for(
-                            asyncio.get_event_loop().run_in_executor(None, lambda: stt_processor.model.transcribe(
-                                audio_np, **transcribe_params
-                            )),
-                            timeout=10
+                        segments_list, info = await self._run_transcribe(
+                            audio_np, transcribe_params, connection_id, timings=timer.marks,
+                            pcm=np.frombuffer(audio_bytes, dtype=np.int16)
                         )
-                        logger.info(f"WebSocket 모델 추론 완료: {connection_id}, 감지된 언어: {info.language}, 확률: {info.language_probability:.2f}")
-                        
-                        # 결과 수집 및 후처리
-                        segments_list = list(segments)
+                        logger.info("WebSocket 모델 추론 완료: %s, 감지된 언어: %s, 확률: %.2f", connection_id, info.language, info.language_probability)
                         
                         # 결과 텍스트 추출
                         text = ""
@@ -855,22 +1050,25 @@ class STTWebSocketManager:
                         text = text.strip()
                         
                         if not text:
+                            # 추론했지만 텍스트가 없는 윈도우도 세션 길이와 pause에 포함 (무음 게이트 윈도우와 같게)
+                            session["session_metrics"].add_silence(len(audio_np) / settings.SAMPLE_RATE)
                             session["is_processing"] = False
                             return
                         
                         # 현재 인식 결과 저장 (다음 세그먼트의 프롬프트로 사용)
                         session["last_transcription"] = text
                         
-                        # 시나리오와 언어 정보
-                        scenario = session.get("scenario", "presentation")
+                        # 언어 정보
                         detected_language = info.language if hasattr(info, 'language') else session["language"]
                         
-                        # 세그먼트 기반 말하기 속도 메트릭 계산
+                        # 세그먼트 기반 말하기 속도 메트릭 계산 (세그먼트 열은 한 번만 추출)
+                        segment_columns = SegmentColumns.from_segments(segments_list)
                         speech_metrics = calculate_segment_based_metrics(
                             segments_list,
                             len(audio_np) / settings.SAMPLE_RATE,
                             scenario,
-                            detected_language
+                            detected_language,
+                            columns=segment_columns
                         )
                         
                         # 음절 기반 메트릭 추가 (선택적)
@@ -887,16 +1085,16 @@ class STTWebSocketManager:
                             }
                         
                         # 속도 변동성 계산
-                        variability_metrics = calculate_speech_variability(segments_list)
+                        variability_metrics = calculate_speech_variability(segments_list, columns=segment_columns)
                         
-                        # 감정분석 서비스 호출 (병렬 처리)
-                        emotion_result = None
-                        try:
-                            # 오디오 바이트 데이터로 변환 (16-bit PCM으로 다시 변환)
-                            audio_bytes = (audio_np * 32768.0).astype(np.int16).tobytes()
-                            emotion_result = await call_emotion_analysis(audio_bytes, scenario, detected_language)
-                        except Exception as e:
-                            logger.warning(f"감정분석 서비스 호출 실패: {str(e)}")
+                        # 세션 누적 메트릭 갱신 (이번 윈도우의 세그먼트만 반영)
+                        session["session_metrics"].update(segment_columns, len(audio_np) / settings.SAMPLE_RATE)
+                        timer.mark("metrics_end")
+                        
+                        # 병렬로 진행 중인 감정분석은 마감 시간까지만 기다림
+                        # (늦으면 전사 결과를 먼저 보내고 같은 segment_id로 후속 전송)
+                        await asyncio.wait({emotion_task}, timeout=settings.EMOTION_MERGE_DEADLINE_MS / 1000)
+                        timer.mark("emotion_merged")
                         
                         # 결과 전송
                         try:
@@ -928,25 +1126,23 @@ class STTWebSocketManager:
                                 },
                                 # 속도 변동성 메트릭
                                 "variability_metrics": variability_metrics,
+                                # 세션 시작부터의 누적 메트릭
+                                "cumulative_metrics": session["session_metrics"].snapshot(scenario, detected_language),
                                 # 음절 메트릭 (있는 경우)
                                 "syllable_metrics": syllable_metrics,
                                 # 세그먼트 상세 정보
                                 "segments": speech_metrics["segment_metrics"]
                             }
                             
-                            # 감정분석 결과 추가
-                            if emotion_result:
-                                result_data["emotion_analysis"] = {
-                                    "primary_emotion": emotion_result["primary_emotion"],
-                                    "top_emotions": emotion_result["top_emotions"],
-                                    "scenario_applied": emotion_result["scenario_applied"],
-                                    "processing_time": emotion_result["processing_time"],
-                                    "model_used": emotion_result["model_used"]
-                                }
-                                logger.info(f"감정분석 결과 포함 - 주 감정: {emotion_result['primary_emotion']['emotion_kr']} ({emotion_result['primary_emotion']['probability']:.3f})")
+                            # 감정분석 결과 추가 (마감 시간 내에 끝난 경우)
+                            result_data["emotion_analysis"] = None
+                            result_data["emotion_pending"] = not emotion_task.done()
+                            if emotion_task.done():
+                                result_data["emotion_analysis"] = format_emotion_result(emotion_task.result())
+                                if result_data["emotion_analysis"] is None:
+                                    logger.debug("감정분석 결과 없음")
                             else:
-                                result_data["emotion_analysis"] = None
-                                logger.debug("감정분석 결과 없음")
+                                logger.debug("감정분석 결과 대기 중 - 후속 메시지로 전송: %s, 세그먼트: %d", connection_id, segment_id)
                             
                             # 단어 수준 타임스탬프 정보 추가
                             words_with_timestamps = []
@@ -963,52 +1159,54 @@ class STTWebSocketManager:
                             if words_with_timestamps:
                                 result_data["words"] = words_with_timestamps
                             
-                            await self.connection_manager.send_json(connection_id, result_data)
-
-                            # 상세 로깅 추가
-                            logger.info(f"말하기 속도 분석 (시나리오: {scenario}):")
-                            logger.info(f"  - 텍스트: {text[:50]}...")
-                            logger.info(f"  - 언어: {detected_language}")
-                            logger.info(f"  - 세그먼트 평균 WPM: {speech_metrics['average_segment_wpm']}")
-                            logger.info(f"  - 세그먼트 중앙값 WPM: {speech_metrics['median_segment_wpm']}")
-                            logger.info(f"  - 전체 시간 WPM: {speech_metrics['wpm_total']}")
-                            logger.info(f"  - 평가 WPM: {speech_metrics['evaluation_wpm']}")
-                            logger.info(f"  - 발화 밀도: {speech_metrics['speech_density']:.1%}")
-                            logger.info(f"  - 속도 카테고리: {speech_metrics['speed_category']}")
-                            logger.info(f"  - 말하기 패턴: {speech_metrics['speech_pattern']}")
-                            logger.info(f"  - Pause 패턴: {speech_metrics['pause_pattern']}")
-                            logger.info(f"  - 평균 Pause: {speech_metrics['pause_metrics'].get('average_duration', 0):.2f}초")
-                            logger.info(f"  - 세그먼트 수: {len(segments_list)}")
-                            
-                            if syllable_metrics:
-                                logger.info(f"  - SPM (발화): {syllable_metrics['spm_active']}")
-                                logger.info(f"  - SPM (전체): {syllable_metrics['spm_total']}")
+                            # 단계별 소요 시간 (히스토그램은 항상 기록, 메시지에는 timing 플래그가 켜진 경우만)
+                            timer.mark("send")
+                            timer.observe(scenario, detected_language)
+                            if session["timing"]:
+                                result_data["timing"] = timer.breakdown(len(audio_np) / settings.SAMPLE_RATE)
                             
-                            # 처음 3개 세그먼트만 상세 로그
-                            for i, seg in enumerate(speech_metrics["segment_metrics"][:3]):
-                                logger.info(f"    Segment {i+1}: WPM={seg['wpm']:.1f}, Duration={seg['duration']:.2f}s, Text='{seg['text'][:30]}...')")
+                            await self.connection_manager.send_json(connection_id, result_data)
                             
-                            if result_data.get("words"):
-                                 logger.info(f"  - 단어 타임스탬프 수: {len(result_data['words'])}")
+                            if result_data["emotion_pending"]:
+                                emotion_handed_off = True
+                                asyncio.create_task(self._send_emotion_result(connection_id, segment_id, emotion_task))
 
-                            # 전체 JSON 응답은 DEBUG 레벨로 유지 (필요시 활성화)
-                            logger.debug(f"  - 전체 전송 JSON: {json.dumps(result_data, ensure_ascii=False, indent=2)}")
-                            logger.info(f"STT 결과 전송 완료: {connection_id}")
+                            # 윈도우 요약은 레코드 하나로 기록 (포맷팅은 로그 리스너 스레드에서 수행)
+                            logger.info(
+                                "STT 결과 전송 완료: %s, 시나리오: %s, 언어: %s, 세그먼트 수: %d, "
+                                "평균/중앙값/전체/평가 WPM: %s/%s/%s/%s, 발화 밀도: %.1f%%, 속도: %s, "
+                                "말하기 패턴: %s, Pause 패턴: %s, 평균 Pause: %.2f초, SPM (발화/전체): %s/%s",
+                                connection_id, scenario, detected_language, len(segments_list),
+                                speech_metrics["average_segment_wpm"], speech_metrics["median_segment_wpm"],
+                                speech_metrics["wpm_total"], speech_metrics["evaluation_wpm"],
+                                speech_metrics["speech_density"] * 100, speech_metrics["speed_category"],
+                                speech_metrics["speech_pattern"], speech_metrics["pause_pattern"],
+                                speech_metrics["pause_metrics"].get("average_duration", 0),
+                                syllable_metrics["spm_active"] if syllable_metrics else "-",
+                                syllable_metrics["spm_total"] if syllable_metrics else "-"
+                            )
+                            
+                            # 텍스트, 세그먼트 상세, 전체 JSON은 DEBUG 레벨 (비활성화 시 직렬화 생략)
+                            if logger.isEnabledFor(logging.DEBUG):
+                                logger.debug("  - 텍스트: %.50s...", text)
+                                for i, seg in enumerate(speech_metrics["segment_metrics"][:3]):
+                                    logger.debug(
+                                        "    Segment %d: WPM=%.1f, Duration=%.2fs, Text='%.30s...'",
+                                        i + 1, seg["wpm"], seg["duration"], seg["text"]
+                                    )
+                                logger.debug("  - 단어 타임스탬프 수: %d", len(result_data.get("words") or []))
+                                logger.debug("  - 전체 전송 JSON: %s", json.dumps(result_data, ensure_ascii=False, indent=2))
 
                         except (RuntimeError, WebSocketDisconnect) as e:
                             logger.info(f"결과 전송 중 연결 종료: {connection_id} - {str(e)}")
                             return
                                 
-                    except asyncio.TimeoutError:
-                        # 처리 시간 초과
-                        logger.warning(f"오디오 처리 시간 초과: {connection_id}")
-                        try:
-                            await self.connection_manager.send_json(connection_id, {
-                                "type": "error",
-                                "message": "오디오 처리 시간이 초과되었습니다."
-                            })
-                        except:
-                            pass
+                    except InferenceOverloadedError as e:
+                        # 과부하로 실행 전에 거절됨 (coalesce면 오디오를 보관해 다음 윈도우와 합침)
+                        dropped_seconds = None
+                        if e.reason == "coalesce" and not is_final:
+                            dropped_seconds = self._keep_coalesced(session, audio_bytes)
+                        await self._send_overloaded(connection_id, e, dropped_seconds)
                     except Exception as e:
                         # 기타 오류
                         logger.error(f"오디오 처리 중 오류 발생: {connection_id} - {str(e)}", exc_info=True)
@@ -1019,6 +1217,10 @@ class STTWebSocketManager:
                             })
                         except:
                             pass
+                    finally:
+                        # 결과가 전송되지 않은 윈도우의 감정분석은 취소
+                        if not emotion_handed_off:
+                            emotion_task.cancel()
                 else:
                     logger.error(f"STT 모델이 초기화되지 않았습니다: {connection_id}")
                     try:
@@ -1043,4 +1245,9 @@ class STTWebSocketManager:
 
 
 # 싱글톤 인스턴스 생성
+# 워커 프로세스 풀을 쓰면 워커마다 배치 하나씩 동시에 실행
+inference_scheduler = InferenceScheduler(
+    lambda: stt_processor.model,
+    max_concurrent_batches=settings.INFERENCE_WORKER_PROCESSES or settings.MAX_WORKERS
+)
 websocket_manager = STTWebSocketManager() 
\ No newline at end of file
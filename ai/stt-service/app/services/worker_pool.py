@@ -0,0 +1,372 @@
+import itertools
+import multiprocessing
+import queue
+import time
+from dataclasses import dataclass
+from multiprocessing.connection import Connection
+from multiprocessing.process import BaseProcess
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from app.core.config import settings
+from app.core.logging import logger
+from app.core.metrics import INFERENCE_WORKER_RESTARTS
+from app.services.audio_slab import AudioSlab, AudioSlabAllocator
+from app.services.inference_scheduler import MAX_BATCH_CHUNK_SECONDS, InferenceRequest, InferenceScheduler
+from app.services.warmup import warmup_model
+
+# 워커별 공유 메모리 입력 버퍼 크기 (float32 샘플, 최대 배치 = 30초 윈도우 x INFERENCE_MAX_BATCH_SIZE)
+# 슬랩에 담기지 않은 배열 입력을 이 버퍼로 넘기고, 버퍼보다 긴 오디오(REST 업로드 등)는 제어 메시지에 직접 담아 보낸다.
+WORKER_BUFFER_SAMPLES = MAX_BATCH_CHUNK_SECONDS * settings.SAMPLE_RATE * max(settings.INFERENCE_MAX_BATCH_SIZE, 1)
+
+
+def _load_replica(worker_id: int, backend: str, model_name: str, device: str, compute_type: str, cpu_threads: int):
+    """워커 프로세스 안에서 모델 복제본 로드"""
+    if backend == "synthetic":
+        from app.services.synthetic_backend import SyntheticLatency, SyntheticWhisperModel
+        return SyntheticWhisperModel(SyntheticLatency(seed=settings.SYNTHETIC_SEED + worker_id))
+
+    import faster_whisper
+    return faster_whisper.WhisperModel(
+        model_size_or_path=model_name,
+        device=device,
+        compute_type=compute_type,
+        cpu_threads=cpu_threads,
+        num_workers=1
+    )
+
+
+def _worker_main(
+    worker_id: int,
+    conn: Connection,
+    buffer_name: str,
+    slab_name: str,
+    backend: str,
+    model_name: str,
+    device: str,
+    compute_type: str,
+    cpu_threads: int
+) -> None:
+    """
+    추론 워커 프로세스 진입점
+
+    모델 복제본을 로드하고 워밍업(WARMUP_ENABLED)한 뒤 ("ready", 로딩 시간, 워밍업 시간)을 보내고,
+    제어 메시지를 하나씩 받아 처리한다.
+    - ("transcribe", request_id, 윈도우 목록, 매개변수): 윈도우들을 추론 (하나면 transcribe, 여럿이면 배치)
+      윈도우는 ("slab", 위치, 길이) 슬랩 공유 메모리의 int16 PCM, ("buffer", 위치, 길이) 워커 입력 버퍼의 float32,
+      ("inline", 배열) 메시지에 담긴 float32 중 하나
+    - ("stop",): 종료
+    결과는 ("result", request_id, [(세그먼트 리스트, 정보), ...]) 또는 ("error", request_id, 메시지)로 돌려준다.
+    """
+    buffer = SharedMemory(name=buffer_name)
+    slab_memory = SharedMemory(name=slab_name)
+    samples = np.ndarray((buffer.size // 4,), dtype=np.float32, buffer=buffer.buf)
+    pcm = np.ndarray((slab_memory.size // 2,), dtype=np.int16, buffer=slab_memory.buf)
+    try:
+        start_time = time.time()
+        try:
+            model = _load_replica(worker_id, backend, model_name, device, compute_type, cpu_threads)
+        except Exception as e:
+            conn.send(("error", None, f"모델 로딩 실패: {str(e)}"))
+            return
+        load_seconds = time.time() - start_time
+
+        warmup_seconds = None
+        if settings.WARMUP_ENABLED:
+            try:
+                warmup_seconds = warmup_model(model)["seconds"]
+            except Exception as e:
+                logger.warning(f"추론 워커 {worker_id} 워밍업 실패 (워커는 계속 실행): {str(e)}")
+        conn.send(("ready", load_seconds, warmup_seconds))
+
+        while True:
+            try:
+                message = conn.recv()
+            except EOFError:
+                break
+            if message[0] == "stop":
+                break
+
+            _, request_id, windows, params = message
+            requests = []
+            for window in windows:
+                if window[0] == "slab":
+                    # 슬랩은 결과를 돌려줄 때까지 재사용되지 않으므로 변환 중에도 안전
+                    audio = np.divide(pcm[window[1]:window[1] + window[2]], 32768.0, dtype=np.float32)
+                elif window[0] == "buffer":
+                    audio = samples[window[1]:window[1] + window[2]]
+                else:
+                    audio = window[1]
+                requests.append(InferenceRequest(audio=audio, params=params, future=None))
+            try:
+                if not requests:
+                    results = []
+                elif len(requests) == 1:
+                    results = [InferenceScheduler._transcribe_single(model, requests[0])]
+                else:
+                    results = InferenceScheduler._transcribe_batch(model, requests)
+                conn.send(("result", request_id, results))
+            except Exception as e:
+                conn.send(("error", request_id, f"{type(e).__name__}: {str(e)}"))
+    finally:
+        # 공유 메모리를 닫기 전에 마지막 요청의 뷰까지 모두 놓음 (요청을 받지 않았으면 이름이 없으므로 del 대신 대입)
+        audio = requests = None
+        del samples, pcm
+        buffer.close()
+        slab_memory.close()
+
+
+@dataclass
+class WorkerSlot:
+    """워커 프로세스 하나의 상태 (프로세스가 다시 시작되어도 공유 메모리 버퍼는 유지)"""
+    worker_id: int
+    buffer: SharedMemory
+    process: Optional[BaseProcess] = None
+    conn: Optional[Connection] = None
+    ready: bool = False
+    load_seconds: Optional[float] = None
+    warmup_seconds: Optional[float] = None
+    requests: int = 0
+    busy_seconds: float = 0.0
+    restarts: int = 0
+
+
+class InferenceWorkerPool:
+    """
+    모델 복제본을 가진 추론 워커 프로세스 풀
+
+    워커마다 독립된 모델과 CPU 스레드 예산을 가지며 (공유 상태 없음), 한 번에 요청 하나(배치 하나)만 처리한다.
+    세션 윈도우는 윈도우를 자를 때 공유 메모리 슬랩(self.slabs)에 쓰고, 나머지 배열 입력은 워커별 공유 메모리 버퍼에 써서 넘긴다.
+    파이프로는 작은 제어 메시지(슬랩 위치와 길이, 매개변수)와 결과만 주고받는다.
+
+    faster_whisper.WhisperModel과 같은 transcribe / transcribe_batch를 제공하므로
+    STTProcessor.model로 두면 InferenceScheduler와 REST 경로가 그대로 워커를 사용한다.
+    두 메서드는 유휴 워커가 생길 때까지 호출 스레드를 막으므로 작업 스레드에서 호출해야 한다.
+
+    워커가 비정상 종료하면 처리 중이던 요청은 RuntimeError로 실패하고, 워커는 즉시 다시 시작된다.
+    """
+
+    def __init__(
+        self,
+        num_workers: int = settings.INFERENCE_WORKER_PROCESSES,
+        threads_per_worker: int = settings.INFERENCE_THREADS_PER_WORKER,
+        backend: str = settings.INFERENCE_BACKEND,
+        model_name: str = settings.WHISPER_MODEL,
+        device: str = settings.DEVICE,
+        compute_type: str = settings.COMPUTE_TYPE,
+        start_timeout: float = settings.INFERENCE_WORKER_START_TIMEOUT_SECONDS,
+        buffer_samples: int = WORKER_BUFFER_SAMPLES,
+    ) -> None:
+        """
+        워커 풀 초기화 (프로세스는 start()에서 시작)
+
+        Args:
+            num_workers: 워커 프로세스 수
+            threads_per_worker: 워커당 CTranslate2 CPU 스레드 수
+            backend: 추론 백엔드 (faster_whisper, synthetic)
+            model_name: Whisper 모델 이름 또는 경로
+            device: 사용할 장치 (cuda, cpu)
+            compute_type: 연산 정밀도
+            start_timeout: 워커 하나의 모델 로딩 대기 시간 (초)
+            buffer_samples: 워커별 입력 버퍼 크기 (float32 샘플, 0이면 배열 입력을 모두 메시지에 담아 보냄)
+        """
+        self.num_workers = max(num_workers, 1)
+        self.threads_per_worker = max(threads_per_worker, 1)
+        self.backend = backend
+        self.model_name = model_name
+        self.device = device
+        self.compute_type = compute_type
+        self.start_timeout = start_timeout
+        self.buffer_samples = max(buffer_samples, 0)
+        self.slabs: Optional[AudioSlabAllocator] = None
+
+        # fork는 부모의 스레드/CUDA 상태를 물려받으므로 spawn 사용
+        self._context = multiprocessing.get_context("spawn")
+        self._slots: List[WorkerSlot] = []
+        self._idle: "queue.Queue[WorkerSlot]" = queue.Queue()
+        self._request_ids = itertools.count()
+        self._closed = False
+
+    def start(self) -> None:
+        """워커 프로세스를 시작하고 모든 워커의 모델 로딩과 워밍업을 기다림 (작업 스레드에서 호출)"""
+        start_time = time.time()
+        try:
+            self.slabs = AudioSlabAllocator()
+            for worker_id in range(self.num_workers):
+                # SharedMemory는 크기 0을 허용하지 않으므로 최소 1 샘플
+                slot = WorkerSlot(worker_id, SharedMemory(create=True, size=max(self.buffer_samples, 1) * 4))
+                self._slots.append(slot)
+                self._spawn(slot)
+            for slot in self._slots:
+                self._wait_ready(slot)
+        except Exception:
+            self.close()
+            raise
+        for slot in self._slots:
+            self._idle.put(slot)
+        logger.info(
+            f"추론 워커 풀 시작 - 워커: {self.num_workers}, 워커당 스레드: {self.threads_per_worker}, "
+            f"백엔드: {self.backend}, 소요 시간: {time.time() - start_time:.2f}초"
+        )
+
+    def _spawn(self, slot: WorkerSlot) -> None:
+        parent_conn, child_conn = self._context.Pipe()
+        process = self._context.Process(
+            target=_worker_main,
+            args=(
+                slot.worker_id, child_conn, slot.buffer.name, self.slabs.name, self.backend,
+                self.model_name, self.device, self.compute_type, self.threads_per_worker
+            ),
+            name=f"stt-inference-worker-{slot.worker_id}",
+            daemon=True
+        )
+        try:
+            process.start()
+        except Exception:
+            parent_conn.close()
+            raise
+        finally:
+            child_conn.close()
+        slot.process = process
+        slot.conn = parent_conn
+        slot.ready = False
+
+    def _wait_ready(self, slot: WorkerSlot) -> None:
+        """워커의 모델 로딩과 워밍업 완료 메시지 대기"""
+        if not slot.conn.poll(self.start_timeout):
+            raise RuntimeError(f"추론 워커 {slot.worker_id} 모델 로딩 시간 초과 ({self.start_timeout:.0f}초)")
+        try:
+            message = slot.conn.recv()
+        except (EOFError, OSError):
+            slot.process.join(timeout=1)
+            raise RuntimeError(f"추론 워커 {slot.worker_id}가 모델 로딩 중 종료되었습니다 (exit code {slot.process.exitcode})")
+        if message[0] != "ready":
+            raise RuntimeError(f"추론 워커 {slot.worker_id} {message[2]}")
+        slot.ready = True
+        slot.load_seconds = message[1]
+        slot.warmup_seconds = message[2]
+        warmup = f", 워밍업 {message[2]:.2f}초" if message[2] is not None else ""
+        logger.info(f"추론 워커 {slot.worker_id} 준비 완료 (pid {slot.process.pid}, 모델 로딩 {message[1]:.2f}초{warmup})")
+
+    def _restart(self, slot: WorkerSlot, reason: str) -> None:
+        """비정상 종료한 워커를 같은 버퍼로 다시 시작 (모델 로딩과 워밍업은 다음 요청에서 기다림)"""
+        slot.process.join(timeout=1)
+        logger.warning(f"추론 워커 {slot.worker_id} {reason} (exit code {slot.process.exitcode}) - 다시 시작합니다")
+        slot.conn.close()
+        slot.restarts += 1
+        INFERENCE_WORKER_RESTARTS.labels(str(slot.worker_id)).inc()
+        self._spawn(slot)
+
+    def transcribe(self, audio: Union[np.ndarray, AudioSlab], **params: Any) -> Tuple[list, Any]:
+        """WhisperModel.transcribe와 같은 형식 (float32 배열 또는 슬랩, 세그먼트는 이미 디코딩된 리스트)"""
+        return self._run([audio], params)[0]
+
+    def transcribe_batch(self, audios: List[Union[np.ndarray, AudioSlab]], params: Dict[str, Any]) -> List[Tuple[list, Any]]:
+        """
+        여러 윈도우를 워커 하나에서 한 번의 배치로 처리
+
+        Returns:
+            요청 순서대로 (세그먼트 리스트, 정보)
+        """
+        return self._run(audios, params)
+
+    def _run(self, audios: List[Union[np.ndarray, AudioSlab]], params: Dict[str, Any]) -> List[Tuple[list, Any]]:
+        if self._closed:
+            raise RuntimeError("추론 워커 풀이 종료되었습니다.")
+        slot = self._idle.get()
+        try:
+            if not slot.process.is_alive():
+                self._restart(slot, "유휴 중 종료")
+            if not slot.ready:
+                self._wait_ready(slot)
+
+            request_id = next(self._request_ids)
+            start_time = time.perf_counter()
+            slot.conn.send(("transcribe", request_id, self._pack_audio(slot, audios), params))
+            try:
+                reply = slot.conn.recv()
+            except (EOFError, OSError):
+                if self._closed:
+                    raise RuntimeError("추론 워커 풀이 종료되었습니다.")
+                self._restart(slot, "추론 중 종료")
+                raise RuntimeError(f"추론 워커 {slot.worker_id}가 추론 중 비정상 종료되었습니다.")
+            slot.requests += 1
+            slot.busy_seconds += time.perf_counter() - start_time
+
+            kind, reply_id, payload = reply
+            if kind != "result" or reply_id != request_id:
+                raise RuntimeError(f"추론 워커 {slot.worker_id} 오류: {payload}")
+            return payload
+        finally:
+            self._idle.put(slot)
+
+    def _pack_audio(self, slot: WorkerSlot, audios: List[Union[np.ndarray, AudioSlab]]) -> List[tuple]:
+        """
+        윈도우 목록을 제어 메시지용 설명으로 변환
+
+        슬랩은 위치와 길이만 보내고, 배열은 워커 입력 버퍼에 이어 쓴다 (버퍼에 남은 자리가 없으면 메시지에 직접 담음).
+        """
+        windows = []
+        samples = np.ndarray((self.buffer_samples,), dtype=np.float32, buffer=slot.buffer.buf)
+        offset = 0
+        for audio in audios:
+            if isinstance(audio, AudioSlab):
+                windows.append(("slab", audio.offset, audio.length))
+            elif offset + len(audio) <= self.buffer_samples:
+                samples[offset:offset + len(audio)] = audio
+                windows.append(("buffer", offset, len(audio)))
+                offset += len(audio)
+            else:
+                windows.append(("inline", audio))
+        return windows
+
+    def close(self) -> None:
+        """워커 종료 후 공유 메모리 버퍼 해제"""
+        self._closed = True
+        for slot in self._slots:
+            if slot.process is not None and slot.process.is_alive():
+                try:
+                    slot.conn.send(("stop",))
+                except (BrokenPipeError, OSError):
+                    pass
+        for slot in self._slots:
+            if slot.process is not None:
+                slot.process.join(timeout=5)
+                if slot.process.is_alive():
+                    slot.process.terminate()
+                    slot.process.join()
+            if slot.conn is not None:
+                slot.conn.close()
+            slot.buffer.close()
+            slot.buffer.unlink()
+        self._slots.clear()
+        if self.slabs is not None:
+            self.slabs.close()
+        logger.info("추론 워커 풀 종료")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """워커별 상태, 처리한 요청 수, 추론 시간 합계, 재시작 횟수"""
+        return {
+            "enabled": True,
+            "processes": self.num_workers,
+            "threads_per_worker": self.threads_per_worker,
+            "backend": self.backend,
+            "idle_workers": self._idle.qsize(),
+            "slabs": self.slabs.get_stats() if self.slabs is not None else None,
+            "workers": [
+                {
+                    "worker_id": slot.worker_id,
+                    "pid": slot.process.pid if slot.process is not None else None,
+                    "alive": slot.process is not None and slot.process.is_alive(),
+                    "ready": slot.ready,
+                    "load_seconds": round(slot.load_seconds, 2) if slot.load_seconds is not None else None,
+                    "warmup_seconds": round(slot.warmup_seconds, 2) if slot.warmup_seconds is not None else None,
+                    "requests": slot.requests,
+                    "busy_seconds": round(slot.busy_seconds, 3),
+                    "restarts": slot.restarts,
+                }
+                for slot in self._slots
+            ],
+        }
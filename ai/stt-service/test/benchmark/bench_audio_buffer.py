@@ -0,0 +1,94 @@
+"""
+오디오 버퍼 마이크로 벤치마크
+
+기존 bytearray 버퍼 경로와 AudioRingBuffer 경로를 동시 세션 N개 기준으로 비교하고,
+오디오 1초당 버퍼 관련 복사 바이트 수와 처리 시간을 출력한다.
+
+실행:
+    cd ai/stt-service
+    python test/benchmark/bench_audio_buffer.py --sessions 500 --seconds 60
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from app.core.config import settings  # noqa: E402
+from app.services.audio_buffer import AudioRingBuffer  # noqa: E402
+
+BYTES_PER_SECOND = settings.SAMPLE_RATE * 2
+
+
+def run_bytearray(frames, sessions: int, threshold: int):
+    """기존 방식: extend + bytes(slice) + 나머지 재구성"""
+    buffers = [bytearray() for _ in range(sessions)]
+    copied = 0
+    start = time.perf_counter()
+    for frame in frames:
+        for i in range(sessions):
+            buf = buffers[i]
+            buf.extend(frame)
+            copied += len(frame)
+            if len(buf) >= threshold:
+                use_size = len(buf)
+                audio_data = bytes(buf[:use_size])  # 슬라이스 복사 + bytes 복사
+                copied += use_size * 2
+                buffers[i] = buf[use_size:]  # 나머지 재구성
+                copied += len(buf) - use_size
+                np.frombuffer(audio_data, dtype=np.int16).astype(np.float32) / 32768.0
+    return time.perf_counter() - start, copied
+
+
+def run_ring(frames, sessions: int, threshold: int, capacity: int):
+    """링 버퍼 방식: write 1회 복사 + 복사 없는 뷰"""
+    buffers = [AudioRingBuffer(capacity) for _ in range(sessions)]
+    wrapped = 0
+    start = time.perf_counter()
+    for frame in frames:
+        for buf in buffers:
+            buf.write(frame)
+            if len(buf) >= threshold:
+                n = buf.num_samples
+                wraps = buf._head + n > buf.capacity
+                np.divide(buf.peek(n), 32768.0, dtype=np.float32)
+                buf.consume(n)
+                if wraps:
+                    wrapped += n * 2  # 경계를 넘는 경우의 보조 배열 복사
+    copied = sum(buf.bytes_written for buf in buffers) + wrapped
+    return time.perf_counter() - start, copied
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="오디오 버퍼 복사량 벤치마크")
+    parser.add_argument("--sessions", type=int, default=500, help="동시 세션 수")
+    parser.add_argument("--seconds", type=int, default=60, help="세션당 오디오 길이 (초)")
+    parser.add_argument("--frame-ms", type=int, default=100, help="웹소켓 프레임 길이 (ms)")
+    args = parser.parse_args()
+
+    frame_bytes = BYTES_PER_SECOND * args.frame_ms // 1000
+    num_frames = args.seconds * 1000 // args.frame_ms
+    rng = np.random.default_rng(0)
+    frames = [rng.integers(-3000, 3000, frame_bytes // 2, dtype=np.int16).tobytes() for _ in range(num_frames)]
+
+    threshold = min(settings.DEFAULT_BUFFER_SIZE, settings.MAX_AUDIO_BUFFER_MB * 1024 * 1024)
+    capacity = min(settings.AUDIO_RING_BUFFER_SIZE, settings.MAX_AUDIO_BUFFER_MB * 1024 * 1024)
+    audio_seconds = args.sessions * args.seconds
+
+    print(f"세션: {args.sessions}, 세션당 오디오: {args.seconds}초, 프레임: {frame_bytes} bytes, 임계값: {threshold} bytes")
+    for name, (elapsed, copied) in (
+        ("bytearray", run_bytearray(frames, args.sessions, threshold)),
+        ("ring", run_ring(frames, args.sessions, threshold, capacity)),
+    ):
+        print(
+            f"{name:>10}: 오디오 1초당 복사 {copied / audio_seconds:,.0f} bytes "
+            f"(실시간 {args.sessions} 세션 기준 {copied / args.seconds / 1e6:,.2f} MB/s), "
+            f"처리 시간 {elapsed:.2f}초"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+추론 워커 오디오 전달 방식 벤치마크
+
+전달 방식별 처리량: 링 버퍼에서 자른 16-bit PCM 윈도우를 워커 프로세스로 넘겨 결과를 받을 때까지의 시간
+- pickle: float32 배열을 제어 메시지에 담아 파이프로 전송 (입력 버퍼 없음)
+- buffer: float32 배열을 워커별 공유 메모리 입력 버퍼에 복사
+- slab: int16 PCM을 공유 메모리 슬랩에 한 번 복사하고 위치/길이만 전송 (float32 변환은 워커에서)
+모델 비용을 빼기 위해 synthetic 백엔드를 지연 시간 0으로 사용한다.
+연결 종료 시 슬랩 반환은 test/test_audio_slab.py에서 확인한다.
+
+실행:
+    cd ai/stt-service
+    python test/benchmark/bench_audio_slab.py --window-seconds 15 --requests 500
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from app.core.config import settings  # noqa: E402
+from app.services.worker_pool import InferenceWorkerPool  # noqa: E402
+
+PARAMS = {"language": "ko", "beam_size": 5, "word_timestamps": False, "vad_filter": False}
+
+
+def make_pcm(seconds: float) -> np.ndarray:
+    """발화/무음이 번갈아 나오는 16-bit PCM 합성 신호"""
+    samples = int(seconds * settings.SAMPLE_RATE)
+    t = np.arange(samples) / settings.SAMPLE_RATE
+    rng = np.random.default_rng(0)
+    audio = 0.1 * np.sin(2 * np.pi * 220 * t) * (np.sin(2 * np.pi * 0.5 * t) > 0) + 0.01 * rng.standard_normal(samples)
+    return (audio * 32767).astype(np.int16)
+
+
+def start_pool(workers: int, latency_ms: float, **kwargs: Any) -> InferenceWorkerPool:
+    """synthetic 백엔드 워커 풀 시작 (워커 프로세스는 시작 시점의 환경 변수로 지연 시간을 읽음)"""
+    os.environ["SYNTHETIC_LATENCY_MS"] = str(latency_ms)
+    os.environ["SYNTHETIC_LATENCY_PER_AUDIO_SECOND_MS"] = "0"
+    os.environ["SYNTHETIC_LATENCY_SIGMA"] = "0"
+    pool = InferenceWorkerPool(num_workers=workers, backend="synthetic", **kwargs)
+    pool.start()
+    return pool
+
+
+def run_transport(transport: str, pcm: np.ndarray, args: argparse.Namespace) -> Dict[str, Any]:
+    # pickle: 입력 버퍼가 없으면 배열 입력은 모두 제어 메시지에 담겨 전송됨
+    pool = start_pool(args.workers, 0, buffer_samples=0) if transport == "pickle" else start_pool(args.workers, 0)
+
+    def request(_: int) -> float:
+        started = time.perf_counter()
+        if transport == "slab":
+            slab = pool.slabs.write(pcm)
+            try:
+                pool.transcribe(slab, **PARAMS)
+            finally:
+                slab.release()
+        else:
+            pool.transcribe(np.divide(pcm, 32768.0, dtype=np.float32), **PARAMS)
+        return time.perf_counter() - started
+
+    try:
+        with ThreadPoolExecutor(max_workers=args.workers) as executor:
+            list(executor.map(request, range(args.workers * 4)))
+            started = time.perf_counter()
+            latencies = sorted(executor.map(request, range(args.requests)))
+            elapsed = time.perf_counter() - started
+    finally:
+        pool.close()
+
+    return {
+        "transport": transport,
+        "windows_per_second": round(args.requests / elapsed, 1),
+        "pcm_mb_per_second": round(args.requests * pcm.nbytes / elapsed / 1e6, 1),
+        "latency_us": {
+            "p50": round(latencies[len(latencies) // 2] * 1e6, 1),
+            "p95": round(latencies[min(int(len(latencies) * 0.95), len(latencies) - 1)] * 1e6, 1),
+        },
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="워커 오디오 전달 방식 벤치마크")
+    parser.add_argument("--window-seconds", type=float, default=15.0)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--requests", type=int, default=500, help="전달 방식마다 보낼 윈도우 수")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    pcm = make_pcm(args.window_seconds)
+    results: List[Dict[str, Any]] = []
+
+    print(f"윈도우 {args.window_seconds:g}초 ({pcm.nbytes / 1e6:.2f}MB int16), 워커 {args.workers}개, 요청 {args.requests}개")
+    print(f"{'전달 방식':10s} {'윈도우/초':>10s} {'PCM MB/초':>10s} {'p50(µs)':>10s} {'p95(µs)':>10s}")
+    for transport in ("pickle", "buffer", "slab"):
+        result = run_transport(transport, pcm, args)
+        results.append(result)
+        print(
+            f"{transport:10s} {result['windows_per_second']:10.1f} {result['pcm_mb_per_second']:10.1f} "
+            f"{result['latency_us']['p50']:10.1f} {result['latency_us']['p95']:10.1f}"
+        )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"args": vars(args), "results": results}, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""
+세션 간 배치 스케줄러 부하 테스트
+
+N개 세션이 동시에 윈도우를 제출하는 상황을 CPU에서 재현하여
+세션별 run_in_executor 방식과 InferenceScheduler 방식의 집계 실시간 계수(RTF)를 비교한다.
+집계 RTF = 처리한 오디오 길이 합 / 경과 시간 (클수록 좋음)
+
+매개변수는 웹소켓 경로와 같이 _build_transcribe_params로 만들며 (시나리오별 빔 크기와 VAD),
+두 번째 윈도우부터 세션마다 다른 초기 프롬프트(이전 인식 결과)를 붙인다.
+--no-batch-prompted는 프롬프트가 있는 윈도우를 단독 실행하는 경우 (INFERENCE_BATCH_PROMPTED_WINDOWS=False)를 잰다.
+
+실행:
+    cd ai/stt-service
+    python test/benchmark/bench_inference_scheduler.py --model tiny --sessions 16 --rounds 2
+    python test/benchmark/bench_inference_scheduler.py --wav sample_16k.wav --scenario interview
+    python test/benchmark/bench_inference_scheduler.py --no-batch-prompted
+    python test/benchmark/bench_inference_scheduler.py --backend synthetic  # 모델 없이 배치 구성만 확인
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+import wave
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from app.core.config import settings  # noqa: E402
+from app.services.inference_scheduler import InferenceScheduler  # noqa: E402
+from app.services.warmup import warmup_audio  # noqa: E402
+from app.services.worker_pool import _load_replica  # noqa: E402
+from app.services.websocket_service import websocket_manager  # noqa: E402
+
+# 세션별 이전 인식 결과 (초기 프롬프트)
+PROMPTS = (
+    "안녕하세요 오늘 발표를 맡은 김민수입니다",
+    "먼저 지난 분기 실적부터 말씀드리겠습니다",
+    "질문이 있으시면 언제든지 말씀해 주세요",
+    "이 부분은 다음 슬라이드에서 자세히 설명하겠습니다",
+)
+
+
+def load_window(path: str, seconds: float) -> np.ndarray:
+    """16kHz 16-bit 모노 WAV를 읽어 윈도우 길이에 맞춤 (없으면 Silero VAD가 발화로 판정하는 합성 신호)"""
+    samples = int(seconds * settings.SAMPLE_RATE)
+    if path:
+        with wave.open(path, "rb") as f:
+            audio = np.frombuffer(f.readframes(f.getnframes()), dtype=np.int16).astype(np.float32) / 32768.0
+        return np.resize(audio, samples)
+    return warmup_audio(seconds)
+
+
+def session_params(sessions: int, scenario: str, language: str, first_window: bool):
+    """세션별 transcribe 매개변수 (첫 윈도우가 아니면 세션마다 다른 초기 프롬프트)"""
+    params = []
+    for i in range(sessions):
+        session = {"scenario": scenario, "language": language}
+        prompt = None if first_window else f"{PROMPTS[i % len(PROMPTS)]} ({i})"
+        params.append(websocket_manager._build_transcribe_params(session, prompt))
+    return params
+
+
+async def run_per_session(model, window, params_list) -> float:
+    loop = asyncio.get_running_loop()
+
+    def transcribe(params):
+        segments, info = model.transcribe(window, **params)
+        return list(segments), info
+
+    start = time.perf_counter()
+    await asyncio.gather(*(loop.run_in_executor(None, transcribe, p) for p in params_list))
+    return time.perf_counter() - start
+
+
+async def run_scheduler(model, window, params_list, max_batch_size: int, max_wait_ms: int):
+    scheduler = InferenceScheduler(lambda: model, max_batch_size=max_batch_size, max_wait_ms=max_wait_ms)
+    start = time.perf_counter()
+    await asyncio.gather(*(scheduler.submit(window, p, session_id=str(i)) for i, p in enumerate(params_list)))
+    elapsed = time.perf_counter() - start
+    stats = scheduler.get_stats()
+    await scheduler.shutdown()
+    return elapsed, stats
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="배치 스케줄러 부하 테스트")
+    parser.add_argument("--backend", default="faster_whisper", choices=("faster_whisper", "synthetic"))
+    parser.add_argument("--model", default="tiny", help="faster-whisper 모델 이름")
+    parser.add_argument("--wav", default="", help="16kHz 16-bit 모노 WAV 경로 (없으면 합성 신호)")
+    parser.add_argument("--sessions", type=int, default=16, help="동시 세션 수")
+    parser.add_argument("--rounds", type=int, default=2, help="세션당 윈도우 수")
+    parser.add_argument("--window-seconds", type=float, default=15.0, help="윈도우 길이 (초)")
+    parser.add_argument("--language", default="ko")
+    parser.add_argument("--scenario", default="presentation", choices=sorted(settings.SCENARIO_VAD_PARAMS))
+    parser.add_argument("--no-batch-prompted", action="store_true",
+                        help="초기 프롬프트가 있는 윈도우를 배치하지 않음 (INFERENCE_BATCH_PROMPTED_WINDOWS=False)")
+    parser.add_argument("--max-batch-size", type=int, default=settings.INFERENCE_MAX_BATCH_SIZE)
+    parser.add_argument("--max-wait-ms", type=int, default=settings.INFERENCE_MAX_WAIT_MS)
+    args = parser.parse_args()
+
+    model = _load_replica(0, args.backend, args.model, "cpu", "int8", settings.CPU_THREADS)
+    settings.INFERENCE_BATCH_PROMPTED_WINDOWS = not args.no_batch_prompted
+    window = load_window(args.wav, args.window_seconds)
+    audio_seconds = args.sessions * args.window_seconds
+
+    # 워밍업
+    list(model.transcribe(window, **session_params(1, args.scenario, args.language, True)[0])[0])
+
+    per_session = scheduled = 0.0
+    batched = 0
+    for round_index in range(args.rounds):
+        params_list = session_params(args.sessions, args.scenario, args.language, first_window=round_index == 0)
+        per_session += await run_per_session(model, window, params_list)
+        elapsed, stats = await run_scheduler(model, window, params_list, args.max_batch_size, args.max_wait_ms)
+        scheduled += elapsed
+        batched += sum(size * count for size, count in stats["batch_size_histogram"].items() if size > 1)
+
+    total_audio = audio_seconds * args.rounds
+    params = session_params(1, args.scenario, args.language, True)[0]
+    print(
+        f"백엔드: {args.backend}, 모델: {args.model}, 세션: {args.sessions}, 윈도우: {args.window_seconds}초 x {args.rounds}회, "
+        f"시나리오: {args.scenario} (빔 {params['beam_size']}, VAD {params['vad_filter']}), "
+        f"프롬프트 윈도우 배치: {settings.INFERENCE_BATCH_PROMPTED_WINDOWS}"
+    )
+    print(f"  배치로 처리한 윈도우: {batched}/{args.sessions * args.rounds}")
+    print(f"  세션별 executor : {per_session:7.2f}초, 집계 RTF {total_audio / per_session:6.2f}x")
+    print(f"  배치 스케줄러   : {scheduled:7.2f}초, 집계 RTF {total_audio / scheduled:6.2f}x")
+    print(f"  마지막 라운드 스케줄러 통계: {stats}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
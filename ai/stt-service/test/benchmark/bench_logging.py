@@ -0,0 +1,222 @@
+"""
+WebSocket 핫 패스 로깅 비용 측정 (세션 N개 x 초당 프레임 M개)
+
+_handle_binary_message의 프레임 단위 로그와 _process_audio_buffer의 윈도우 단위 로그를
+기존 방식(동기 StreamHandler/FileHandler, f-string, 프레임마다 INFO)과
+현재 방식(QueueHandler/QueueListener, %-스타일 지연 포맷팅, 프레임 로그 속도 제한)으로 재현하고,
+이벤트 루프가 로깅 호출에 쓴 시간과 루프 지연(p99)을 비교한다.
+콘솔 출력은 /dev/null로, 파일 출력은 임시 디렉토리로 보낸다.
+
+실행:
+    cd ai/stt-service
+    python test/benchmark/bench_logging.py --sessions 100 --fps 50 --duration 15
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List
+
+SERVICE_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+sys.path.insert(0, SERVICE_ROOT)
+
+FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+FRAME_BYTES = 640  # 20ms, 16kHz 16-bit PCM
+WINDOW_BYTES = 16000 * 2 * 15  # DEFAULT_BUFFER_SIZE
+
+
+def legacy_setup_logger(name: str, log_path: str) -> logging.Logger:
+    """기존 app/core/logging.py의 동기 핸들러 구성"""
+    logger = logging.getLogger(name)
+    logger.setLevel(logging.INFO)
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setFormatter(logging.Formatter(FORMAT))
+    logger.addHandler(console_handler)
+    file_handler = logging.FileHandler(log_path)
+    file_handler.setFormatter(logging.Formatter(FORMAT))
+    logger.addHandler(file_handler)
+    return logger
+
+
+def sample_window() -> Dict[str, Any]:
+    """윈도우 로그에 들어가는 메트릭 (값 자체는 측정과 무관)"""
+    segments = [{"text": "안녕하세요 오늘 발표 주제는 실시간 음성 인식입니다", "wpm": 142.3, "duration": 3.2} for _ in range(6)]
+    speech_metrics = {
+        "average_segment_wpm": 141.2, "median_segment_wpm": 139.8, "wpm_total": 118.4, "evaluation_wpm": 139.8,
+        "speech_density": 0.84, "speed_category": "normal", "speech_pattern": "normal", "pause_pattern": "natural",
+        "pause_metrics": {"average_duration": 0.62}, "segment_metrics": segments,
+    }
+    result_data = {
+        "type": "transcription", "text": " ".join(s["text"] for s in segments), "speech_metrics": speech_metrics,
+        "words": [{"word": "안녕하세요", "start": i * 0.4, "end": i * 0.4 + 0.3, "probability": 0.98} for i in range(60)],
+    }
+    return {"speech_metrics": speech_metrics, "syllable_metrics": {"spm_active": 301.2, "spm_total": 255.0},
+            "result_data": result_data, "text": result_data["text"], "segments": segments}
+
+
+def legacy_frame(logger: logging.Logger, connection_id: str, size: int, buffered: int) -> None:
+    logger.info(f"바이너리 데이터 수신: {connection_id}, 크기: {size} bytes")
+    logger.info(f"오디오 데이터 버퍼에 추가: {connection_id}, 추가된 크기: {size} bytes, 현재 버퍼 크기: {buffered} bytes")
+
+
+def legacy_window(logger: logging.Logger, connection_id: str, w: Dict[str, Any]) -> None:
+    m, sm, result_data = w["speech_metrics"], w["syllable_metrics"], w["result_data"]
+    logger.info(f"버퍼 임계값 도달, 처리 시작: {connection_id}, 임계값: {WINDOW_BYTES}, 현재 크기: {WINDOW_BYTES}")
+    logger.info(f"오디오 버퍼 처리 시작: {connection_id}, 최종 처리: False, 현재 버퍼 크기: {WINDOW_BYTES} bytes")
+    logger.info(f"오디오 데이터 NumPy 배열로 변환 완료: {connection_id}, 배열 크기: {(WINDOW_BYTES // 2,)}, 오디오 길이: {15.0:.2f}초")
+    logger.info(f"WebSocket 모델 추론 완료: {connection_id}, 감지된 언어: ko, 확률: {0.99:.2f}")
+    logger.info(f"감정분석 결과 포함 - 주 감정: 기쁨 ({0.812:.3f})")
+    logger.info("말하기 속도 분석 (시나리오: presentation):")
+    logger.info(f"  - 텍스트: {w['text'][:50]}...")
+    logger.info("  - 언어: ko")
+    logger.info(f"  - 세그먼트 평균 WPM: {m['average_segment_wpm']}")
+    logger.info(f"  - 세그먼트 중앙값 WPM: {m['median_segment_wpm']}")
+    logger.info(f"  - 전체 시간 WPM: {m['wpm_total']}")
+    logger.info(f"  - 평가 WPM: {m['evaluation_wpm']}")
+    logger.info(f"  - 발화 밀도: {m['speech_density']:.1%}")
+    logger.info(f"  - 속도 카테고리: {m['speed_category']}")
+    logger.info(f"  - 말하기 패턴: {m['speech_pattern']}")
+    logger.info(f"  - Pause 패턴: {m['pause_pattern']}")
+    logger.info(f"  - 평균 Pause: {m['pause_metrics'].get('average_duration', 0):.2f}초")
+    logger.info(f"  - 세그먼트 수: {len(w['segments'])}")
+    logger.info(f"  - SPM (발화): {sm['spm_active']}")
+    logger.info(f"  - SPM (전체): {sm['spm_total']}")
+    for i, seg in enumerate(m["segment_metrics"][:3]):
+        logger.info(f"    Segment {i+1}: WPM={seg['wpm']:.1f}, Duration={seg['duration']:.2f}s, Text='{seg['text'][:30]}...')")
+    logger.info(f"  - 단어 타임스탬프 수: {len(result_data['words'])}")
+    logger.debug(f"  - 전체 전송 JSON: {json.dumps(result_data, ensure_ascii=False, indent=2)}")
+    logger.info(f"STT 결과 전송 완료: {connection_id}")
+
+
+def current_frame(logger: logging.Logger, frame_logger: logging.Logger, connection_id: str, size: int, buffered: int) -> None:
+    frame_logger.debug("바이너리 데이터 수신: %s, 크기: %d bytes", connection_id, size)
+    frame_logger.info(
+        "오디오 데이터 버퍼에 추가: %s, 추가된 크기: %d bytes, 현재 버퍼 크기: %d bytes",
+        connection_id, size, buffered
+    )
+
+
+def current_window(logger: logging.Logger, connection_id: str, w: Dict[str, Any]) -> None:
+    m, sm, result_data = w["speech_metrics"], w["syllable_metrics"], w["result_data"]
+    logger.info("버퍼 임계값 도달, 처리 시작: %s, 임계값: %d, 현재 크기: %d", connection_id, WINDOW_BYTES, WINDOW_BYTES)
+    logger.info("오디오 버퍼 처리 시작: %s, 최종 처리: %s, 현재 버퍼 크기: %d bytes", connection_id, False, WINDOW_BYTES)
+    logger.debug("오디오 데이터 NumPy 배열로 변환 완료: %s, 배열 크기: %s, 오디오 길이: %.2f초", connection_id, (WINDOW_BYTES // 2,), 15.0)
+    logger.info("WebSocket 모델 추론 완료: %s, 감지된 언어: %s, 확률: %.2f", connection_id, "ko", 0.99)
+    logger.info("감정분석 결과 포함 - 주 감정: %s (%.3f)", "기쁨", 0.812)
+    logger.info(
+        "STT 결과 전송 완료: %s, 시나리오: %s, 언어: %s, 세그먼트 수: %d, "
+        "평균/중앙값/전체/평가 WPM: %s/%s/%s/%s, 발화 밀도: %.1f%%, 속도: %s, "
+        "말하기 패턴: %s, Pause 패턴: %s, 평균 Pause: %.2f초, SPM (발화/전체): %s/%s",
+        connection_id, "presentation", "ko", len(w["segments"]),
+        m["average_segment_wpm"], m["median_segment_wpm"], m["wpm_total"], m["evaluation_wpm"],
+        m["speech_density"] * 100, m["speed_category"], m["speech_pattern"], m["pause_pattern"],
+        m["pause_metrics"].get("average_duration", 0), sm["spm_active"], sm["spm_total"]
+    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("  - 전체 전송 JSON: %s", json.dumps(result_data, ensure_ascii=False, indent=2))
+
+
+async def run_load(mode: str, loggers: Dict[str, logging.Logger], args: argparse.Namespace) -> Dict[str, Any]:
+    window = sample_window()
+    frame_times: List[float] = []
+    logging_total = 0.0
+    lags: List[float] = []
+    deadline = time.perf_counter() + args.duration
+    frames_per_window = WINDOW_BYTES // FRAME_BYTES
+
+    async def session(index: int) -> None:
+        nonlocal logging_total
+        connection_id = f"bench-{index:04d}"
+        interval = 1 / args.fps
+        frame_no = random.randrange(frames_per_window)  # 윈도우 시점을 세션마다 분산
+        next_at = time.perf_counter() + random.random() * interval
+        while next_at < deadline:
+            await asyncio.sleep(max(0, next_at - time.perf_counter()))
+            next_at += interval
+            frame_no += 1
+            buffered = (frame_no % frames_per_window) * FRAME_BYTES
+
+            start = time.perf_counter()
+            if mode == "legacy":
+                legacy_frame(loggers["logger"], connection_id, FRAME_BYTES, buffered)
+                if buffered == 0:
+                    legacy_window(loggers["logger"], connection_id, window)
+            else:
+                current_frame(loggers["logger"], loggers["frame_logger"], connection_id, FRAME_BYTES, buffered)
+                if buffered == 0:
+                    current_window(loggers["logger"], connection_id, window)
+            elapsed = time.perf_counter() - start
+            frame_times.append(elapsed)
+            logging_total += elapsed
+
+    async def ticker() -> None:
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            await asyncio.sleep(0.01)
+            lags.append(time.perf_counter() - start - 0.01)
+
+    started = time.perf_counter()
+    await asyncio.gather(ticker(), *(session(i) for i in range(args.sessions)))
+    wall = time.perf_counter() - started
+
+    frame_times.sort()
+    lags.sort()
+
+    def pct(values: List[float], p: float) -> float:
+        return values[min(int(len(values) * p), len(values) - 1)] if values else 0.0
+
+    return {
+        "frames": len(frame_times),
+        "frames_per_s": len(frame_times) / wall,
+        "logging_ms_per_s": logging_total * 1000 / wall,
+        "loop_share": logging_total / wall,
+        "frame_p50_us": pct(frame_times, 0.5) * 1e6,
+        "frame_p99_us": pct(frame_times, 0.99) * 1e6,
+        "lag_p99_ms": pct(lags, 0.99) * 1000,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="WebSocket 핫 패스 로깅 비용 측정")
+    parser.add_argument("--sessions", type=int, default=100)
+    parser.add_argument("--fps", type=int, default=50, help="세션당 초당 오디오 프레임 수")
+    parser.add_argument("--duration", type=float, default=15.0, help="모드별 측정 시간 (초)")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="bench_logging_")
+    os.chdir(workdir)  # app.core.logging의 logs/ 디렉토리를 임시 위치에 생성
+    devnull = open(os.devnull, "w")
+    real_stdout, sys.stdout = sys.stdout, devnull
+    try:
+        from app.core.logging import setup_frame_logger, setup_logger
+
+        legacy = {"logger": legacy_setup_logger("bench_legacy", os.path.join(workdir, "legacy.log"))}
+        current_logger = setup_logger("bench_current", "current.log")
+        current = {"logger": current_logger, "frame_logger": setup_frame_logger(current_logger)}
+
+        results = {
+            "legacy": asyncio.run(run_load("legacy", legacy, args)),
+            "current": asyncio.run(run_load("current", current, args)),
+        }
+    finally:
+        sys.stdout = real_stdout
+
+    print(f"세션 {args.sessions}개 x {args.fps} frames/s, 모드별 {args.duration:.0f}초")
+    for mode, r in results.items():
+        print(
+            f"  {mode:8s}: 프레임 {r['frames']:7d} ({r['frames_per_s']:6.0f}/s), "
+            f"로깅 {r['logging_ms_per_s']:7.1f}ms/s (루프의 {r['loop_share']:5.1%}), "
+            f"프레임당 p50 {r['frame_p50_us']:6.1f}us / p99 {r['frame_p99_us']:7.1f}us, "
+            f"루프 지연 p99 {r['lag_p99_ms']:6.2f}ms"
+        )
+    legacy_ms, current_ms = results["legacy"]["logging_ms_per_s"], results["current"]["logging_ms_per_s"]
+    print(f"  이벤트 루프 로깅 시간 {legacy_ms / current_ms:.1f}x 감소" if current_ms > 0 else "")
+
+
+if __name__ == "__main__":
+    main()
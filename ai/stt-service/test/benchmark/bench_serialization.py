@@ -0,0 +1,182 @@
+"""
+WebSocket/REST 결과 메시지 직렬화 벤치마크 (크기, 인코딩/디코딩 시간)
+
+15초 batch 윈도우의 transcription 메시지를 실제 메트릭 함수로 만들고
+(synthetic 백엔드 세그먼트/단어, 감정분석 6개 감정), 직렬화 경로와 fields 선택 조합별로 비교한다.
+- json.dumps: 이전 send_json 경로 (한글은 \\uXXXX 이스케이프)
+- json: 현재 send_json 경로 (JSON_SERIALIZER, 기본 orjson / 표준 라이브러리 대체 경로)
+- msgpack: encoding=msgpack 바이너리 프레임
+- fields: text / text,emotion / text,metrics / text,words 선택 시 크기
+- REST: Starlette JSONResponse와 기본 응답 클래스 FastJSONResponse의 render
+모든 JSON 경로의 디코딩 결과가 이전 경로와 같은지도 확인한다.
+
+실행:
+    cd ai/stt-service
+    python test/benchmark/bench_serialization.py --repeat 2000
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+import msgpack
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from app.core.config import settings  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+
+from app.core.serialization import FastJSONResponse, encode_message, parse_fields, select_fields, use_orjson  # noqa: E402
+from app.services.session_metrics import SessionMetricsAccumulator  # noqa: E402
+from app.services.speech_metrics import (  # noqa: E402
+    SegmentColumns,
+    calculate_segment_based_metrics,
+    calculate_speech_variability,
+    count_syllables
+)
+from app.services.synthetic_backend import SyntheticWhisperModel  # noqa: E402
+
+EMOTIONS = (("happy", "기쁨"), ("neutral", "중립"), ("sad", "슬픔"), ("angry", "분노"), ("anxious", "불안"), ("hurt", "상처"))
+
+
+def emotion_result() -> Dict[str, Any]:
+    """format_emotion_result가 만드는 감정분석 블록 (top_emotions에 6개 감정 전체)"""
+    probabilities = np.random.default_rng(0).dirichlet(np.ones(len(EMOTIONS)))
+    emotions = sorted(
+        (
+            {"emotion": name, "emotion_kr": name_kr, "confidence": float(p), "probability": float(p)}
+            for (name, name_kr), p in zip(EMOTIONS, probabilities)
+        ),
+        key=lambda e: e["probability"],
+        reverse=True
+    )
+    return {
+        "primary_emotion": emotions[0],
+        "top_emotions": emotions,
+        "scenario_applied": "presentation",
+        "processing_time": 0.1234,
+        "model_used": "jungjongho/wav2vec2-xlsr-korean-speech-emotion-recognition2_data_rebalance"
+    }
+
+
+def transcription_message(window_seconds: float) -> Dict[str, Any]:
+    """_process_audio_buffer의 result_data와 같은 구조의 메시지"""
+    segments_list = SyntheticWhisperModel().transcribe_batch(
+        [np.zeros(int(window_seconds * settings.SAMPLE_RATE), dtype=np.float32)], {"word_timestamps": True}
+    )[0][0]
+    text = " ".join(s.text.strip() for s in segments_list)
+    columns = SegmentColumns.from_segments(segments_list)
+    speech_metrics = calculate_segment_based_metrics(segments_list, window_seconds, "presentation", "ko", columns=columns)
+    accumulator = SessionMetricsAccumulator()
+    accumulator.update(columns, window_seconds)
+    syllable_count = count_syllables(text, "ko")
+
+    return {
+        "type": "transcription",
+        "text": text,
+        "is_final": False,
+        "segment_id": 3,
+        "scenario": "presentation",
+        "language": "ko",
+        "language_probability": 0.998,
+        "speech_metrics": {
+            key: speech_metrics[key] for key in (
+                "evaluation_wpm", "speed_category", "speech_pattern", "average_segment_wpm", "median_segment_wpm",
+                "wpm_cv", "wpm_active", "wpm_total", "speech_density", "pause_metrics", "pause_pattern"
+            )
+        },
+        "variability_metrics": calculate_speech_variability(segments_list, columns=columns),
+        "cumulative_metrics": accumulator.snapshot("presentation", "ko"),
+        "syllable_metrics": {
+            "syllable_count": syllable_count,
+            "spm_active": round(syllable_count / speech_metrics["speech_duration"] * 60, 2),
+            "spm_total": round(syllable_count / window_seconds * 60, 2)
+        },
+        "segments": speech_metrics["segment_metrics"],
+        "emotion_analysis": emotion_result(),
+        "emotion_pending": False,
+        "words": [
+            {"word": w.word, "start": w.start, "end": w.end, "probability": w.probability}
+            for s in segments_list for w in s.words
+        ],
+    }
+
+
+def measure_us(fn: Callable[[], Any], repeat: int) -> float:
+    """호출당 중앙값 시간 (µs, 100회씩 묶어 측정)"""
+    for _ in range(min(repeat, 100)):
+        fn()
+    chunk = 100
+    times = []
+    for _ in range(max(repeat // chunk, 1)):
+        start = time.perf_counter()
+        for _ in range(chunk):
+            fn()
+        times.append((time.perf_counter() - start) / chunk * 1e6)
+    times.sort()
+    return times[len(times) // 2]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="결과 메시지 직렬화 벤치마크")
+    parser.add_argument("--window-seconds", type=float, default=15.0, help="윈도우 길이 (초)")
+    parser.add_argument("--repeat", type=int, default=2000)
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    message = transcription_message(args.window_seconds)
+    cases: List[Dict[str, Any]] = []
+
+    mismatches: List[str] = []
+
+    def add_case(name: str, encode: Callable[[], Any], fields: str = None) -> None:
+        payload = encode()
+        is_msgpack = isinstance(payload, bytes) and payload[:1] != b"{"
+        decode = (lambda: msgpack.unpackb(payload, raw=False)) if is_msgpack else (lambda: json.loads(payload))
+        if decode() != select_fields(message, parse_fields(fields)):
+            mismatches.append(name)
+        size = len(payload) if isinstance(payload, bytes) else len(payload.encode("utf-8"))
+        cases.append({
+            "case": name,
+            "bytes": size,
+            "encode_us": round(measure_us(encode, args.repeat), 2),
+            "decode_us": round(measure_us(decode, args.repeat), 2),
+        })
+
+    def send_path(encoding: str, fields: str = None) -> Callable[[], Any]:
+        excluded = parse_fields(fields)
+        return lambda: encode_message(select_fields(message, excluded), encoding)
+
+    add_case("json.dumps (이전)", lambda: json.dumps(message))
+    add_case(f"json ({'orjson' if use_orjson() else 'json'})", send_path("json"))
+    add_case("msgpack", send_path("msgpack"))
+    for fields in ("text", "text,emotion", "text,metrics", "text,words"):
+        add_case(f"json fields={fields}", send_path("json", fields), fields)
+        add_case(f"msgpack fields={fields}", send_path("msgpack", fields), fields)
+    add_case("REST JSONResponse", lambda: JSONResponse(message).body)
+    add_case("REST FastJSONResponse", lambda: FastJSONResponse(message).body)
+
+    base = cases[0]
+    print(f"윈도우 {args.window_seconds:g}초, 단어 {len(message['words'])}개, 세그먼트 {len(message['segments'])}개")
+    print(f"{'경우':32s} {'크기(B)':>9s} {'비율':>7s} {'인코딩(µs)':>11s} {'디코딩(µs)':>11s}")
+    for case in cases:
+        print(
+            f"{case['case']:32s} {case['bytes']:9d} {case['bytes'] / base['bytes']:7.1%} "
+            f"{case['encode_us']:11.1f} {case['decode_us']:11.1f}"
+        )
+
+    if mismatches:
+        print(f"경고: 디코딩 결과가 원본과 다름: {', '.join(mismatches)}")
+    else:
+        print("모든 경로의 디코딩 결과가 원본 메시지와 같음")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"window_seconds": args.window_seconds, "results": cases}, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,401 @@
+"""
+말하기 속도 메트릭 벤치마크 (합성 1시간 세션)
+
+1시간 분량의 합성 세그먼트(단어 타임스탬프 포함)로 기존 순수 Python 구현과
+speech_metrics의 열 기반 구현을 비교하고, 두 결과의 JSON이 바이트 단위로 같은지 확인한다.
+기존 구현은 이 파일 아래쪽에 비교 기준으로 그대로 보관한다.
+
+실행:
+    cd ai/stt-service
+    python test/benchmark/bench_speech_metrics.py --hours 1 --repeat 5
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from app.core.config import settings  # noqa: E402
+from app.services.speech_metrics import (  # noqa: E402
+    SegmentColumns,
+    calculate_segment_based_metrics,
+    calculate_speech_variability,
+)
+from app.services.speech_metrics import count_syllables as count_syllables_new  # noqa: E402
+
+SYLLABLES = "안녕하세요오늘발표주제는실시간음성인식과감정분석입니다helloworld日本語です漢字"
+
+
+@dataclass
+class Word:
+    start: float
+    end: float
+    word: str
+    probability: float
+
+
+@dataclass
+class Segment:
+    start: float
+    end: float
+    text: str
+    words: Optional[List[Word]]
+
+
+def make_session(hours: float, seed: int, with_words_ratio: float = 0.9) -> List[Segment]:
+    """faster-whisper 세그먼트와 같은 형태의 합성 세션 (2자리 반올림 타임스탬프)"""
+    rng = random.Random(seed)
+    segments = []
+    t = 0.0
+    while t < hours * 3600:
+        t = round(t + rng.choice([0.0, 0.0, rng.uniform(0.1, 3.5)]), 2)
+        words = []
+        for _ in range(rng.randint(1, 18)):
+            word = "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(1, 4)))
+            end = round(t + rng.uniform(0.15, 0.6), 2)
+            words.append(Word(start=t, end=end, word=" " + word, probability=rng.random()))
+            t = end
+        text = "".join(w.word for w in words)
+        start = words[0].start
+        segments.append(Segment(start=start, end=t, text=text, words=words if rng.random() < with_words_ratio else None))
+        if rng.random() < 0.02:
+            # 길이가 0인 세그먼트 (WPM 0 처리 경로)
+            segments.append(Segment(start=t, end=t, text=" 음", words=None))
+    return segments
+
+
+def measure(fn, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="말하기 속도 메트릭 벤치마크")
+    parser.add_argument("--hours", type=float, default=1.0, help="합성 세션 길이 (시간)")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seeds", type=int, default=20, help="결과 비교에 사용할 세션 수 (여러 길이)")
+    args = parser.parse_args()
+
+    # 1. 결과 동일성 확인 (언어/시나리오/세션 길이 조합)
+    checked = 0
+    for seed in range(args.seeds):
+        segments = make_session(hours=[0.002, 0.01, 0.1, args.hours][seed % 4], seed=seed)
+        duration = segments[-1].end + 1.0
+        for language in ["ko", "en", "ja", "zh"]:
+            for scenario in settings.SCENARIO_SPEED_THRESHOLDS:
+                old = legacy_calculate_segment_based_metrics(segments, duration, scenario, language)
+                new = calculate_segment_based_metrics(segments, duration, scenario, language)
+                assert json.dumps(old, ensure_ascii=False) == json.dumps(new, ensure_ascii=False), (seed, language, scenario)
+                checked += 1
+        assert json.dumps(legacy_calculate_speech_variability(segments)) == json.dumps(calculate_speech_variability(segments)), seed
+        for segment in segments[:50]:
+            for language in ["ko", "en", "ja", "zh"]:
+                assert legacy_count_syllables(segment.text, language) == count_syllables_new(segment.text, language)
+    print(f"결과 동일성 확인: {checked}개 조합 JSON 일치")
+
+    # 2. 성능 비교
+    segments = make_session(args.hours, seed=0)
+    duration = segments[-1].end + 1.0
+    print(f"세션: {args.hours}시간, 세그먼트 {len(segments)}개")
+
+    def old_path():
+        legacy_calculate_segment_based_metrics(segments, duration, "presentation", "ko")
+        legacy_calculate_speech_variability(segments)
+
+    def new_path():
+        columns = SegmentColumns.from_segments(segments)
+        calculate_segment_based_metrics(segments, duration, "presentation", "ko", columns=columns)
+        calculate_speech_variability(segments, columns=columns)
+
+    old_ms = measure(old_path, args.repeat)
+    new_ms = measure(new_path, args.repeat)
+    text = "".join(s.text for s in segments)
+    old_syl = measure(lambda: legacy_count_syllables(text, "ko"), args.repeat)
+    new_syl = measure(lambda: count_syllables_new(text, "ko"), args.repeat)
+    print(f"  메트릭 + 변동성 : 기존 {old_ms:8.2f}ms, 열 기반 {new_ms:8.2f}ms ({old_ms / new_ms:.1f}x)")
+    print(f"  음절 수 ({len(text)}자): 기존 {old_syl:8.2f}ms, 코드포인트 {new_syl:8.2f}ms ({old_syl / new_syl:.1f}x)")
+
+
+# ---------------------------------------------------------------------------
+# 기존 구현 (비교 기준)
+# ---------------------------------------------------------------------------
+
+def legacy_calculate_segment_based_metrics(
+    segments_list: list,
+    audio_duration: float,
+    scenario: str = "presentation",
+    language: str = "ko"
+) -> Dict[str, Any]:
+    """
+    세그먼트별 말하기 속도 및 관련 메트릭 계산
+    
+    Returns:
+        - segment_wpm_list: 각 세그먼트의 WPM
+        - average_segment_wpm: 세그먼트 WPM의 평균
+        - median_segment_wpm: 세그먼트 WPM의 중앙값
+        - pause_metrics: pause 관련 메트릭
+        - speech_pattern: 말하기 패턴 분석
+    """
+    if not segments_list or audio_duration <= 0:
+        return {
+            "segment_wpm_list": [],
+            "average_segment_wpm": 0,
+            "median_segment_wpm": 0,
+            "wpm_active": 0,
+            "wpm_total": 0,
+            "speech_density": 0,
+            "pause_metrics": {},
+            "speech_pattern": "no_data",
+            "speed_category": "no_data"
+        }
+    
+    # 1. 세그먼트별 WPM 계산
+    segment_metrics = []
+    total_word_count = 0
+    total_speech_duration = 0
+    pause_durations = []
+    
+    for i, segment in enumerate(segments_list):
+        if hasattr(segment, 'start') and hasattr(segment, 'end'):
+            segment_duration = segment.end - segment.start
+            
+            # 단어 수 계산
+            word_count = 0
+            if hasattr(segment, 'words') and segment.words:
+                word_count = len(segment.words)
+            elif hasattr(segment, 'text'):
+                # words가 없는 경우 텍스트 기반 추정
+                word_count = len(segment.text.split())
+            
+            total_word_count += word_count
+            total_speech_duration += segment_duration
+            
+            # 세그먼트 WPM 계산
+            segment_wpm = (word_count / segment_duration * 60) if segment_duration > 0 else 0
+            
+            segment_metrics.append({
+                "index": i,
+                "text": segment.text if hasattr(segment, 'text') else "",
+                "start": segment.start,
+                "end": segment.end,
+                "duration": segment_duration,
+                "word_count": word_count,
+                "wpm": segment_wpm,
+                "spm": legacy_count_syllables(segment.text, language) / segment_duration * 60 if segment_duration > 0 else 0
+            })
+            
+            # Pause 계산 (다음 세그먼트와의 간격)
+            if i < len(segments_list) - 1:
+                next_segment = segments_list[i + 1]
+                if hasattr(next_segment, 'start'):
+                    pause = next_segment.start - segment.end
+                    if pause > 0:
+                        pause_durations.append(pause)
+    
+    # 2. 세그먼트 WPM 통계
+    segment_wpm_list = [m["wpm"] for m in segment_metrics if m["wpm"] > 0]
+    
+    if segment_wpm_list:
+        average_segment_wpm = sum(segment_wpm_list) / len(segment_wpm_list)
+        median_segment_wpm = sorted(segment_wpm_list)[len(segment_wpm_list) // 2]
+        wpm_std = (sum((w - average_segment_wpm) ** 2 for w in segment_wpm_list) / len(segment_wpm_list)) ** 0.5
+        wpm_cv = wpm_std / average_segment_wpm if average_segment_wpm > 0 else 0
+    else:
+        average_segment_wpm = median_segment_wpm = wpm_std = wpm_cv = 0
+    
+    # 3. 기존 메트릭 호환성 (wpm_active, wpm_total)
+    wpm_active = (total_word_count / total_speech_duration * 60) if total_speech_duration > 0 else 0
+    wpm_total = (total_word_count / audio_duration * 60) if audio_duration > 0 else 0
+    
+    # 4. 발화 밀도
+    speech_density = total_speech_duration / audio_duration if audio_duration > 0 else 0
+    
+    # 5. Pause 분석
+    if pause_durations:
+        pause_metrics = {
+            "count": len(pause_durations),
+            "total_duration": sum(pause_durations),
+            "average_duration": sum(pause_durations) / len(pause_durations),
+            "max_duration": max(pause_durations),
+            "min_duration": min(pause_durations),
+            "pause_ratio": sum(pause_durations) / audio_duration,
+            # 기존 호환성
+            "avg_duration": sum(pause_durations) / len(pause_durations)
+        }
+        
+        # Pause 패턴 분류
+        avg_pause = pause_metrics["average_duration"]
+        if avg_pause < 0.5:
+            pause_pattern = "very_short"
+        elif avg_pause < 1.0:
+            pause_pattern = "short"
+        elif avg_pause < 2.0:
+            pause_pattern = "normal"
+        elif avg_pause < 3.0:
+            pause_pattern = "long"
+        else:
+            pause_pattern = "very_long"
+    else:
+        pause_metrics = {
+            "count": 0,
+            "total_duration": 0,
+            "average_duration": 0,
+            "max_duration": 0,
+            "min_duration": 0,
+            "pause_ratio": 0,
+            # 기존 호환성
+            "avg_duration": 0
+        }
+        pause_pattern = "no_pause"
+    
+    # 6. 말하기 패턴 분석
+    speech_pattern = legacy_analyze_speech_pattern(
+        speech_density,
+        pause_pattern,
+        wpm_cv,
+        average_segment_wpm,
+        pause_metrics.get("pause_ratio", 0)
+    )
+    
+    # 7. 속도 카테고리 결정 (세그먼트 평균 기준)
+    thresholds = settings.SCENARIO_SPEED_THRESHOLDS.get(scenario, {}).get(
+        language, 
+        settings.SCENARIO_SPEED_THRESHOLDS["presentation"]["ko"]
+    )
+    
+    # 평가 기준 선택
+    if speech_pattern in ["staccato", "very_sparse"]:
+        # 끊어 말하기 패턴일 경우 중앙값 사용
+        evaluation_wpm = median_segment_wpm
+    else:
+        # 일반적인 경우 평균 사용
+        evaluation_wpm = average_segment_wpm
+    
+    # 속도 카테고리
+    if evaluation_wpm < thresholds["very_slow"]:
+        speed_category = "very_slow"
+    elif evaluation_wpm < thresholds["slow"]:
+        speed_category = "slow"
+    elif evaluation_wpm < thresholds["normal"]:
+        speed_category = "normal"
+    elif evaluation_wpm < thresholds["fast"]:
+        speed_category = "fast"
+    else:
+        speed_category = "very_fast"
+    
+    return {
+        # 세그먼트 정보
+        "segment_metrics": segment_metrics,
+        "segment_wpm_list": segment_wpm_list,
+        "average_segment_wpm": round(average_segment_wpm, 2),
+        "median_segment_wpm": round(median_segment_wpm, 2),
+        "wpm_std": round(wpm_std, 2),
+        "wpm_cv": round(wpm_cv, 3),
+        # 기존 호환성 메트릭
+        "wpm_active": round(wpm_active, 2),
+        "wpm_total": round(wpm_total, 2),
+        "evaluation_wpm": round(evaluation_wpm, 2),
+        "word_count": total_word_count,
+        "speech_duration": round(total_speech_duration, 2),
+        "total_duration": round(audio_duration, 2),
+        "speech_density": round(speech_density, 3),
+        # Pause 메트릭
+        "pause_metrics": pause_metrics,
+        "pause_pattern": pause_pattern,
+        # 패턴 및 평가
+        "speech_pattern": speech_pattern,
+        "speed_category": speed_category
+    }
+
+
+def legacy_analyze_speech_pattern(
+    speech_density: float,
+    pause_pattern: str,
+    wpm_cv: float,
+    average_wpm: float,
+    pause_ratio: float
+) -> str:
+    """말하기 패턴 분석"""
+    
+    # 1. 매우 긴 pause가 많은 경우
+    if pause_ratio > 0.5:
+        return "very_sparse"  # 매우 띄엄띄엄
+    
+    # 2. 짧은 문장 + 긴 pause 패턴
+    if pause_pattern in ["long", "very_long"] and speech_density < 0.6:
+        return "staccato"  # 끊어 말하기
+    
+    # 3. 연속적인 발화
+    if speech_density > 0.8 and pause_pattern in ["very_short", "short", "no_pause"]:
+        return "continuous"  # 연속적
+    
+    # 4. 일정한 속도의 발화
+    if wpm_cv < 0.2:
+        return "steady"  # 일정한 속도
+    
+    # 5. 변화가 큰 발화
+    if wpm_cv > 0.4:
+        return "variable"  # 속도 변화 큼
+    
+    # 6. 기본
+    return "normal"  # 일반적
+
+
+def legacy_count_syllables(text: str, language: str) -> int:
+    """언어별 음절 수 계산"""
+    if language == "ko":
+        # 한글 음절 수 (공백 제외)
+        return len([char for char in text if '가' <= char <= '힣'])
+    elif language == "ja":
+        # 일본어: 히라가나, 가타카나, 한자
+        return len([char for char in text if (
+            '\u3040' <= char <= '\u309F' or  # 히라가나
+            '\u30A0' <= char <= '\u30FF' or  # 가타카나
+            '\u4E00' <= char <= '\u9FAF'     # 한자
+        )])
+    elif language == "zh":
+        # 중국어: 한자
+        return len([char for char in text if '\u4E00' <= char <= '\u9FAF'])
+    else:
+        # 영어 등: 대략적인 음절 수 (모음 기준)
+        vowels = "aeiouAEIOU"
+        return sum(1 for char in text if char in vowels)
+
+
+def legacy_calculate_speech_variability(segments_list: list) -> Dict[str, float]:
+    """세그먼트 간 속도 변동성 계산"""
+    if not segments_list or len(segments_list) < 2:
+        return {"cv": 0, "std": 0, "mean": 0}
+    
+    segment_speeds = []
+    for segment in segments_list:
+        if hasattr(segment, 'words') and segment.words and hasattr(segment, 'start') and hasattr(segment, 'end'):
+            duration = segment.end - segment.start
+            if duration > 0:
+                wpm = len(segment.words) / duration * 60
+                segment_speeds.append(wpm)
+    
+    if not segment_speeds:
+        return {"cv": 0, "std": 0, "mean": 0}
+    
+    mean_speed = sum(segment_speeds) / len(segment_speeds)
+    variance = sum((s - mean_speed) ** 2 for s in segment_speeds) / len(segment_speeds)
+    std_speed = variance ** 0.5
+    cv = std_speed / mean_speed if mean_speed > 0 else 0
+    
+    return {
+        "cv": round(cv, 3),           # 변동계수
+        "std": round(std_speed, 2),    # 표준편차
+        "mean": round(mean_speed, 2)   # 평균
+    }
+
+
+if __name__ == "__main__":
+    main()
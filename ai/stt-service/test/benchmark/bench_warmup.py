@@ -0,0 +1,101 @@
+"""
+시작 시 워밍업 효과 벤치마크 (워밍업 없음 / 있음의 첫 요청 지연 시간)
+
+경우마다 새 프로세스에서 모델을 로드하고 (워밍업 경우는 warmup_model 실행),
+실제 요청과 같은 매개변수(VAD, 단어 타임스탬프)로 첫 요청과 이후 요청의 추론 시간을 잰다.
+첫 요청 / 이후 요청 중앙값 비율이 1에 가까울수록 초기화 비용이 워밍업으로 옮겨진 것이다.
+
+실행:
+    cd ai/stt-service
+    python test/benchmark/bench_warmup.py --model tiny --device cpu --compute-type int8
+    python test/benchmark/bench_warmup.py --beam-size 10 --window-seconds 5
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import time
+from typing import Any, Dict
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from app.core.config import settings  # noqa: E402
+
+
+def measure(args: argparse.Namespace, warmup: bool) -> Dict[str, Any]:
+    """새 프로세스 안에서 실행 (모델 로드 -> 워밍업 -> 요청)"""
+    from app.services.inference_scheduler import InferenceRequest, InferenceScheduler
+    from app.services.warmup import warmup_audio, warmup_model
+    from app.services.worker_pool import _load_replica
+
+    start_time = time.perf_counter()
+    model = _load_replica(0, args.backend, args.model, args.device, args.compute_type, args.cpu_threads)
+    load_seconds = time.perf_counter() - start_time
+
+    warmup_seconds = warmup_model(model)["seconds"] if warmup else None
+
+    params = {
+        "language": "ko",
+        "beam_size": args.beam_size,
+        "word_timestamps": True,
+        "vad_filter": True,
+        "vad_parameters": settings.TRANSCRIBE_PARAMS["vad_parameters"],
+    }
+    # 워밍업 신호와 다른 입력 (캐시된 결과가 아니라 초기화 비용만 보도록)
+    audio = warmup_audio(args.window_seconds)[::-1].copy()
+    latencies = []
+    for _ in range(args.requests):
+        started = time.perf_counter()
+        InferenceScheduler._transcribe_single(model, InferenceRequest(audio=audio, params=params, future=None))
+        latencies.append(time.perf_counter() - started)
+
+    rest = sorted(latencies[1:])
+    median = rest[len(rest) // 2]
+    return {
+        "warmup": warmup,
+        "load_seconds": round(load_seconds, 2),
+        "warmup_seconds": warmup_seconds,
+        "first_request_ms": round(latencies[0] * 1000, 1),
+        "steady_median_ms": round(median * 1000, 1),
+        "first_to_steady": round(latencies[0] / median, 2),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="시작 시 워밍업 효과 벤치마크")
+    parser.add_argument("--backend", default="faster_whisper", choices=("faster_whisper", "synthetic"))
+    parser.add_argument("--model", default="tiny")
+    parser.add_argument("--device", default="cpu")
+    parser.add_argument("--compute-type", default="int8")
+    parser.add_argument("--cpu-threads", type=int, default=settings.CPU_THREADS)
+    parser.add_argument("--beam-size", type=int, default=5)
+    parser.add_argument("--window-seconds", type=float, default=15.0)
+    parser.add_argument("--requests", type=int, default=6, help="경우마다 보낼 요청 수 (첫 요청 포함)")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    print(
+        f"백엔드: {args.backend}, 모델: {args.model}, 빔: {args.beam_size}, 윈도우: {args.window_seconds:g}초, "
+        f"워밍업 오디오: {settings.WARMUP_AUDIO_SECONDS}초, 워밍업 빔: {settings.WARMUP_BEAM_SIZES}"
+    )
+    print(f"{'워밍업':6s} {'로딩(초)':>9s} {'워밍업(초)':>10s} {'첫 요청(ms)':>12s} {'이후 중앙값(ms)':>15s} {'비율':>6s}")
+    results = []
+    # 경우마다 새 프로세스 (같은 프로세스에서는 앞 경우의 초기화가 남음)
+    with multiprocessing.get_context("spawn").Pool(1, maxtasksperchild=1) as pool:
+        for warmup in (False, True):
+            result = pool.apply(measure, (args, warmup))
+            results.append(result)
+            warmup_seconds = f"{result['warmup_seconds']:10.2f}" if result["warmup_seconds"] is not None else f"{'-':>10s}"
+            print(
+                f"{'있음' if warmup else '없음':6s} {result['load_seconds']:9.2f} {warmup_seconds} "
+                f"{result['first_request_ms']:12.1f} {result['steady_median_ms']:15.1f} {result['first_to_steady']:6.2f}"
+            )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"args": vars(args), "results": results}, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
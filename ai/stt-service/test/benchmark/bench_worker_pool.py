@@ -0,0 +1,125 @@
+"""
+추론 워커 프로세스 풀 확장성 벤치마크 (워커 1개부터 N개까지)
+
+워커 수마다 풀을 새로 시작해 같은 윈도우 요청을 동시에 처리하고,
+집계 실시간 계수(처리한 오디오 길이 합 / 경과 시간), 요청 지연 시간, 워커 1개 대비 배율을 비교한다.
+- faster_whisper: 워커마다 모델 복제본 (코어 수 / 워커당 스레드 수까지 늘어나는지 확인)
+- synthetic: 모델 없이 합성 지연 시간 (풀의 공유 메모리 전달, 제어 메시지, 결과 직렬화 오버헤드 확인)
+
+실행:
+    cd ai/stt-service
+    python test/benchmark/bench_worker_pool.py --model tiny --max-workers 8 --threads-per-worker 4
+    python test/benchmark/bench_worker_pool.py --backend synthetic --max-workers 8 --requests 256
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from app.core.config import settings  # noqa: E402
+from app.services.worker_pool import InferenceWorkerPool  # noqa: E402
+
+
+def make_window(seconds: float) -> np.ndarray:
+    """발화/무음이 번갈아 나오는 합성 신호"""
+    samples = int(seconds * settings.SAMPLE_RATE)
+    t = np.arange(samples) / settings.SAMPLE_RATE
+    rng = np.random.default_rng(0)
+    return (0.1 * np.sin(2 * np.pi * 220 * t) * (np.sin(2 * np.pi * 0.5 * t) > 0) + 0.01 * rng.standard_normal(samples)).astype(np.float32)
+
+
+def run(args: argparse.Namespace, num_workers: int, window: np.ndarray, params: Dict[str, Any]) -> Dict[str, Any]:
+    pool = InferenceWorkerPool(
+        num_workers=num_workers,
+        threads_per_worker=args.threads_per_worker,
+        backend=args.backend,
+        model_name=args.model,
+        device=args.device,
+        compute_type=args.compute_type
+    )
+    start_time = time.perf_counter()
+    pool.start()
+    startup = time.perf_counter() - start_time
+
+    def request(_: int) -> float:
+        started = time.perf_counter()
+        if args.batch_size > 1:
+            pool.transcribe_batch([window] * args.batch_size, params)
+        else:
+            pool.transcribe(window, **params)
+        return time.perf_counter() - started
+
+    try:
+        # 워커당 한 번씩 먼저 실행 (첫 추론 비용 제외)
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            list(executor.map(request, range(num_workers)))
+        # 서비스의 스케줄러처럼 워커 수만큼 동시에 제출
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            started = time.perf_counter()
+            latencies = sorted(executor.map(request, range(args.requests)))
+            elapsed = time.perf_counter() - started
+        stats = pool.get_stats()
+    finally:
+        pool.close()
+
+    audio_seconds = args.requests * args.batch_size * len(window) / settings.SAMPLE_RATE
+    return {
+        "workers": num_workers,
+        "startup_seconds": round(startup, 2),
+        "elapsed_seconds": round(elapsed, 3),
+        "aggregate_rtf": round(audio_seconds / elapsed, 2),
+        "latency_ms": {
+            "p50": round(latencies[len(latencies) // 2] * 1000, 1),
+            "p95": round(latencies[min(int(len(latencies) * 0.95), len(latencies) - 1)] * 1000, 1),
+        },
+        "requests_per_worker": [w["requests"] for w in stats["workers"]],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="추론 워커 프로세스 풀 확장성 벤치마크")
+    parser.add_argument("--backend", default="faster_whisper", choices=("faster_whisper", "synthetic"))
+    parser.add_argument("--model", default="tiny")
+    parser.add_argument("--device", default="cpu")
+    parser.add_argument("--compute-type", default="int8")
+    parser.add_argument("--max-workers", type=int, default=max((os.cpu_count() or 4) // 4, 1), help="최대 워커 수")
+    parser.add_argument("--threads-per-worker", type=int, default=4)
+    parser.add_argument("--requests", type=int, default=64, help="워커 수마다 처리할 요청 수")
+    parser.add_argument("--batch-size", type=int, default=1, help="요청당 윈도우 수 (1이면 transcribe, 2 이상이면 transcribe_batch)")
+    parser.add_argument("--window-seconds", type=float, default=15.0)
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    window = make_window(args.window_seconds)
+    params = {"language": "ko", "beam_size": 5, "word_timestamps": True, "vad_filter": False}
+    worker_counts: List[int] = sorted({1, *[n for n in (2, 4, 8, 16, 32) if n < args.max_workers], args.max_workers})
+
+    print(
+        f"백엔드: {args.backend}, 모델: {args.model}, 워커당 스레드: {args.threads_per_worker}, "
+        f"CPU: {os.cpu_count()}, 요청: {args.requests} x {args.batch_size} x {args.window_seconds:g}초"
+    )
+    print(f"{'워커':>4s} {'시작(초)':>9s} {'경과(초)':>9s} {'집계 RTF':>9s} {'배율':>6s} {'p50(ms)':>9s} {'p95(ms)':>9s}  워커별 요청 수")
+    results = []
+    for num_workers in worker_counts:
+        result = run(args, num_workers, window, params)
+        result["speedup"] = round(result["aggregate_rtf"] / results[0]["aggregate_rtf"], 2) if results else 1.0
+        results.append(result)
+        print(
+            f"{num_workers:4d} {result['startup_seconds']:9.2f} {result['elapsed_seconds']:9.3f} {result['aggregate_rtf']:9.2f} "
+            f"{result['speedup']:6.2f} {result['latency_ms']['p50']:9.1f} {result['latency_ms']['p95']:9.1f}  {result['requests_per_worker']}"
+        )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"args": vars(args), "results": results}, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+"""
+STT WebSocket 부하 생성기 및 지연 시간 벤치마크
+
+동시에 N개의 /api/v1/stt/stream WebSocket을 열고, 로컬 오디오 파일을 16kHz int16 프레임으로
+실시간(또는 --speed 배속)으로 전송한다. start_recording/stop_recording 명령을 보내고 다음 값을 보고한다.
+- 첫 결과 지연: 첫 프레임 전송부터 첫 partial_transcription/transcription 수신까지
+- 윈도우 종단 지연: 윈도우 마지막 프레임 전송부터 해당 transcription 수신까지
+  (서버 timing 블록의 audio_seconds로 윈도우 경계를 계산)
+- 서버 실시간 배율(RTF), overloaded(드롭)/error/timeout 수
+
+CPU 전용 환경에서는 tiny 모델로 서버를 띄워 오프라인 회귀 측정에 사용한다:
+    cd ai/stt-service
+    WHISPER_MODEL=tiny DEVICE=cpu COMPUTE_TYPE=int8 uvicorn app.main:app --port 8000
+
+실행:
+    python test/benchmark/loadgen_websocket.py --sessions 8 --wav sample1.wav sample2.wav
+    python test/benchmark/loadgen_websocket.py --sessions 32 --synthetic-seconds 60 --speed 4 --output result.json
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import sys
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+import msgpack
+import numpy as np
+import websockets
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from app.services.audio_decoder import decode_audio  # noqa: E402
+
+SAMPLE_RATE = 16000
+
+
+@dataclass
+class SessionResult:
+    """세션 하나의 측정 결과"""
+    connected: bool = False
+    first_result_latency: Optional[float] = None
+    window_latencies: List[float] = field(default_factory=list)
+    server_rtf: List[float] = field(default_factory=list)
+    message_counts: Counter = field(default_factory=Counter)
+    overloaded: int = 0
+    errors: int = 0
+    timed_out: bool = False
+    failure: Optional[str] = None
+
+
+def load_audio(paths: List[str], synthetic_seconds: float) -> List[np.ndarray]:
+    """오디오 파일을 16kHz int16 배열로 로드 (파일이 없으면 합성 오디오 생성)"""
+    clips = []
+    for path in paths:
+        with open(path, "rb") as f:
+            audio = decode_audio(f.read(), os.path.basename(path), SAMPLE_RATE)
+        clips.append((np.clip(audio, -1.0, 1.0) * 32767).astype(np.int16))
+    if not clips:
+        # 음절 길이(약 0.2초)로 진폭을 바꾸는 잡음 - 모델이 무음으로 건너뛰지 않도록 함
+        rng = np.random.default_rng(0)
+        n = int(synthetic_seconds * SAMPLE_RATE)
+        envelope = 0.5 + 0.5 * np.sin(2 * np.pi * 5 * np.arange(n) / SAMPLE_RATE)
+        clips.append((rng.standard_normal(n) * envelope * 3000).astype(np.int16))
+    return clips
+
+
+async def run_session(index: int, url: str, audio: np.ndarray, args: argparse.Namespace) -> SessionResult:
+    result = SessionResult()
+    frame_samples = int(SAMPLE_RATE * args.frame_ms / 1000)
+    frame_times: List[float] = []
+    stopped = asyncio.Event()
+    window_end_samples = 0
+
+    await asyncio.sleep(args.ramp * index / max(args.sessions, 1))
+    try:
+        websocket = await asyncio.wait_for(websockets.connect(url, max_size=None), timeout=args.timeout)
+    except Exception as e:
+        result.failure = f"{type(e).__name__}: {e}"
+        return result
+    result.connected = True
+
+    async def receive() -> None:
+        nonlocal window_end_samples
+        async for raw in websocket:
+            received_at = time.perf_counter()
+            message = msgpack.unpackb(raw, raw=False) if isinstance(raw, bytes) else json.loads(raw)
+            message_type = message.get("type")
+            result.message_counts[message_type] += 1
+
+            if message_type in ("partial_transcription", "transcription") and result.first_result_latency is None and frame_times:
+                result.first_result_latency = received_at - frame_times[0]
+
+            if message_type == "transcription" and message.get("timing"):
+                timing = message["timing"]
+                window_end_samples += int(round(timing["audio_seconds"] * SAMPLE_RATE))
+                last_frame = min(math.ceil(window_end_samples / frame_samples), len(frame_times)) - 1
+                if last_frame >= 0:
+                    result.window_latencies.append(received_at - frame_times[last_frame])
+                if timing.get("real_time_factor") is not None:
+                    result.server_rtf.append(timing["real_time_factor"])
+            elif message_type == "overloaded":
+                result.overloaded += 1
+            elif message_type == "error":
+                result.errors += 1
+            elif message_type == "recording_stopped":
+                stopped.set()
+
+    receiver = asyncio.create_task(receive())
+    try:
+        await websocket.send(json.dumps({"command": "start_recording"}))
+        started = time.perf_counter()
+        for i, offset in enumerate(range(0, len(audio), frame_samples)):
+            if args.speed > 0:
+                # 실시간(또는 배속) 페이싱: i번째 프레임은 시작 후 i * 프레임 길이 / 배속에 전송
+                delay = started + i * args.frame_ms / 1000 / args.speed - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            frame_times.append(time.perf_counter())
+            await websocket.send(audio[offset:offset + frame_samples].tobytes())
+
+        await websocket.send(json.dumps({"command": "stop_recording"}))
+        try:
+            await asyncio.wait_for(stopped.wait(), timeout=args.timeout)
+            # 늦게 도착하는 감정분석 후속 메시지를 잠시 더 수신
+            await asyncio.sleep(args.drain)
+        except asyncio.TimeoutError:
+            result.timed_out = True
+    except websockets.ConnectionClosed as e:
+        result.failure = f"연결 종료: {e}"
+    finally:
+        receiver.cancel()
+        await websocket.close()
+    return result
+
+
+def percentiles(values: List[float], scale: float = 1000.0) -> Dict[str, Optional[float]]:
+    if not values:
+        return {"count": 0, "p50": None, "p95": None, "p99": None, "max": None}
+    ordered = sorted(values)
+
+    def pct(p: float) -> float:
+        return round(ordered[min(int(len(ordered) * p), len(ordered) - 1)] * scale, 2)
+
+    return {"count": len(ordered), "p50": pct(0.5), "p95": pct(0.95), "p99": pct(0.99), "max": round(ordered[-1] * scale, 2)}
+
+
+def summarize(results: List[SessionResult], wall: float) -> Dict[str, Any]:
+    counts: Counter = Counter()
+    for r in results:
+        counts.update(r.message_counts)
+    return {
+        "sessions": len(results),
+        "connected": sum(r.connected for r in results),
+        "failed": [r.failure for r in results if r.failure],
+        "wall_seconds": round(wall, 2),
+        "first_result_latency_ms": percentiles([r.first_result_latency for r in results if r.first_result_latency is not None]),
+        "window_latency_ms": percentiles([v for r in results for v in r.window_latencies]),
+        "server_rtf": percentiles([v for r in results for v in r.server_rtf], scale=1.0),
+        "overloaded": sum(r.overloaded for r in results),
+        "errors": sum(r.errors for r in results),
+        "timeouts": sum(r.timed_out for r in results),
+        "messages": dict(counts),
+    }
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    clips = load_audio(args.wav, args.synthetic_seconds)
+    url = f"{args.url}?language={args.language}&scenario={args.scenario}&mode={args.mode}&timing=true&encoding={args.encoding}"
+    if args.fields:
+        # timing 블록은 윈도우 종단 지연 계산에 필요
+        url += f"&fields={args.fields},timing"
+    started = time.perf_counter()
+    results = await asyncio.gather(*(run_session(i, url, clips[i % len(clips)], args) for i in range(args.sessions)))
+    return summarize(list(results), time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="STT WebSocket 부하 생성기")
+    parser.add_argument("--url", default="ws://localhost:8000/api/v1/stt/stream")
+    parser.add_argument("--sessions", type=int, default=8, help="동시 WebSocket 세션 수")
+    parser.add_argument("--wav", nargs="*", default=[], help="전송할 오디오 파일 (세션마다 순환 배정)")
+    parser.add_argument("--synthetic-seconds", type=float, default=30.0, help="파일이 없을 때 합성 오디오 길이 (초)")
+    parser.add_argument("--speed", type=float, default=1.0, help="전송 배속 (1: 실시간, 0: 최대 속도)")
+    parser.add_argument("--frame-ms", type=int, default=20, help="프레임 길이 (ms)")
+    parser.add_argument("--ramp", type=float, default=1.0, help="세션 연결을 분산하는 시간 (초)")
+    parser.add_argument("--timeout", type=float, default=60.0, help="연결 및 stop_recording 응답 대기 시간 (초)")
+    parser.add_argument("--drain", type=float, default=0.5, help="recording_stopped 이후 후속 메시지 대기 시간 (초)")
+    parser.add_argument("--language", default="ko")
+    parser.add_argument("--scenario", default="presentation", choices=["dating", "interview", "presentation"])
+    parser.add_argument("--mode", default="batch", choices=["batch", "streaming"])
+    parser.add_argument("--encoding", default="json", choices=["json", "msgpack"], help="결과 메시지 인코딩")
+    parser.add_argument("--fields", help="결과 메시지에 포함할 그룹 (예: text,emotion, timing은 항상 포함)")
+    parser.add_argument("--output", help="요약 JSON 저장 경로")
+    args = parser.parse_args()
+
+    summary = asyncio.run(run(args))
+
+    print(f"세션 {summary['connected']}/{summary['sessions']} 연결, 소요 {summary['wall_seconds']}초 (배속 {args.speed}, 모드 {args.mode})")
+    for name, key in (("첫 결과 지연(ms)", "first_result_latency_ms"), ("윈도우 종단 지연(ms)", "window_latency_ms"), ("서버 RTF", "server_rtf")):
+        s = summary[key]
+        print(f"  {name:16s}: n={s['count']:5d}  p50={s['p50']}  p95={s['p95']}  p99={s['p99']}  max={s['max']}")
+    print(f"  overloaded: {summary['overloaded']}, error: {summary['errors']}, timeout: {summary['timeouts']}, 연결 실패: {len(summary['failed'])}")
+    print(f"  메시지: {summary['messages']}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(summary, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
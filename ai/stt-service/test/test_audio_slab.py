@@ -0,0 +1,160 @@
+"""
+연결 종료 시 공유 메모리 슬랩 반환 테스트
+
+synthetic 백엔드 워커 풀과 실제 STTWebSocketManager.handle_connection으로 여러 세션이 오디오를 보내는 중에
+절반의 세션은 클라이언트가 연결을 끊고, 나머지는 서버 종료처럼 연결 처리 코루틴이 취소된다.
+과부하 정책(drop_oldest, drop_newest, coalesce)마다 모든 윈도우 처리가 끝난 뒤 사용 중인 슬랩이 0개인지 확인한다.
+
+실행:
+    cd ai/stt-service
+    python -m pytest test/test_audio_slab.py
+"""
+import asyncio
+import os
+import sys
+import time
+
+import numpy as np
+import pytest
+from fastapi import WebSocketDisconnect
+from starlette.websockets import WebSocketState
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.core.config import settings  # noqa: E402
+from app.services import websocket_service  # noqa: E402
+from app.services.inference_scheduler import InferenceScheduler  # noqa: E402
+from app.services.worker_pool import InferenceWorkerPool  # noqa: E402
+
+SESSIONS = 12
+FRAME_SECONDS = 0.5
+FRAMES_BEFORE_DISCONNECT = 24  # 세션마다 윈도우 3개 분량
+
+
+def speech_frames() -> list:
+    """발화 3초 + 무음 1초를 반복하는 16-bit PCM 프레임 (발화 구간 검출이 발화마다 윈도우를 절단)"""
+    t = np.arange(4 * settings.SAMPLE_RATE) / settings.SAMPLE_RATE
+    voiced = sum(np.sin(2 * np.pi * 180 * k * t) / k for k in range(1, 6)) * (t < 3.0)
+    noise = np.random.default_rng(0).standard_normal(len(t))
+    pcm = ((0.1 * voiced + 0.001 * noise) * 32767).astype(np.int16)
+    frame_samples = int(FRAME_SECONDS * settings.SAMPLE_RATE)
+    return [pcm[i:i + frame_samples].tobytes() for i in range(0, len(pcm), frame_samples)]
+
+
+class FakeWebSocket:
+    """handle_connection이 사용하는 메서드만 가진 WebSocket (None을 받으면 클라이언트 연결 종료)"""
+
+    def __init__(self) -> None:
+        self.client_state = WebSocketState.CONNECTING
+        self.incoming: asyncio.Queue = asyncio.Queue()
+        self.sent = []
+
+    async def accept(self) -> None:
+        self.client_state = WebSocketState.CONNECTED
+
+    async def receive(self) -> dict:
+        message = await self.incoming.get()
+        if message is None:
+            self.client_state = WebSocketState.DISCONNECTED
+            raise WebSocketDisconnect(1000)
+        return message
+
+    async def send_text(self, message: str) -> None:
+        self.sent.append(message)
+
+    async def send_bytes(self, message: bytes) -> None:
+        self.sent.append(message)
+
+    async def close(self, code: int = 1000) -> None:
+        self.client_state = WebSocketState.DISCONNECTED
+
+
+@pytest.fixture(scope="module")
+def worker_pool():
+    """synthetic 백엔드 워커 풀 (워커 프로세스는 시작 시점의 환경 변수로 지연 시간을 읽음)"""
+    os.environ["SYNTHETIC_LATENCY_MS"] = "300"
+    os.environ["SYNTHETIC_LATENCY_PER_AUDIO_SECOND_MS"] = "0"
+    os.environ["SYNTHETIC_LATENCY_SIGMA"] = "0"
+    pool = InferenceWorkerPool(num_workers=2, backend="synthetic")
+    pool.start()
+    yield pool
+    pool.close()
+
+
+async def run_sessions(manager: websocket_service.STTWebSocketManager) -> None:
+    """세션마다 오디오 프레임을 보내다가 절반은 연결을 끊고 절반은 연결 처리 코루틴을 취소"""
+    frames = speech_frames()
+    websockets = [FakeWebSocket() for _ in range(SESSIONS)]
+    tasks = [
+        asyncio.create_task(manager.handle_connection(ws, language="ko", scenario="presentation"))
+        for ws in websockets
+    ]
+    for ws in websockets:
+        ws.incoming.put_nowait({"type": "websocket.receive", "text": '{"command": "start_recording"}'})
+
+    for index in range(FRAMES_BEFORE_DISCONNECT):
+        for ws in websockets:
+            ws.incoming.put_nowait({"type": "websocket.receive", "bytes": frames[index % len(frames)]})
+        await asyncio.sleep(0.02)
+
+    # 윈도우가 대기열이나 워커에 있는 동안 연결 종료
+    for ws in websockets[::2]:
+        ws.incoming.put_nowait(None)
+    for task in tasks[1::2]:
+        task.cancel()
+
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+@pytest.mark.parametrize("policy", ["drop_oldest", "drop_newest", "coalesce"])
+def test_slabs_released_after_disconnect(worker_pool, monkeypatch, policy):
+    async def no_emotion(audio_bytes, scenario, language):
+        return None
+
+    async def scenario() -> tuple:
+        scheduler = InferenceScheduler(
+            lambda: worker_pool,
+            max_batch_size=2,
+            max_wait_ms=10,
+            max_concurrent_batches=worker_pool.num_workers,
+            max_pending=4,
+            overload_policy=policy,
+            queue_timeout=1.0
+        )
+        monkeypatch.setattr(websocket_service, "inference_scheduler", scheduler)
+        monkeypatch.setattr(websocket_service, "call_emotion_analysis", no_emotion)
+        # 연결 종료 시 대기 중이던 요청 수 (실행 전에 취소되어 슬랩을 반환해야 하는 요청)
+        cancelled = []
+
+        def cancel_session(session_id: str) -> int:
+            count = InferenceScheduler.cancel_session(scheduler, session_id)
+            cancelled.append(count)
+            return count
+
+        monkeypatch.setattr(scheduler, "cancel_session", cancel_session)
+        manager = websocket_service.STTWebSocketManager()
+        try:
+            await run_sessions(manager)
+            # 연결 종료 뒤에도 남은 윈도우 처리 작업과 실행 중이던 배치가 끝나 슬랩을 반환할 때까지 대기
+            deadline = time.perf_counter() + 10
+            while time.perf_counter() < deadline:
+                running = asyncio.all_tasks() - {asyncio.current_task(), scheduler._dispatcher}
+                if not running and not worker_pool.slabs.in_use:
+                    break
+                await asyncio.sleep(0.05)
+            assert not manager.sessions
+            assert len(cancelled) == SESSIONS
+            return worker_pool.slabs.get_stats(), sum(cancelled)
+        finally:
+            await scheduler.shutdown()
+
+    monkeypatch.setattr(websocket_service.stt_processor, "model", worker_pool)
+    monkeypatch.setattr(websocket_service.stt_processor, "worker_pool", worker_pool)
+    monkeypatch.setattr(settings, "SILENCE_GATE_ENABLED", False)  # 모든 윈도우를 추론으로 보냄
+    before = worker_pool.slabs.get_stats()
+    stats, cancelled = asyncio.run(scenario())
+
+    assert cancelled > 0
+    assert stats["allocations"] > before["allocations"]
+    assert stats["in_use"] == 0
+    assert stats["allocations"] - before["allocations"] == stats["releases"] - before["releases"]